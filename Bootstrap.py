@@ -0,0 +1,208 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from constants import MAX_BLOCK_SIZE
+
+# Momentos por lote: tamaño, media y M2 de cada lote (ver MonteCarlo.get_batch_moments)
+Summaries = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class Bootstrap:
+    """
+    Intervalos de confianza para la media, la varianza del estimador y el ECM
+    de una estimación de Monte Carlo, a partir de los momentos (n, media, M2)
+    de lotes consecutivos de evaluaciones de g.
+
+    - bootstrap: remuestrea lotes con reposición. Cada bloque de
+      remuestras es una matriz de conteos (remuestras x lotes), así los
+      momentos de todas las remuestras salen de tres productos matriz-vector.
+      Con lotes de una muestra es el bootstrap clásico; con lotes más
+      grandes es un bootstrap por bloques, que además respeta correlaciones
+      seriales del generador dentro de cada lote.
+    - batch_means: intervalos t y chi-cuadrado sobre las medias de los lotes.
+
+    Los bloques de remuestras usan np.random.default_rng([seed, bloque]),
+    así el resultado no depende de Nworkers.
+    """
+
+    DEFAULT_RESAMPLES = 1000
+    DEFAULT_BATCHES = 1000
+
+    @staticmethod
+    def summaries(values: np.ndarray, Nbatches: Optional[int] = None) -> Summaries:
+        """
+        Momentos por lote de evaluaciones de g ya guardadas, con lotes
+        consecutivos cuyos tamaños difieren a lo sumo en 1 (como np.array_split).
+
+        Args:
+            values (np.ndarray): evaluaciones de g, en orden
+            Nbatches (Optional[int]): número de lotes. Por defecto, uno por valor.
+
+        Returns:
+            Summaries: tamaño, media y M2 de cada lote
+        """
+        values = np.asarray(values, dtype=np.float64)
+        Nbatches = len(values) if Nbatches is None else Nbatches
+        if not 1 <= Nbatches <= len(values):
+            raise ValueError("Nbatches debe estar entre 1 y la cantidad de valores")
+        size, extra = divmod(len(values), Nbatches)
+        split = extra * (size + 1)
+        counts, medias, m2s = [], [], []
+        for group, batch_size in ((values[:split], size + 1), (values[split:], size)):
+            if len(group) == 0:
+                continue
+            rows = group.reshape(-1, batch_size)
+            row_medias = rows.mean(axis=1)
+            counts.append(np.full(len(rows), batch_size, dtype=np.int64))
+            medias.append(row_medias)
+            m2s.append(np.sum((rows - row_medias[:, None]) ** 2, axis=1))
+        return np.concatenate(counts), np.concatenate(medias), np.concatenate(m2s)
+
+    @staticmethod
+    def point_stats(summaries: Summaries, exact: Optional[float] = None) -> Dict[str, float]:
+        """
+        Media, varianza del estimador y ECM (si se conoce el valor exacto) de
+        la muestra completa.
+        """
+        counts, medias, m2s = summaries
+        n = np.sum(counts)
+        mean = np.sum(counts * medias) / n
+        m2 = np.sum(m2s) + np.sum(counts * (medias - mean) ** 2)
+        variance = m2 / (n - 1) / n
+        results = {"mean": float(mean), "variance": float(variance)}
+        if exact is not None:
+            results["ECM"] = float(variance + (mean - exact) ** 2)
+        return results
+
+    @staticmethod
+    def _resample_blocks(summaries: Summaries, exact: Optional[float], seed: int,
+                         blocks: List[int], rows: int, Nresamples: int) -> np.ndarray:
+        """
+        Media, varianza del estimador y ECM de las remuestras de los bloques
+        dados (corre en un worker). Devuelve un arreglo (remuestras, 3).
+        """
+        counts, medias, m2s = summaries
+        Nbatches = len(counts)
+        # Centrar en la media global evita cancelaciones al combinar los M2
+        center = np.sum(counts * medias) / np.sum(counts)
+        deviations = medias - center
+        columns = np.stack([counts, counts * deviations, m2s + counts * deviations ** 2], axis=1)
+
+        stats = []
+        for block in blocks:
+            r = min(rows, Nresamples - block * rows)
+            generator = np.random.default_rng([seed, block])
+            picks = generator.integers(0, Nbatches, size=(r, Nbatches))
+            picks += np.arange(r)[:, None] * Nbatches
+            weights = np.bincount(picks.ravel(), minlength=r * Nbatches).reshape(r, Nbatches)
+            n, s1, s2 = (weights @ columns).T
+            mean = center + s1 / n
+            variance = (s2 - s1 ** 2 / n) / (n - 1) / n
+            ecm = variance + (mean - exact) ** 2 if exact is not None else np.full(r, np.nan)
+            stats.append(np.stack([mean, variance, ecm], axis=1))
+        return np.concatenate(stats)
+
+    @staticmethod
+    def resample(summaries: Summaries, Nresamples: int = DEFAULT_RESAMPLES,
+                 seed: int = 0, exact: Optional[float] = None,
+                 Nworkers: int = 1, max_block: int = MAX_BLOCK_SIZE) -> Dict[str, np.ndarray]:
+        """
+        Distribución bootstrap de la media, la varianza del estimador y el ECM.
+
+        Args:
+            summaries (Summaries): momentos por lote
+            Nresamples (int): cantidad de remuestras
+            seed (int): seed del remuestreo
+            exact (Optional[float]): valor exacto de la integral, para el ECM
+            Nworkers (int): procesos del pool. Con 1 corre en este proceso.
+            max_block (int): máximo de conteos (remuestras x lotes) por bloque
+
+        Returns:
+            Dict[str, np.ndarray]: valores de cada remuestra por estadístico
+            ("mean", "variance", "ECM"; este último NaN sin valor exacto)
+        """
+        summaries = tuple(np.asarray(column) for column in summaries)
+        rows = max(1, max_block // len(summaries[0]))
+        blocks = list(range(-(-Nresamples // rows)))
+        args = (summaries, exact, seed)
+
+        if Nworkers == 1:
+            stats = Bootstrap._resample_blocks(*args, blocks, rows, Nresamples)
+        else:
+            # Un grupo de bloques por worker: los lotes se serializan una vez por worker
+            groups = [blocks[i::Nworkers] for i in range(Nworkers) if blocks[i::Nworkers]]
+            with ProcessPoolExecutor(Nworkers) as pool:
+                parts = list(pool.map(Bootstrap._resample_blocks,
+                                      *[[arg] * len(groups) for arg in args], groups,
+                                      [rows] * len(groups), [Nresamples] * len(groups)))
+            # Volver al orden de los bloques
+            order = np.concatenate([np.repeat(group, [min(rows, Nresamples - b * rows) for b in group])
+                                    for group in groups])
+            stats = np.concatenate(parts)[np.argsort(order, kind="stable")]
+        return {"mean": stats[:, 0], "variance": stats[:, 1], "ECM": stats[:, 2]}
+
+    @staticmethod
+    def confidence_intervals(summaries: Summaries, alpha: float = 0.05,
+                             Nresamples: int = DEFAULT_RESAMPLES, seed: int = 0,
+                             exact: Optional[float] = None, Nworkers: int = 1,
+                             max_block: int = MAX_BLOCK_SIZE) -> Dict[str, object]:
+        """
+        Estadísticos de la muestra completa con intervalos bootstrap de
+        percentiles de nivel 1 - alpha (ver resample para los argumentos).
+
+        El intervalo del ECM no sale de los percentiles del ECM remuestreado:
+        en cada remuestra (media* - exacto)^2 suma la dispersión bootstrap de
+        la media al sesgo y el intervalo queda corrido hacia arriba. Se arma
+        con los de la media y la varianza, ECM = varianza + sesgo^2: el sesgo^2
+        va de 0 (si el intervalo del sesgo contiene al 0) o del menor cuadrado
+        de sus extremos, al mayor.
+
+        Returns:
+            Dict[str, object]: "mean", "variance", "ECM" (si se conoce el
+            valor exacto) y sus intervalos "mean_CI", "variance_CI", "ECM_CI"
+        """
+        results = Bootstrap.point_stats(summaries, exact)
+        distribution = Bootstrap.resample(summaries, Nresamples, seed, exact,
+                                          Nworkers=Nworkers, max_block=max_block)
+        for name in ("mean", "variance"):
+            low, high = np.quantile(distribution[name], [alpha / 2, 1 - alpha / 2])
+            results[f"{name}_CI"] = (float(low), float(high))
+
+        if exact is not None:
+            bias_low, bias_high = (bound - exact for bound in results["mean_CI"])
+            squares = (bias_low ** 2, bias_high ** 2)
+            bias2_low = 0.0 if bias_low <= 0 <= bias_high else min(squares)
+            variance_low, variance_high = results["variance_CI"]
+            results["ECM_CI"] = (variance_low + bias2_low, variance_high + max(squares))
+        return results
+
+    @staticmethod
+    def batch_means(summaries: Summaries, alpha: float = 0.05) -> Dict[str, object]:
+        """
+        Intervalos de batch means: t de Student para la media sobre las medias
+        de los lotes y chi-cuadrado para la varianza del estimador. Suponen
+        lotes aproximadamente independientes y de igual tamaño.
+
+        Returns:
+            Dict[str, object]: "mean" y "variance" (varianza del estimador
+            estimada con las medias de los lotes) y sus intervalos "mean_CI"
+            y "variance_CI"
+        """
+        # Import diferido: scipy solo se carga al usarse
+        from scipy.stats import chi2, t
+
+        _, medias, _ = summaries
+        Nbatches = len(medias)
+        if Nbatches < 2:
+            raise ValueError("Se necesitan al menos 2 lotes")
+        mean = float(np.mean(medias))
+        variance = float(np.var(medias, ddof=1) / Nbatches)
+        dof = Nbatches - 1
+        radius = float(t.ppf(1 - alpha / 2, dof) * np.sqrt(variance))
+        return {
+            "mean": mean,
+            "variance": variance,
+            "mean_CI": (mean - radius, mean + radius),
+            "variance_CI": (float(dof * variance / chi2.ppf(1 - alpha / 2, dof)),
+                            float(dof * variance / chi2.ppf(alpha / 2, dof))),
+        }
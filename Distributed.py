@@ -0,0 +1,355 @@
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+from queue import Empty, Queue
+from typing import Callable, Dict, List, Optional, Tuple
+from MonteCarlo import MonteCarlo
+from Integrands import Integrands
+from constants import MAX_BLOCK_SIZE
+from rngs.GeneratorPool import GeneratorPool
+from rngs.Registry import Registry
+from rngs.SeedSequence import SeedSequence
+
+
+class Distributed:
+    """
+    Monte Carlo distribuido en modo coordinador/workers.
+
+    Una tarea es un diccionario JSON que describe por completo un pedazo del
+    estudio: generador (por nombre, ver Registry.RNGS), subsecuencia, rango de
+    muestras, integrando (por nombre, ver Integrands), dimensión y precisión.
+    Un worker la ejecuta y devuelve los momentos parciales (n, media, M2),
+    que el coordinador combina con MonteCarlo.merge_moments en el orden de
+    las tareas. Como cada tarea determina su resultado y el orden de
+    combinación es fijo, una tarea que falla se puede reintentar en otro
+    worker y el resultado es idéntico al de correr las mismas tareas en un
+    solo proceso (run_local).
+
+    Subsecuencias ("substream" de la tarea):
+
+    - {"seed": s}: la secuencia de la seed s; la tarea saltea "start"
+      muestras con RNG.advance.
+    - {"entropy": e, "spawn_key": [...]}: el generador de
+      SeedSequence(e, spawn_key); make_tasks usa una por tarea, así ningún
+      worker tiene que saltear salidas.
+
+    Los mensajes son líneas JSON (nunca pickle), así un worker solo puede
+    ejecutar generadores e integrandos registrados. Los workers escuchan en
+    "tcp://host:puerto" o "unix:///ruta/al/socket":
+
+        python Distributed.py --listen tcp://0.0.0.0:5000
+    """
+
+    # Muestras por tarea en make_tasks
+    DEFAULT_CHUNK = 2 ** 18
+    # Reintentos de cada tarea antes de abandonar el estudio
+    MAX_RETRIES = 3
+
+    @staticmethod
+    def make_tasks(rng_name: str, seed: int, Nsamples: int, d: int,
+                   integrand: str = "gaussian_hipercube",
+                   chunk: int = DEFAULT_CHUNK,
+                   precision: str = "float64") -> List[Dict]:
+        """
+        Parte un estudio de Nsamples muestras en tareas de a lo sumo chunk
+        muestras. La tarea k usa la subsecuencia SeedSequence(seed, (k,)).
+
+        Args:
+            rng_name (str): nombre del generador en Registry.RNGS
+            seed (int): seed del estudio (entropía de la SeedSequence)
+            Nsamples (int): muestras del estudio
+            d (int): dimensión del hipercubo
+            integrand (str): nombre del integrando en Integrands
+            chunk (int): muestras por tarea
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            List[Dict]: tareas, en el orden en que se combinan sus momentos
+        """
+        return [{
+            "rng": rng_name,
+            "substream": {"entropy": seed, "spawn_key": [k]},
+            "start": 0,
+            "count": min(chunk, Nsamples - offset),
+            "integrand": integrand,
+            "d": d,
+            "precision": precision,
+        } for k, offset in enumerate(range(0, Nsamples, chunk))]
+
+    @staticmethod
+    def execute(task: Dict) -> Dict:
+        """
+        Ejecuta una tarea (del lado del worker).
+
+        Returns:
+            Dict: momentos parciales {"n", "mean", "m2"}
+        """
+        rng_class = Registry.get(task["rng"])
+        substream = task["substream"]
+        if "seed" in substream:
+            rng = GeneratorPool.get(rng_class, substream["seed"])
+        else:
+            rng = SeedSequence(substream["entropy"],
+                               tuple(substream["spawn_key"])).make_rng(rng_class)
+        precision = task.get("precision", "float64")
+        draws_per_uniform = 2 if precision == "res53" and rng.OUTPUT_BITS < 53 else 1
+        rng.advance(task["start"] * task["d"] * draws_per_uniform)
+
+        n, mean, m2 = MonteCarlo.get_moments_blocks(
+                            task["count"], Integrands.get(task["integrand"]).kernel,
+                            rng, task["d"],
+                            max_block=task.get("max_block", MAX_BLOCK_SIZE),
+                            precision=precision)
+        return {"n": n, "mean": mean, "m2": m2}
+
+    @staticmethod
+    def merge(results: List[Dict]) -> Tuple[int, float, float]:
+        """
+        Combina momentos parciales en orden.
+
+        Returns:
+            Tuple[int, float, float]: cantidad de muestras, media y M2
+        """
+        moments = (0, 0.0, 0.0)
+        for result in results:
+            moments = MonteCarlo.merge_moments(moments, (result["n"], result["mean"], result["m2"]))
+        return moments
+
+    @staticmethod
+    def run_local(tasks: List[Dict]) -> List[Dict]:
+        """
+        Ejecuta las tareas en este proceso: es la corrida de referencia de un
+        solo nodo.
+        """
+        return [Distributed.execute(task) for task in tasks]
+
+    @staticmethod
+    def stats(moments: Tuple[int, float, float], exact: Optional[float] = None) -> Dict[str, float]:
+        """
+        Varianza del estimador, media y ECM (si se conoce el valor exacto) a
+        partir de los momentos combinados, como Utils.rng_muestral_stats_estimation_hipercube.
+        """
+        n, mean, m2 = moments
+        variance = (m2 / (n - 1) if n > 1 else 0.0) / n
+        results = {"variance": variance, "mean": mean}
+        if exact is not None:
+            results["ECM"] = variance + (mean - exact) ** 2
+        return results
+
+    @staticmethod
+    def parse_address(address: str) -> Tuple[int, object]:
+        """
+        Familia de socket y dirección de "tcp://host:puerto" o "unix:///ruta".
+        """
+        if address.startswith("unix://"):
+            return socket.AF_UNIX, address[len("unix://"):]
+        if address.startswith("tcp://"):
+            host, port = address[len("tcp://"):].rsplit(":", 1)
+            return socket.AF_INET, (host, int(port))
+        raise ValueError(f"Dirección desconocida: {address}. Usar tcp://host:puerto o unix:///ruta")
+
+    @staticmethod
+    def serve(address: str, ready: Optional[Callable[[str], None]] = None,
+              execute: Optional[Callable[[Dict], Dict]] = None) -> None:
+        """
+        Corre un worker que atiende tareas en address hasta que lo terminen.
+
+        Args:
+            address (str): "tcp://host:puerto" (puerto 0 elige uno libre) o "unix:///ruta"
+            ready (Optional[Callable[[str], None]]): se llama con la dirección
+            real una vez que el worker escucha.
+            execute (Optional[Callable[[Dict], Dict]]): ejecuta cada tarea.
+            Por defecto, Distributed.execute.
+        """
+        family, bind = Distributed.parse_address(address)
+        execute = execute or Distributed.execute
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        reply = {"result": execute(json.loads(line))}
+                    except Exception as e:
+                        reply = {"error": f"{type(e).__name__}: {e}"}
+                    self.wfile.write((json.dumps(reply) + "\n").encode())
+                    self.wfile.flush()
+
+        if family == socket.AF_UNIX:
+            server = socketserver.ThreadingUnixStreamServer(bind, Handler)
+            real_address = address
+        else:
+            server = socketserver.ThreadingTCPServer(bind, Handler)
+            host, port = server.server_address[:2]
+            real_address = f"tcp://{host}:{port}"
+        server.daemon_threads = True
+        with server:
+            if ready is not None:
+                ready(real_address)
+            server.serve_forever()
+
+    @staticmethod
+    def spawn_workers(Nworkers: int, transport: str = "tcp",
+                      commands: Optional[List[List[str]]] = None
+                      ) -> List[Tuple[str, subprocess.Popen]]:
+        """
+        Levanta Nworkers workers locales, cada uno en su propio proceso, para
+        probar el modo distribuido en una sola máquina.
+
+        Args:
+            Nworkers (int): cantidad de workers
+            transport (str): "tcp" (en 127.0.0.1) o "unix"
+            commands (Optional[List[List[str]]]): comando de cada worker, sin
+            "--listen" (que se agrega). Debe imprimir "LISTENING <dirección>"
+            al escuchar. Por defecto, este módulo.
+
+        Returns:
+            List[Tuple[str, subprocess.Popen]]: dirección y proceso de cada worker
+        """
+        root = os.path.dirname(os.path.abspath(__file__))
+        commands = commands or [[sys.executable, os.path.join(root, "Distributed.py")]] * Nworkers
+        socket_dir = tempfile.mkdtemp() if transport == "unix" else None
+        workers = []
+        for i in range(Nworkers):
+            if transport == "unix":
+                address = f"unix://{os.path.join(socket_dir, f'worker{i}.sock')}"
+            else:
+                address = "tcp://127.0.0.1:0"
+            command = commands[i] + ["--listen", address]
+            process = subprocess.Popen(command, cwd=root, stdout=subprocess.PIPE, text=True)
+            # El worker avisa por stdout la dirección en la que escucha
+            workers.append((process.stdout.readline().split()[-1], process))
+        return workers
+
+    @staticmethod
+    def stop_workers(workers: List[Tuple[str, subprocess.Popen]]) -> None:
+        """
+        Termina los workers levantados con spawn_workers.
+        """
+        for address, process in workers:
+            process.terminate()
+            process.wait()
+            family, path = Distributed.parse_address(address)
+            if family == socket.AF_UNIX and os.path.exists(path):
+                os.remove(path)
+
+
+class Coordinator:
+    """
+    Reparte tareas entre workers remotos y junta sus momentos parciales.
+    Cada worker tiene un hilo que le manda una tarea por vez. Si la conexión
+    se corta o vence el timeout, la tarea vuelve a la cola (la toma otro
+    worker) y ese worker se descarta; si el worker responde con un error, la
+    tarea se reintenta. Una tarea que falla más de max_retries veces aborta
+    la corrida.
+    """
+
+    def __init__(self, addresses: List[str], timeout: float = 600.0,
+                 max_retries: int = Distributed.MAX_RETRIES):
+        self.addresses = list(addresses)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retries = 0
+
+    def _connect(self, address: str) -> socket.socket:
+        family, target = Distributed.parse_address(address)
+        connection = socket.socket(family, socket.SOCK_STREAM)
+        connection.settimeout(self.timeout)
+        connection.connect(target)
+        return connection
+
+    def run(self, tasks: List[Dict]) -> List[Dict]:
+        """
+        Ejecuta las tareas en los workers.
+
+        Args:
+            tasks (List[Dict]): tareas (ver Distributed.make_tasks)
+
+        Raises:
+            Exception: Si una tarea agota sus reintentos o no quedan workers
+
+        Returns:
+            List[Dict]: momentos parciales, en el orden de las tareas
+        """
+        results: List[Optional[Dict]] = [None] * len(tasks)
+        failures = {}
+        pending = Queue()
+        for index in range(len(tasks)):
+            pending.put((index, 0))
+        remaining = [len(tasks)]
+        lock = threading.Lock()
+        done = threading.Event()
+        if not tasks:
+            done.set()
+
+        def finish(index: int, result: Optional[Dict], error: Optional[str] = None) -> None:
+            with lock:
+                if error is not None:
+                    failures[index] = error
+                else:
+                    results[index] = result
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    done.set()
+
+        def retry(index: int, attempts: int, error: str) -> None:
+            with lock:
+                self.retries += 1
+            if attempts + 1 > self.max_retries:
+                finish(index, None, error)
+            else:
+                pending.put((index, attempts + 1))
+
+        def work(address: str) -> None:
+            try:
+                connection = self._connect(address)
+            except OSError:
+                return
+            with connection, connection.makefile("rwb") as stream:
+                while not done.is_set():
+                    try:
+                        index, attempts = pending.get(timeout=0.05)
+                    except Empty:
+                        continue
+                    try:
+                        stream.write((json.dumps(tasks[index]) + "\n").encode())
+                        stream.flush()
+                        line = stream.readline()
+                        if not line:
+                            raise ConnectionError("el worker cerró la conexión")
+                        reply = json.loads(line)
+                    except (OSError, ValueError) as e:
+                        # Worker caído: la tarea vuelve a la cola y el worker se descarta
+                        retry(index, attempts, f"{address}: {e}")
+                        return
+                    if "error" in reply:
+                        retry(index, attempts, f"{address}: {reply['error']}")
+                    else:
+                        finish(index, reply["result"])
+
+        threads = [threading.Thread(target=work, args=(address,), daemon=True)
+                   for address in self.addresses]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if failures:
+            index, error = min(failures.items())
+            raise Exception(f"Error: la tarea {index} falló {self.max_retries + 1} veces ({error})")
+        if not done.is_set():
+            raise Exception("Error: no quedan workers disponibles para terminar las tareas")
+        return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Worker de Monte Carlo distribuido")
+    parser.add_argument("--listen", required=True, help="tcp://host:puerto o unix:///ruta")
+    args = parser.parse_args()
+    Distributed.serve(args.listen, ready=lambda address: print(f"LISTENING {address}", flush=True))
@@ -0,0 +1,193 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from math import floor, log2
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class _NullProbe:
+    """
+    Sonda que no hace nada: es la que se usa cuando no hay instrumentación
+    activa, así el costo es una llamada vacía por bloque.
+    """
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def done(self) -> None:
+        pass
+
+
+NULL_PROBE = _NullProbe()
+
+
+class ChunkProbe:
+    """
+    Mide las fases de un bloque del método de Monte Carlo. mark(phase)
+    acumula en phase el tiempo desde la marca anterior.
+    """
+
+    def __init__(self, recorder: "Recorder", rng_name: str, Nsamples: int):
+        self._recorder = recorder
+        self._rng_name = rng_name
+        self._Nsamples = Nsamples
+        self._phases = {}
+        self._start = self._last = perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = perf_counter()
+        self._phases[phase] = self._phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def done(self) -> None:
+        self._recorder.record_chunk(self._rng_name, self._Nsamples, self._phases,
+                                    self._last - self._start)
+
+
+class Recorder:
+    """
+    Acumula las métricas de una corrida instrumentada: uniformes consumidas
+    por generador, tiempo por fase (generación, evaluación de g,
+    acumulación), histograma de latencias por bloque y cantidad de bloques.
+    """
+
+    def __init__(self, callbacks: Optional[List[Callable[[Dict], None]]] = None):
+        self.draws = {}
+        self.phases = {}
+        self.latency_histogram = {}
+        self.chunks = 0
+        self.samples = 0
+        self._callbacks = list(callbacks or [])
+
+    def add_draws(self, rng_name: str, count: int) -> None:
+        """
+        Suma count salidas consumidas del generador rng_name.
+        """
+        self.draws[rng_name] = self.draws.get(rng_name, 0) + count
+
+    def record_chunk(self, rng_name: str, Nsamples: int,
+                     phases: Dict[str, float], latency: float) -> None:
+        """
+        Registra un bloque terminado y avisa a los callbacks.
+
+        Args:
+            rng_name (str): nombre del generador usado
+            Nsamples (int): muestras de Monte Carlo del bloque
+            phases (Dict[str, float]): segundos por fase
+            latency (float): duración total del bloque en segundos
+        """
+        self.chunks += 1
+        self.samples += Nsamples
+        for phase, seconds in phases.items():
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        # Buckets por potencias de 2 en microsegundos
+        bucket = floor(log2(max(latency * 1e6, 1.0)))
+        self.latency_histogram[bucket] = self.latency_histogram.get(bucket, 0) + 1
+
+        if self._callbacks:
+            event = {"rng": rng_name, "samples": Nsamples,
+                     "phases": dict(phases), "latency": latency}
+            for callback in self._callbacks:
+                callback(event)
+
+    def to_dict(self) -> Dict:
+        """
+        Métricas en un diccionario serializable.
+        """
+        histogram = {f"<{2 ** (bucket + 1)}us": count
+                     for bucket, count in sorted(self.latency_histogram.items())}
+        return {
+            "draws": dict(self.draws),
+            "phases": dict(self.phases),
+            "chunks": self.chunks,
+            "samples": self.samples,
+            "chunk_latency_histogram": histogram,
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Exporta las métricas como JSON.
+
+        Args:
+            path (str, optional): si se da, además se escribe en ese archivo
+
+        Returns:
+            str: las métricas en JSON
+        """
+        content = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(content)
+        return content
+
+
+class Instrumentation:
+    """
+    Instrumentación opcional de MonteCarlo y de los RNG. Está desactivada por
+    defecto: los puntos de medición solo consultan Instrumentation.current()
+    una vez por bloque. Se activa con el context manager record:
+
+        with Instrumentation.record() as recorder:
+            Utils.rng_replicated_stats_estimation_hipercube(...)
+        recorder.to_json("metricas.json")
+
+    El recorder activo vive en una ContextVar: cada hilo (y cada tarea de
+    asyncio) ve el suyo, así dos grabaciones simultáneas no se pisan. Un hilo
+    nuevo arranca sin recorder; para que cuente en la grabación de quien lo
+    crea hay que correrlo en una copia del contexto (como BlockPipeline).
+
+    Se cuentan las salidas pedidas con RNG.uniform_block y las de los
+    métodos escalares de MonteCarlo. Las que se piden directamente con
+    next, next_block o rand01_block no se cuentan.
+    """
+
+    _current: ContextVar[Optional[Recorder]] = ContextVar("instrumentation_recorder", default=None)
+
+    @staticmethod
+    def current() -> Optional[Recorder]:
+        """
+        Recorder activo en este contexto, o None si no hay instrumentación.
+        """
+        return Instrumentation._current.get()
+
+    @staticmethod
+    @contextmanager
+    def record(callbacks: Optional[List[Callable[[Dict], None]]] = None) -> Iterator[Recorder]:
+        """
+        Activa la instrumentación dentro del bloque with. Se puede anidar:
+        al salir vuelve a quedar activo el recorder anterior.
+
+        Args:
+            callbacks (List[Callable[[Dict], None]], optional): funciones que
+            reciben un evento (diccionario) por cada bloque terminado.
+
+        Returns:
+            Iterator[Recorder]: el recorder con las métricas de la corrida
+        """
+        recorder = Recorder(callbacks)
+        token = Instrumentation._current.set(recorder)
+        try:
+            yield recorder
+        finally:
+            Instrumentation._current.reset(token)
+
+    @staticmethod
+    def count_draws(rng, count: int) -> None:
+        """
+        Suma count salidas consumidas de rng, si hay instrumentación activa.
+        """
+        recorder = Instrumentation._current.get()
+        if recorder is not None:
+            recorder.add_draws(rng.name(), count)
+
+    @staticmethod
+    def chunk_probe(rng, Nsamples: int):
+        """
+        Sonda para medir las fases de un bloque de Nsamples muestras hecho con
+        rng. Sin instrumentación activa devuelve una sonda que no hace nada.
+        """
+        recorder = Instrumentation._current.get()
+        if recorder is None:
+            return NULL_PROBE
+        return ChunkProbe(recorder, rng.name(), Nsamples)
@@ -0,0 +1,317 @@
+from fractions import Fraction
+from math import comb, erf, exp, factorial, pi, sqrt
+from typing import Callable, Dict, List, Optional, Union
+import numpy as np
+from MonteCarlo import MonteCarlo
+from Utils import Utils
+from constants import MAX_BLOCK_SIZE
+from rngs.RNG import RNG
+
+
+class Integrand:
+    """
+    Integrando de prueba en el hipercubo [0, 1]^d.
+
+    - kernel: función vectorizada sobre el último eje (un punto por fila),
+      que se evalúa de a bloques, sin llamadas por muestra.
+    - exact: valor exacto de la integral en función de d, si se conoce.
+    - log_kernel: logaritmo del kernel, para el camino en espacio
+      logarítmico (MonteCarlo.log_method_blocks) en dimensiones altas.
+
+    Pistas para el motor de estimación (ver Integrands.estimate):
+
+    - separable: el kernel es un producto de factores de una variable, así
+      que el producto puede salir del rango de float64 cuando d crece. Con
+      log_kernel, desde Integrands.LOG_SPACE_DIMENSION se estima en espacio
+      logarítmico.
+    - monotone: el kernel es monótono en cada variable; las variables
+      antitéticas reducen la varianza, así que se usan por defecto (con
+      bloques de la mitad de tamaño, porque cada uno se evalúa dos veces).
+    - bounded: el kernel está acotado en el hipercubo. Si no lo está (tiene
+      una singularidad en el borde), por defecto se generan uniformes
+      "res53", que se acercan al borde con 53 bits en lugar de 32.
+    """
+
+    def __init__(self, name: str,
+                 kernel: Callable[[np.ndarray], np.ndarray],
+                 exact: Optional[Callable[[int], Optional[float]]] = None,
+                 log_kernel: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 separable: bool = False,
+                 monotone: bool = False,
+                 bounded: bool = True):
+        self.name = name
+        self.kernel = kernel
+        self.log_kernel = log_kernel
+        self.separable = separable
+        self.monotone = monotone
+        self.bounded = bounded
+        self._exact = exact
+
+    def exact_value(self, d: int) -> Optional[float]:
+        """
+        Valor exacto de la integral en [0, 1]^d, o None si no se conoce.
+        """
+        return self._exact(d) if self._exact is not None else None
+
+    def default_precision(self) -> str:
+        """
+        Precisión de las uniformes que usa el motor si no se pide otra.
+        """
+        return "float64" if self.bounded else "res53"
+
+    def __call__(self, Xs: np.ndarray) -> np.ndarray:
+        return self.kernel(Xs)
+
+    def __repr__(self) -> str:
+        hints = [hint for hint in ("separable", "monotone", "bounded") if getattr(self, hint)]
+        return f"Integrand({self.name!r}, {', '.join(hints)})"
+
+
+class Genz:
+    """
+    Familia de integrandos de prueba de Genz (oscillatory, product peak,
+    corner peak, gaussian, continuous, discontinuous), en su versión
+    isótropa: todos los coeficientes valen a = DIFFICULTY / d y todos los
+    desplazamientos valen SHIFT, así los valores exactos tienen forma cerrada
+    para cualquier d.
+    """
+
+    # Dificultad (suma de los coeficientes a_i) por familia, de Genz (1987)
+    DIFFICULTY = {
+        "oscillatory": 9.0,
+        "product_peak": 7.25,
+        "corner_peak": 1.85,
+        "gaussian": 7.03,
+        "continuous": 20.4,
+        "discontinuous": 4.3,
+    }
+    # Desplazamiento u_i de todas las familias
+    SHIFT = 0.5
+
+    @staticmethod
+    def _a(family: str, d: int) -> float:
+        return Genz.DIFFICULTY[family] / d
+
+    @staticmethod
+    def oscillatory(Xs: np.ndarray) -> np.ndarray:
+        a = Genz._a("oscillatory", Xs.shape[-1])
+        return np.cos(2 * pi * Genz.SHIFT + a * np.sum(Xs, axis=-1))
+
+    @staticmethod
+    def oscillatory_exact(d: int) -> float:
+        a = Genz._a("oscillatory", d)
+        factor = (np.exp(1j * a) - 1) / (1j * a)
+        return float((np.exp(2j * pi * Genz.SHIFT) * factor ** d).real)
+
+    @staticmethod
+    def product_peak(Xs: np.ndarray) -> np.ndarray:
+        return np.exp(Genz.product_peak_log(Xs))
+
+    @staticmethod
+    def product_peak_log(Xs: np.ndarray) -> np.ndarray:
+        a = Genz._a("product_peak", Xs.shape[-1])
+        return -np.sum(np.log(a ** -2 + (Xs - Genz.SHIFT) ** 2), axis=-1)
+
+    @staticmethod
+    def product_peak_exact(d: int) -> float:
+        a, u = Genz._a("product_peak", d), Genz.SHIFT
+        return float((a * (np.arctan(a * (1 - u)) + np.arctan(a * u))) ** d)
+
+    @staticmethod
+    def corner_peak(Xs: np.ndarray) -> np.ndarray:
+        d = Xs.shape[-1]
+        a = Genz._a("corner_peak", d)
+        return (1 + a * np.sum(Xs, axis=-1)) ** -(d + 1)
+
+    @staticmethod
+    def corner_peak_exact(d: int) -> float:
+        # Inclusión-exclusión sobre los vértices, en racionales porque los
+        # términos se cancelan
+        a = Fraction(Genz._a("corner_peak", d))
+        total = sum(Fraction((-1) ** k * comb(d, k)) / (1 + k * a) for k in range(d + 1))
+        return float(total / (factorial(d) * a ** d))
+
+    @staticmethod
+    def gaussian(Xs: np.ndarray) -> np.ndarray:
+        return np.exp(Genz.gaussian_log(Xs))
+
+    @staticmethod
+    def gaussian_log(Xs: np.ndarray) -> np.ndarray:
+        a = Genz._a("gaussian", Xs.shape[-1])
+        return -a ** 2 * np.sum((Xs - Genz.SHIFT) ** 2, axis=-1)
+
+    @staticmethod
+    def gaussian_exact(d: int) -> float:
+        a, u = Genz._a("gaussian", d), Genz.SHIFT
+        return (sqrt(pi) / (2 * a) * (erf(a * (1 - u)) + erf(a * u))) ** d
+
+    @staticmethod
+    def continuous(Xs: np.ndarray) -> np.ndarray:
+        return np.exp(Genz.continuous_log(Xs))
+
+    @staticmethod
+    def continuous_log(Xs: np.ndarray) -> np.ndarray:
+        a = Genz._a("continuous", Xs.shape[-1])
+        return -a * np.sum(np.abs(Xs - Genz.SHIFT), axis=-1)
+
+    @staticmethod
+    def continuous_exact(d: int) -> float:
+        a, u = Genz._a("continuous", d), Genz.SHIFT
+        return ((2 - exp(-a * u) - exp(-a * (1 - u))) / a) ** d
+
+    @staticmethod
+    def discontinuous(Xs: np.ndarray) -> np.ndarray:
+        a = Genz._a("discontinuous", Xs.shape[-1])
+        inside = np.all(Xs[..., :2] <= Genz.SHIFT, axis=-1)
+        return np.where(inside, np.exp(a * np.sum(Xs, axis=-1)), 0.0)
+
+    @staticmethod
+    def discontinuous_exact(d: int) -> float:
+        # Las dos primeras variables se cortan en SHIFT, el resto en 1
+        a = Genz._a("discontinuous", d)
+        cut = min(d, 2)
+        return ((exp(a * Genz.SHIFT) - 1) / a) ** cut * ((exp(a) - 1) / a) ** (d - cut)
+
+
+class Integrands:
+    """
+    Registro de integrandos de prueba. Cada entrada es un Integrand con su
+    kernel vectorizado, su valor exacto (si se conoce) y sus pistas; el
+    motor (Integrands.estimate) elige con ellas el estimador y el tamaño de
+    los bloques. Compare.integrand_sweep recorre el registro.
+    """
+
+    REGISTRY: Dict[str, Integrand] = {}
+    # Dimensión desde la que los integrandos separables con log_kernel se
+    # estiman en espacio logarítmico: un producto de d factores de orden
+    # 2^±4 ya puede salir del rango de float64 (2^±1022)
+    LOG_SPACE_DIMENSION = 256
+
+    @staticmethod
+    def register(integrand: Integrand) -> Integrand:
+        """
+        Agrega (o reemplaza) un integrando en el registro.
+
+        Args:
+            integrand (Integrand): integrando a registrar
+
+        Returns:
+            Integrand: el mismo integrando
+        """
+        Integrands.REGISTRY[integrand.name] = integrand
+        return integrand
+
+    @staticmethod
+    def get(integrand: Union[str, Integrand]) -> Integrand:
+        """
+        Busca un integrando por nombre (si ya es un Integrand, lo devuelve).
+
+        Raises:
+            ValueError: Si el nombre no está registrado
+        """
+        if isinstance(integrand, Integrand):
+            return integrand
+        if integrand not in Integrands.REGISTRY:
+            raise ValueError(f"Integrando desconocido: {integrand}. "
+                             f"Opciones: {list(Integrands.REGISTRY)}")
+        return Integrands.REGISTRY[integrand]
+
+    @staticmethod
+    def names() -> List[str]:
+        """
+        Nombres de los integrandos registrados, en orden de registro.
+        """
+        return list(Integrands.REGISTRY)
+
+    @staticmethod
+    def estimate(integrand: Union[str, Integrand], Nsamples: int, rng: RNG, d: int,
+                 max_block: int = MAX_BLOCK_SIZE, precision: Optional[str] = None,
+                 antithetic: Optional[bool] = None,
+                 log_space: Optional[bool] = None) -> float:
+        """
+        Estimación con Monte Carlo de la integral de un integrando del
+        registro en [0, 1]^d. Las pistas del integrando eligen el estimador:
+
+        - separable con log_kernel y d >= LOG_SPACE_DIMENSION: espacio
+          logarítmico (MonteCarlo.log_method_blocks), sin antitéticas.
+        - monotone: variables antitéticas (MonteCarlo.antithetic_method_blocks).
+        - si no, el método por bloques.
+
+        Args:
+            integrand (str | Integrand): integrando o su nombre en el registro
+            Nsamples (int): número de evaluaciones del integrando
+            rng (RNG): objeto de la clase RNG para obtener uniformes
+            d (int): dimensión del hipercubo
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (Optional[str]): precisión de las uniformes (ver
+            RNG.uniform_block). Por defecto "float64", o "res53" si el
+            integrando no es acotado.
+            antithetic (Optional[bool]): fuerza (o desactiva) las variables
+            antitéticas. Por defecto se decide con la pista monotone.
+            log_space (Optional[bool]): fuerza (o desactiva) el espacio
+            logarítmico. Por defecto se decide con la pista separable y d.
+
+        Raises:
+            ValueError: Si se pide log_space y el integrando no tiene log_kernel
+
+        Returns:
+            float: estimación de la integral
+        """
+        integrand = Integrands.get(integrand)
+        if precision is None:
+            precision = integrand.default_precision()
+        if log_space is None:
+            log_space = integrand.separable and integrand.log_kernel is not None \
+                and d >= Integrands.LOG_SPACE_DIMENSION
+        if log_space:
+            return float(np.exp(Integrands.log_estimate(integrand, Nsamples, rng, d,
+                                                        max_block=max_block, precision=precision)))
+        if antithetic is None:
+            antithetic = integrand.monotone
+        method = MonteCarlo.antithetic_method_blocks if antithetic else MonteCarlo.method_blocks
+        return method(Nsamples, integrand.kernel, rng, d, max_block=max_block, precision=precision)
+
+    @staticmethod
+    def log_estimate(integrand: Union[str, Integrand], Nsamples: int, rng: RNG, d: int,
+                     max_block: int = MAX_BLOCK_SIZE, precision: Optional[str] = None) -> float:
+        """
+        Logaritmo de la estimación con Monte Carlo, evaluando log_kernel en
+        espacio logarítmico (ver MonteCarlo.log_method_blocks). Sirve para
+        integrandos separables en dimensiones donde el kernel underflowea.
+
+        Raises:
+            ValueError: Si el integrando no tiene log_kernel
+
+        Returns:
+            float: logaritmo de la estimación de la integral
+        """
+        integrand = Integrands.get(integrand)
+        if integrand.log_kernel is None:
+            raise ValueError(f"El integrando {integrand.name} no tiene log_kernel.")
+        if precision is None:
+            precision = integrand.default_precision()
+        return MonteCarlo.log_method_blocks(Nsamples, integrand.log_kernel, rng, d,
+                                            max_block=max_block, precision=precision)
+
+
+Integrands.register(Integrand(
+    "gaussian_hipercube", Utils.gaussian_func_multivar,
+    exact=Utils.gaussian_integral,
+    log_kernel=lambda Xs: Utils.gaussian_func_multivar(Xs, log=True),
+    separable=True, monotone=True))
+Integrands.register(Integrand(
+    "genz_oscillatory", Genz.oscillatory, exact=Genz.oscillatory_exact))
+Integrands.register(Integrand(
+    "genz_product_peak", Genz.product_peak, exact=Genz.product_peak_exact,
+    log_kernel=Genz.product_peak_log, separable=True))
+Integrands.register(Integrand(
+    "genz_corner_peak", Genz.corner_peak, exact=Genz.corner_peak_exact,
+    monotone=True))
+Integrands.register(Integrand(
+    "genz_gaussian", Genz.gaussian, exact=Genz.gaussian_exact,
+    log_kernel=Genz.gaussian_log, separable=True))
+Integrands.register(Integrand(
+    "genz_continuous", Genz.continuous, exact=Genz.continuous_exact,
+    log_kernel=Genz.continuous_log, separable=True))
+Integrands.register(Integrand(
+    "genz_discontinuous", Genz.discontinuous, exact=Genz.discontinuous_exact))
@@ -1,11 +1,19 @@
-from typing import Callable, Tuple, List
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterator, Tuple, List
 from rngs.RNG import RNG
+from rngs.BlockPipeline import BlockPipeline
+from constants import MAX_BLOCK_SIZE
+from Instrumentation import Instrumentation
 import numpy as np
 from numpy.typing import ArrayLike
 
 class MonteCarlo:
     """
     Implementa el método de MonteCarlo
+
+    Con Instrumentation.record activo, los métodos por bloques miden el
+    tiempo de generación, evaluación de g y acumulación de cada bloque, y
+    todos cuentan las uniformes consumidas por generador.
     """
 
     @staticmethod
@@ -29,8 +37,158 @@ class MonteCarlo:
         for _ in range(Nsamples):
             uniforms = np.array([rng.rand01() for _ in range(Nvars)])
             integral += g(uniforms)
+        Instrumentation.count_draws(rng, Nsamples * Nvars)
         return integral/Nsamples
     
+    @staticmethod
+    def method_blocks(Nsamples: int,
+                      g: Callable[[np.ndarray], np.ndarray],
+                      rng: RNG,
+                      Nvars: int,
+                      max_block: int = MAX_BLOCK_SIZE,
+                      precision: str = "float64",
+                      pipelined: bool = False) -> float:
+        """
+        Versión por bloques de method: genera las uniformes de a bloques y
+        evalúa g vectorizada sobre cada bloque. Con pipelined, un hilo genera
+        el bloque siguiente mientras se evalúa g sobre el actual (ver
+        BlockPipeline); el resultado es el mismo en ambos modos.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): número de variables
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block).
+            g se evalúa en esa precisión y los resultados se acumulan en float64.
+            pipelined (bool): si la generación se superpone con la evaluación
+
+        Returns:
+            float: Estimación de la esperanza de g sobre un dominio uniforme.
+        """
+        chunk = max(1, max_block // Nvars)
+        sizes = BlockPipeline.block_sizes(Nsamples, chunk, Nvars)
+        integral = 0.0
+        with MonteCarlo._uniform_blocks(rng, sizes, precision, pipelined) as blocks:
+            blocks = iter(blocks)
+            for size in sizes:
+                m = size // Nvars
+                probe = Instrumentation.chunk_probe(rng, m)
+                uniforms = next(blocks)
+                probe.mark("generation")
+                g_values = g(uniforms.reshape(m, Nvars))
+                probe.mark("integrand")
+                integral += np.sum(g_values, dtype=np.float64)
+                probe.mark("accumulation")
+                probe.done()
+        return integral / Nsamples
+
+    @staticmethod
+    def antithetic_method_blocks(Nsamples: int,
+                                 g: Callable[[np.ndarray], np.ndarray],
+                                 rng: RNG,
+                                 Nvars: int,
+                                 max_block: int = MAX_BLOCK_SIZE,
+                                 precision: str = "float64") -> float:
+        """
+        Versión de method_blocks con variables antitéticas: cada bloque de
+        uniformes U se evalúa en U y en 1 - U. Usa la mitad de las uniformes
+        y, si g es monótona en cada variable, reduce la varianza.
+
+        Args:
+            Nsamples (int): Número de evaluaciones de g (si es impar, la
+            última muestra no tiene pareja)
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): número de variables
+            max_block (int): máximo de uniformes generadas por bloque; como
+            cada bloque se evalúa dos veces, los bloques son de la mitad.
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            float: Estimación de la esperanza de g sobre un dominio uniforme.
+        """
+        chunk = max(1, max_block // (2 * Nvars))
+        pairs = Nsamples // 2
+        integral, done = 0.0, 0
+        while done < pairs:
+            m = min(chunk, pairs - done)
+            probe = Instrumentation.chunk_probe(rng, 2 * m)
+            uniforms = rng.uniform_block(m * Nvars, precision).reshape(m, Nvars)
+            probe.mark("generation")
+            g_values = g(uniforms)
+            g_antithetic = g(1 - uniforms)
+            probe.mark("integrand")
+            integral += np.sum(g_values, dtype=np.float64) + np.sum(g_antithetic, dtype=np.float64)
+            probe.mark("accumulation")
+            probe.done()
+            done += m
+        if Nsamples % 2:
+            uniforms = rng.uniform_block(Nvars, precision).reshape(1, Nvars)
+            integral += np.sum(g(uniforms), dtype=np.float64)
+        return integral / Nsamples
+
+    @staticmethod
+    def log_method_blocks(Nsamples: int,
+                          log_g: Callable[[np.ndarray], np.ndarray],
+                          rng: RNG,
+                          Nvars: int,
+                          max_block: int = MAX_BLOCK_SIZE,
+                          precision: str = "float64") -> float:
+        """
+        Versión de method_blocks en espacio logarítmico: recibe log(g) y
+        devuelve log de la estimación, acumulando con log-sum-exp por bloque.
+        Sirve cuando g es tan chica que exp underflowea (por ejemplo, la
+        gaussiana en dimensiones altas). Los bloques se cortan a lo largo de
+        las muestras, así la memoria queda acotada por max_block para
+        cualquier Nvars.
+
+        Args:
+            Nsamples (int): Número de muestras
+            log_g (Callable[[np.ndarray], np.ndarray]): logaritmo de la función
+            a aplicar, vectorizado sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): número de variables
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            float: logaritmo de la estimación de la esperanza de g.
+        """
+        chunk = max(1, max_block // Nvars)
+        # La suma acumulada de g es exp(shift) * scaled
+        shift, scaled = -np.inf, 0.0
+        done = 0
+        while done < Nsamples:
+            m = min(chunk, Nsamples - done)
+            probe = Instrumentation.chunk_probe(rng, m)
+            uniforms = rng.uniform_block(m * Nvars, precision).reshape(m, Nvars)
+            probe.mark("generation")
+            log_values = np.asarray(log_g(uniforms), dtype=np.float64)
+            probe.mark("integrand")
+            block_max = np.max(log_values)
+            if block_max > shift:
+                scaled *= np.exp(shift - block_max)
+                shift = block_max
+            scaled += np.sum(np.exp(log_values - shift))
+            probe.mark("accumulation")
+            probe.done()
+            done += m
+        return float(shift + np.log(scaled) - np.log(Nsamples))
+
+    @staticmethod
+    def _uniform_blocks(rng: RNG, sizes: List[int], precision: str, pipelined: bool):
+        """
+        Bloques de uniformes de los tamaños dados, generados en un hilo aparte
+        (pipelined) o a demanda. Se usa como context manager.
+        """
+        if pipelined:
+            return BlockPipeline(rng, sizes, precision)
+        return nullcontext(rng.uniform_block(size, precision) for size in sizes)
+
     @staticmethod
     def get_parcials_method_Nvars(Nsamples: int,
                                 g: Callable[[ArrayLike], float],
@@ -59,9 +217,48 @@ class MonteCarlo:
             parcial_result = g(uniforms)
             parcial_estims.append((uniforms, parcial_result))
             integral += parcial_result
+        Instrumentation.count_draws(rng, Nsamples * Nvars)
         return parcial_estims
 
 
+    @staticmethod
+    def get_parcials_method_Nvars_chunks(Nsamples: int,
+                                         g: Callable[[np.ndarray], np.ndarray],
+                                         rng: RNG, Nvars: int,
+                                         max_block: int = MAX_BLOCK_SIZE,
+                                         precision: str = "float64"
+                                         ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Versión por bloques de get_parcials_method_Nvars: genera de a bloques
+        las uniformes de cada iteración y el resultado de evaluar g en ellas.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): numero de variables a simular
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block).
+            g se evalúa en esa precisión y los resultados se acumulan en float64.
+
+        Returns:
+            Iterator[Tuple[np.ndarray, np.ndarray]]: bloques con las uniformes
+            (m x Nvars) y los valores de g en cada fila (m).
+        """
+        chunk = max(1, max_block // Nvars)
+        done = 0
+        while done < Nsamples:
+            m = min(chunk, Nsamples - done)
+            probe = Instrumentation.chunk_probe(rng, m)
+            uniforms = rng.uniform_block(m * Nvars, precision).reshape(m, Nvars)
+            probe.mark("generation")
+            g_values = g(uniforms)
+            probe.mark("integrand")
+            probe.done()
+            yield uniforms, g_values
+            done += m
+
     @staticmethod
     def get_estimation_per_iter(Nsamples: int,
                                 g: Callable[[float], float],
@@ -86,8 +283,49 @@ class MonteCarlo:
             uniforms = np.array([rng.rand01() for _ in range(Nvars)])
             integral += g(uniforms)
             integral_iter.append(integral/(n+1))
+        Instrumentation.count_draws(rng, Nsamples * Nvars)
         return integral_iter
 
+    @staticmethod
+    def get_estimation_per_iter_chunks(Nsamples: int,
+                                       g: Callable[[np.ndarray], np.ndarray],
+                                       rng: RNG, Nvars: int,
+                                       max_block: int = MAX_BLOCK_SIZE,
+                                       precision: str = "float64") -> Iterator[np.ndarray]:
+        """
+        Versión por bloques de get_estimation_per_iter: genera de a bloques los
+        valores de (g(U1)+...+g(Un))/n, sin construir la lista completa.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG.
+            Nvars (int): número de variables
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block).
+            g se evalúa en esa precisión y los resultados se acumulan en float64.
+
+        Returns:
+            Iterator[np.ndarray]: bloques consecutivos de estimaciones por iteración.
+        """
+        chunk = max(1, max_block // Nvars)
+        integral, done = 0.0, 0
+        while done < Nsamples:
+            m = min(chunk, Nsamples - done)
+            probe = Instrumentation.chunk_probe(rng, m)
+            uniforms = rng.uniform_block(m * Nvars, precision).reshape(m, Nvars)
+            probe.mark("generation")
+            g_samples = g(uniforms)
+            probe.mark("integrand")
+            partial_sums = integral + np.cumsum(g_samples, dtype=np.float64)
+            integral = partial_sums[-1]
+            estimations = partial_sums / np.arange(done + 1, done + m + 1)
+            probe.mark("accumulation")
+            probe.done()
+            yield estimations
+            done += m
+
     def get_muestral_stats(Nsamples:int,  Nvars:int,
                 rng:RNG, g:Callable[[float], float]) -> Tuple[float, float]:
         """
@@ -114,4 +352,232 @@ class MonteCarlo:
             media_ant = media
             media = media_ant + (g_samples - media_ant) / n
             scuad = scuad * (1 - 1 /(n-1)) + n*(media - media_ant)**2
-        return scuad, media
\ No newline at end of file
+        Instrumentation.count_draws(rng, Nsamples * Nvars)
+        return scuad, media
+
+    @staticmethod
+    def merge_moments(a: Tuple[int, float, float],
+                      b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+        """
+        Combina los momentos (n, media, M2) de dos muestras disjuntas en los
+        de su unión (Chan et al.), donde M2 es la suma de los cuadrados de
+        las desviaciones a la media.
+
+        Args:
+            a (Tuple[int, float, float]): momentos de la primera muestra
+            b (Tuple[int, float, float]): momentos de la segunda muestra
+
+        Returns:
+            Tuple[int, float, float]: momentos de la unión
+        """
+        n, media, m2 = a
+        m, block_media, block_m2 = b
+        if m == 0:
+            return a
+        delta = block_media - media
+        total = n + m
+        media = media + delta * m / total
+        m2 = m2 + block_m2 + delta ** 2 * n * m / total
+        return total, media, m2
+
+    @staticmethod
+    def get_moments_blocks(Nsamples: int,
+                           g: Callable[[np.ndarray], np.ndarray],
+                           rng: RNG, Nvars: int,
+                           max_block: int = MAX_BLOCK_SIZE,
+                           precision: str = "float64") -> Tuple[int, float, float]:
+        """
+        Momentos parciales (n, media, M2) de g sobre las próximas Nsamples
+        muestras de rng, calculados por bloques. Se combinan con merge_moments,
+        así varias corridas sobre partes de un estudio se juntan en una sola.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): número de variables
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            Tuple[int, float, float]: cantidad de muestras, media y M2
+        """
+        chunk = max(1, max_block // Nvars)
+        moments = (0, 0.0, 0.0)
+        done = 0
+        while done < Nsamples:
+            m = min(chunk, Nsamples - done)
+            probe = Instrumentation.chunk_probe(rng, m)
+            uniforms = rng.uniform_block(m * Nvars, precision).reshape(m, Nvars)
+            probe.mark("generation")
+            g_samples = g(uniforms)
+            probe.mark("integrand")
+            block_media = np.mean(g_samples, dtype=np.float64)
+            block_m2 = np.sum((g_samples - block_media) ** 2)
+            moments = MonteCarlo.merge_moments(moments, (m, block_media, block_m2))
+            probe.mark("accumulation")
+            probe.done()
+            done += m
+        n, media, m2 = moments
+        return n, float(media), float(m2)
+
+    @staticmethod
+    def get_batch_moments(Nsamples: int,
+                          g: Callable[[np.ndarray], np.ndarray],
+                          rng: RNG, Nvars: int, Nbatches: int,
+                          max_block: int = MAX_BLOCK_SIZE,
+                          precision: str = "float64") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Momentos (n, media, M2) de g sobre las próximas Nsamples muestras de
+        rng, partidas en Nbatches lotes consecutivos cuyos tamaños difieren a
+        lo sumo en 1 (como np.array_split). Cada bloque generado contiene
+        lotes enteros, así los momentos de cada lote se calculan por filas.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): número de variables
+            Nbatches (int): número de lotes (a lo sumo Nsamples)
+            max_block (int): máximo de uniformes generadas por bloque (al
+            menos un lote por bloque)
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: tamaño, media y M2 de
+            cada lote, en orden
+        """
+        if not 1 <= Nbatches <= Nsamples:
+            raise ValueError("Nbatches debe estar entre 1 y Nsamples")
+        size, extra = divmod(Nsamples, Nbatches)
+        counts = np.full(Nbatches, size, dtype=np.int64)
+        counts[:extra] += 1
+        medias = np.empty(Nbatches)
+        m2s = np.empty(Nbatches)
+
+        batch = 0
+        # Primero los lotes de size + 1 muestras, después los de size
+        for batch_size, Ngroup in ((size + 1, extra), (size, Nbatches - extra)):
+            rows = max(1, max_block // (batch_size * Nvars))
+            end = batch + Ngroup
+            while batch < end:
+                r = min(rows, end - batch)
+                probe = Instrumentation.chunk_probe(rng, r * batch_size)
+                uniforms = rng.uniform_block(r * batch_size * Nvars, precision)
+                probe.mark("generation")
+                g_samples = g(uniforms.reshape(r, batch_size, Nvars))
+                probe.mark("integrand")
+                block_medias = np.mean(g_samples, axis=1, dtype=np.float64)
+                medias[batch:batch + r] = block_medias
+                m2s[batch:batch + r] = np.sum((g_samples - block_medias[:, None]) ** 2, axis=1)
+                probe.mark("accumulation")
+                probe.done()
+                batch += r
+        return counts, medias, m2s
+
+    @staticmethod
+    def get_muestral_stats_prefixes(Nsamples: List[int], Nvars: int, rng: RNG,
+                                    g: Callable[[np.ndarray], np.ndarray],
+                                    max_block: int = MAX_BLOCK_SIZE,
+                                    precision: str = "float64") -> Dict[int, Tuple[float, float]]:
+        """
+        Calcula en una sola pasada la varianza muestral y la media de las
+        estimaciones para varios tamaños de muestra. Como una corrida de n
+        muestras es prefijo de una de N > n muestras con la misma seed, se
+        acumulan los momentos por bloques y se guarda una copia al llegar a
+        cada tamaño pedido. Cada resultado coincide con el de get_muestral_stats
+        para ese tamaño (salvo redondeo).
+
+        Args:
+            Nsamples (List[int]): Tamaños de muestra a calcular.
+            Nvars (int): Número de variables (dimensión)
+            rng (RNG): Generador
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block).
+            g se evalúa en esa precisión y los resultados se acumulan en float64.
+
+        Returns:
+            Dict[int, Tuple[float, float]]: Diccionario con clave el tamaño de
+            muestra y valor la tupla con la varianza y la media de las estimaciones.
+        """
+        chunk = max(1, max_block // Nvars)
+        n, media, m2 = 0, 0.0, 0.0
+        results = {}
+        for size in sorted(set(Nsamples)):
+            while n < size:
+                m = min(chunk, size - n)
+                probe = Instrumentation.chunk_probe(rng, m)
+                uniforms = rng.uniform_block(m * Nvars, precision).reshape(m, Nvars)
+                probe.mark("generation")
+                g_samples = g(uniforms)
+                probe.mark("integrand")
+                block_media = np.mean(g_samples, dtype=np.float64)
+                block_m2 = np.sum((g_samples - block_media) ** 2)
+                n, media, m2 = MonteCarlo.merge_moments((n, media, m2), (m, block_media, block_m2))
+                probe.mark("accumulation")
+                probe.done()
+            results[size] = (m2 / (n - 1) if n > 1 else 0.0, media)
+        return results
+
+    @staticmethod
+    def get_replicated_estimations(Nsamples: int,
+                                   g: Callable[[np.ndarray], np.ndarray],
+                                   rng: RNG,
+                                   Nvars: int,
+                                   Nreplicas: int,
+                                   max_block: int = MAX_BLOCK_SIZE,
+                                   precision: str = "float64",
+                                   pipelined: bool = False) -> np.ndarray:
+        """
+        Realiza Nreplicas estimaciones independientes de Monte Carlo, cada una
+        con Nsamples muestras, procesándolas en lote como un tensor de
+        Nreplicas x chunk x Nvars uniformes. El chunk se elige para que cada
+        bloque tenga a lo sumo max_block uniformes, así la memoria queda acotada.
+
+        Las réplicas usan subsecuencias disjuntas de rng: la secuencia se
+        corta en bloques consecutivos de chunk x Nvars uniformes que se
+        reparten entre las réplicas en orden. Son disjuntas solo si las
+        Nreplicas x Nsamples x Nvars uniformes entran en el período de rng;
+        si no, las réplicas repetirían números y la varianza empírica
+        saldría subestimada, así que se rechaza (ver RNG.check_period).
+
+        Args:
+            Nsamples (int): Número de muestras por réplica
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a aplicar,
+            que evalúa sobre el último eje del arreglo.
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): número de variables
+            Nreplicas (int): número de estimaciones independientes
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block).
+            g se evalúa en esa precisión y los resultados se acumulan en float64.
+            pipelined (bool): si la generación se superpone con la evaluación
+            (ver BlockPipeline); el resultado es el mismo en ambos modos.
+
+        Raises:
+            Exception: Si las uniformes necesarias superan el período de rng
+
+        Returns:
+            np.ndarray: arreglo con las Nreplicas estimaciones.
+        """
+        rng.check_period(Nreplicas * Nsamples * Nvars, precision)
+        chunk = max(1, min(Nsamples, max_block // (Nreplicas * Nvars)))
+        sizes = BlockPipeline.block_sizes(Nsamples, chunk, Nreplicas * Nvars)
+        sums = np.zeros(Nreplicas)
+        with MonteCarlo._uniform_blocks(rng, sizes, precision, pipelined) as blocks:
+            blocks = iter(blocks)
+            for size in sizes:
+                m = size // (Nreplicas * Nvars)
+                probe = Instrumentation.chunk_probe(rng, Nreplicas * m)
+                uniforms = next(blocks)
+                probe.mark("generation")
+                g_values = g(uniforms.reshape(Nreplicas, m, Nvars))
+                probe.mark("integrand")
+                sums += g_values.sum(axis=1, dtype=np.float64)
+                probe.mark("accumulation")
+                probe.done()
+        return sums / Nsamples
@@ -0,0 +1,258 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, Optional, Sequence, Tuple
+import numpy as np
+from MonteCarlo import MonteCarlo
+from constants import MAX_BLOCK_SIZE
+from rngs.RNG import RNG
+
+
+class SharedArray:
+    """
+    Arreglo de NumPy sobre un segmento de multiprocessing.shared_memory.
+
+    El coordinador lo crea y le pasa `spec` a los workers, que lo abren con
+    SharedArray.attach y escriben directamente en su porción (su fila o su
+    rango de offsets). El resultado no se serializa de vuelta: cuando los
+    workers terminan, el coordinador ya lo tiene en memoria, en una sola copia.
+
+        shared = SharedArray((Nrows, Ncols))
+        ...                                 # workers: SharedArray.attach(spec)
+        result = shared.result()            # np.ndarray, sin copiar
+    """
+
+    def __init__(self, shape: Sequence[int], dtype=np.float64, name: Optional[str] = None):
+        self._shape = tuple(int(n) for n in shape)
+        self._dtype = np.dtype(dtype)
+        self._owner = name is None
+        if self._owner:
+            nbytes = max(1, int(np.prod(self._shape)) * self._dtype.itemsize)
+            self._shm = SharedMemory(create=True, size=nbytes)
+        else:
+            self._shm = SharedMemory(name=name)
+        self._array = np.ndarray(self._shape, dtype=self._dtype, buffer=self._shm.buf)
+
+    @property
+    def spec(self) -> Tuple[str, Tuple[int, ...], str]:
+        """
+        Lo necesario para abrir el segmento desde otro proceso: nombre, forma
+        y dtype.
+        """
+        return (self._shm.name, self._shape, self._dtype.str)
+
+    @staticmethod
+    def attach(spec: Tuple[str, Tuple[int, ...], str]) -> "SharedArray":
+        """
+        Abre desde un worker un segmento creado por el coordinador.
+
+        Args:
+            spec (Tuple[str, Tuple[int, ...], str]): el spec del SharedArray original
+
+        Returns:
+            SharedArray: vista del mismo segmento
+        """
+        name, shape, dtype = spec
+        return SharedArray(shape, dtype, name)
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        El arreglo sobre el segmento. Vale mientras el SharedArray esté abierto.
+        """
+        return self._array
+
+    @property
+    def __array_interface__(self) -> dict:
+        return self._array.__array_interface__
+
+    def result(self) -> np.ndarray:
+        """
+        Devuelve el arreglo sin copiarlo para usarlo fuera del SharedArray y
+        borra el nombre del segmento. La memoria se libera cuando ya no
+        quedan referencias al arreglo ni a sus vistas.
+
+        Returns:
+            np.ndarray: el resultado escrito por los workers
+        """
+        self._unlink()
+        # El arreglo devuelto mantiene vivo a self (es su base), y con él al segmento
+        return np.asarray(self)
+
+    def close(self) -> None:
+        """
+        Cierra el segmento en este proceso, y lo borra si es el que lo creó.
+        Las vistas de `array` dejan de ser válidas.
+        """
+        self._array = None
+        self._shm.close()
+        self._unlink()
+
+    def _unlink(self) -> None:
+        if self._owner:
+            self._owner = False
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_array", None) is not None:
+            self.close()
+
+
+class Parallel:
+    """
+    Versiones en paralelo (procesos) de los métodos de Monte Carlo que
+    devuelven resultados grandes. Cada worker escribe sus bloques en un
+    SharedArray creado por el coordinador, con su propio offset, en vez de
+    devolver listas serializadas.
+
+    Los generadores recibidos no se modifican: cada worker usa una copia.
+    """
+
+    @staticmethod
+    def split(Nsamples: int, Nworkers: int) -> List[Tuple[int, int]]:
+        """
+        Reparte Nsamples muestras en a lo sumo Nworkers rangos contiguos.
+
+        Args:
+            Nsamples (int): Número de muestras
+            Nworkers (int): Número de workers
+
+        Returns:
+            List[Tuple[int, int]]: pares (offset, cantidad), sin rangos vacíos
+        """
+        Nworkers = max(1, min(Nworkers, Nsamples))
+        bounds = [Nsamples * k // Nworkers for k in range(Nworkers + 1)]
+        return [(start, stop - start) for start, stop in zip(bounds, bounds[1:])]
+
+    @staticmethod
+    def _estimation_per_iter_task(spec: tuple, row: int, rng: RNG,
+                                  g: Callable[[np.ndarray], np.ndarray],
+                                  Nsamples: int, Nvars: int,
+                                  max_block: int, precision: str) -> None:
+        shared = SharedArray.attach(spec)
+        try:
+            done = 0
+            for estimations in MonteCarlo.get_estimation_per_iter_chunks(
+                    Nsamples, g, rng, Nvars, max_block, precision):
+                shared.array[row, done:done + len(estimations)] = estimations
+                done += len(estimations)
+        finally:
+            shared.close()
+
+    @staticmethod
+    def estimation_per_iter(Nsamples: int,
+                            g: Callable[[np.ndarray], np.ndarray],
+                            rngs: List[RNG], Nvars: int,
+                            Nworkers: Optional[int] = None,
+                            max_block: int = MAX_BLOCK_SIZE,
+                            precision: str = "float64") -> np.ndarray:
+        """
+        Versión en paralelo de MonteCarlo.get_estimation_per_iter para varios
+        generadores: cada worker calcula las estimaciones por iteración de un
+        generador y las escribe en su fila del resultado.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a
+            aplicar, que evalúa sobre el último eje del arreglo (y se puede
+            serializar con pickle).
+            rngs (List[RNG]): generadores, uno por fila
+            Nvars (int): número de variables
+            Nworkers (Optional[int]): procesos a usar. Por defecto, los de
+            ProcessPoolExecutor.
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            np.ndarray: arreglo (len(rngs) x Nsamples) donde la fila i son las
+            estimaciones por iteración del generador rngs[i].
+        """
+        traces = SharedArray((len(rngs), Nsamples))
+        try:
+            with ProcessPoolExecutor(Nworkers) as pool:
+                futures = [pool.submit(Parallel._estimation_per_iter_task, traces.spec,
+                                       row, rng, g, Nsamples, Nvars, max_block, precision)
+                           for row, rng in enumerate(rngs)]
+                for future in futures:
+                    future.result()
+        except BaseException:
+            traces.close()
+            raise
+        return traces.result()
+
+    @staticmethod
+    def _parcials_task(uniforms_spec: tuple, g_spec: tuple, offset: int, count: int,
+                       rng: RNG, g: Callable[[np.ndarray], np.ndarray], Nvars: int,
+                       max_block: int, precision: str) -> None:
+        draws_per_uniform = 2 if precision == "res53" and rng.OUTPUT_BITS < 53 else 1
+        rng.advance(offset * Nvars * draws_per_uniform)
+        uniforms_shared = SharedArray.attach(uniforms_spec)
+        g_shared = SharedArray.attach(g_spec)
+        try:
+            done = offset
+            for uniforms, g_values in MonteCarlo.get_parcials_method_Nvars_chunks(
+                    count, g, rng, Nvars, max_block, precision):
+                uniforms_shared.array[done:done + len(uniforms)] = uniforms
+                g_shared.array[done:done + len(uniforms)] = g_values
+                done += len(uniforms)
+        finally:
+            uniforms_shared.close()
+            g_shared.close()
+
+    @staticmethod
+    def parcials_method_Nvars(Nsamples: int,
+                              g: Callable[[np.ndarray], np.ndarray],
+                              rng: RNG, Nvars: int,
+                              Nworkers: Optional[int] = None,
+                              max_block: int = MAX_BLOCK_SIZE,
+                              precision: str = "float64") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versión en paralelo de MonteCarlo.get_parcials_method_Nvars_chunks:
+        las muestras se reparten en rangos contiguos y el worker de cada rango
+        salta (RNG.advance) hasta su offset en la secuencia de rng, así el
+        resultado es el mismo que en serie.
+
+        Solo escala con generadores que saltan sin generar (LCG, Xorshift,
+        PCG32, Xoshiro128++, SplitMix64, Philox). MersenneTwister no tiene
+        salto directo: cada worker regenera y descarta todo el prefijo
+        anterior a su rango, así la generación total es ~(Nworkers + 1)/2
+        veces la serie. Para él conviene correr en serie.
+
+        Args:
+            Nsamples (int): Número de muestras
+            g (Callable[[np.ndarray], np.ndarray]): Función vectorizada a
+            aplicar, que evalúa sobre el último eje del arreglo (y se puede
+            serializar con pickle).
+            rng (RNG): objeto de la clase RNG
+            Nvars (int): numero de variables a simular
+            Nworkers (Optional[int]): procesos (y rangos) a usar. Por defecto,
+            uno por CPU.
+            max_block (int): máximo de uniformes generadas por bloque
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: las uniformes (Nsamples x Nvars) y
+            los valores de g en cada fila (Nsamples).
+        """
+        dtype = np.float32 if precision == "float32" else np.float64
+        uniforms = SharedArray((Nsamples, Nvars), dtype)
+        g_values = SharedArray((Nsamples,))
+        Nworkers = Nworkers or os.cpu_count() or 1
+        try:
+            with ProcessPoolExecutor(Nworkers) as pool:
+                futures = [pool.submit(Parallel._parcials_task, uniforms.spec, g_values.spec,
+                                       offset, count, rng, g, Nvars, max_block, precision)
+                           for offset, count in Parallel.split(Nsamples, Nworkers)]
+                for future in futures:
+                    future.result()
+        except BaseException:
+            uniforms.close()
+            g_values.close()
+            raise
+        return uniforms.result(), g_values.result()
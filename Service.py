@@ -0,0 +1,291 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from MonteCarlo import MonteCarlo
+from Distributed import Distributed
+from Integrands import Integrands
+
+
+class Job:
+    """
+    Una estimación en curso o terminada. Guarda los resultados parciales en
+    orden (uno por tarea combinada) para que cualquier suscriptor, llegue
+    cuando llegue, vea la convergencia completa.
+    """
+
+    def __init__(self, key: Tuple):
+        self.key = key
+        self.partials: List[Dict[str, float]] = []
+        self.result: Optional[Dict[str, float]] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self._changed = asyncio.Condition()
+
+    async def publish(self, partial: Dict[str, float]) -> None:
+        async with self._changed:
+            self.partials.append(partial)
+            self._changed.notify_all()
+
+    async def finish(self, result: Optional[Dict[str, float]] = None,
+                     error: Optional[BaseException] = None) -> None:
+        async with self._changed:
+            self.result, self.error, self.done = result, error, True
+            self._changed.notify_all()
+
+    async def follow(self) -> AsyncIterator[Dict[str, float]]:
+        """
+        Resultados parciales desde el primero; termina con el job.
+        """
+        seen = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self.done or len(self.partials) > seen)
+                new, done = self.partials[seen:], self.done
+            for partial in new:
+                yield partial
+            seen += len(new)
+            if done:
+                if self.error is not None:
+                    raise self.error
+                return
+
+    async def wait(self) -> Dict[str, float]:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.done)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class EstimationService:
+    """
+    Servicio asyncio de estimaciones con Monte Carlo. Cada pedido
+    (generador, seed, d, Nsamples, integrando, precisión) se parte en las
+    tareas de Distributed.make_tasks, que corren en un pool de procesos; los
+    momentos parciales se combinan en orden, así el resultado es el mismo
+    que el de Compare.distributed_stats.
+
+    - Pedidos idénticos en curso se unen: comparten el mismo job.
+    - Los resultados terminados quedan en un caché LRU de cache_size pedidos.
+    - stream devuelve la convergencia (n, media, varianza, ECM) tarea a tarea.
+
+        async with EstimationService() as service:
+            stats = await service.estimate("PCG32", seed=1, d=2, Nsamples=10**6)
+    """
+
+    # Cantidad máxima de resultados guardados
+    CACHE_SIZE = 256
+
+    def __init__(self, Nworkers: Optional[int] = None, cache_size: int = CACHE_SIZE,
+                 chunk: int = Distributed.DEFAULT_CHUNK):
+        self.Nworkers = Nworkers
+        self.cache_size = cache_size
+        self.chunk = chunk
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[Tuple, Job] = {}
+        self._cache: "OrderedDict[Tuple, Job]" = OrderedDict()
+        self._tasks = set()
+        self.counters = {"hits": 0, "coalesced": 0, "misses": 0}
+
+    async def __aenter__(self) -> "EstimationService":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.Nworkers)
+
+    async def close(self) -> None:
+        """
+        Espera los jobs en curso y cierra el pool.
+        """
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @staticmethod
+    def _integral(name: str, value) -> int:
+        """
+        value como int, si es entero (10**6 y 1e6 son el mismo pedido).
+
+        Raises:
+            Exception: Si value no es entero (se rechaza en lugar de truncarlo)
+        """
+        if int(value) != value:
+            raise Exception(f"Error: {name} debe ser entero, se recibió {value}")
+        return int(value)
+
+    def _submit(self, rng: str, seed: int, d: int, Nsamples: int,
+                integrand: str, precision: str) -> Job:
+        # Claves normalizadas: Nsamples=10**6 y 1e6 son el mismo pedido
+        key = (str(rng), self._integral("seed", seed), self._integral("d", d),
+               self._integral("Nsamples", Nsamples), str(integrand), str(precision))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.counters["hits"] += 1
+            return self._cache[key]
+        if key in self._inflight:
+            self.counters["coalesced"] += 1
+            return self._inflight[key]
+
+        self.counters["misses"] += 1
+        self.start()
+        job = Job(key)
+        self._inflight[key] = job
+        task = asyncio.get_running_loop().create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda task: self._cancelled(job, task))
+        return job
+
+    def _cancelled(self, job: Job, task: asyncio.Task) -> None:
+        """
+        Si el job se canceló antes de empezar a correr, _run no llega a
+        terminarlo: se termina acá con error para liberar a los que esperan.
+        """
+        if task.cancelled() and not job.done:
+            self._inflight.pop(job.key, None)
+            asyncio.get_running_loop().create_task(
+                job.finish(error=Exception("Error: la estimación fue cancelada")))
+
+    async def _run(self, job: Job) -> None:
+        rng, seed, d, Nsamples, integrand, precision = job.key
+        loop = asyncio.get_running_loop()
+        futures = []
+        try:
+            exact = Integrands.get(integrand).exact_value(d)
+            tasks = Distributed.make_tasks(rng, seed, Nsamples, d, integrand=integrand,
+                                           chunk=self.chunk, precision=precision)
+            # Todas las tareas se encolan en el pool; se combinan en orden
+            futures = [loop.run_in_executor(self._pool, Distributed.execute, task)
+                       for task in tasks]
+            moments = (0, 0.0, 0.0)
+            for future in futures:
+                result = await future
+                moments = MonteCarlo.merge_moments(moments, (result["n"], result["mean"], result["m2"]))
+                await job.publish({"n": moments[0], **Distributed.stats(moments, exact)})
+            await job.finish(result=job.partials[-1] if job.partials else None)
+        except Exception as e:
+            for future in futures:
+                future.cancel()
+            await job.finish(error=e)
+        except asyncio.CancelledError:
+            # Los pedidos unidos a este job no deben quedar esperando para siempre
+            for future in futures:
+                future.cancel()
+            await job.finish(error=Exception("Error: la estimación fue cancelada"))
+            raise
+        finally:
+            self._inflight.pop(job.key, None)
+        if job.error is None:
+            self._cache[job.key] = job
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    async def estimate(self, rng: str, seed: int, d: int, Nsamples: int,
+                       integrand: str = "gaussian_hipercube",
+                       precision: str = "float64") -> Dict[str, float]:
+        """
+        Estimación de Monte Carlo de un integrando con un generador.
+
+        Args:
+            rng (str): nombre del generador en Registry.RNGS
+            seed (int): seed del estudio
+            d (int): dimensión del hipercubo
+            Nsamples (int): cantidad de evaluaciones
+            integrand (str): nombre del integrando en Integrands
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            Dict[str, float]: "n", "variance" (del estimador), "mean" y "ECM"
+            (si se conoce el valor exacto)
+        """
+        return await self._submit(rng, seed, d, Nsamples, integrand, precision).wait()
+
+    async def stream(self, rng: str, seed: int, d: int, Nsamples: int,
+                     integrand: str = "gaussian_hipercube",
+                     precision: str = "float64") -> AsyncIterator[Dict[str, float]]:
+        """
+        Como estimate, pero va devolviendo las estimaciones parciales a medida
+        que se combinan las tareas; la última es el resultado final.
+        """
+        async for partial in self._submit(rng, seed, d, Nsamples, integrand, precision).follow():
+            yield partial
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Aciertos del caché, pedidos unidos a uno en curso, jobs nuevos y
+        tamaño del caché.
+        """
+        return {**self.counters, "size": len(self._cache), "inflight": len(self._inflight)}
+
+
+class ServiceClient:
+    """
+    Cliente sincrónico de un EstimationService que corre en un event loop
+    propio, en un hilo de este proceso. Sirve para scripts y notebooks, y
+    para probar el servicio localmente: varios hilos pueden pedir a la vez
+    y los pedidos idénticos se unen.
+
+        with ServiceClient() as client:
+            for partial in client.stream("LCG", seed=1, d=1, Nsamples=10**6):
+                print(partial["n"], partial["mean"])
+    """
+
+    def __init__(self, Nworkers: Optional[int] = None, **kwargs):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.service = EstimationService(Nworkers, **kwargs)
+
+    def __enter__(self) -> "ServiceClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def estimate(self, *args, **kwargs) -> Dict[str, float]:
+        """
+        Ver EstimationService.estimate.
+        """
+        return self._call(self.service.estimate(*args, **kwargs))
+
+    def stream(self, *args, **kwargs) -> Iterator[Dict[str, float]]:
+        """
+        Ver EstimationService.stream.
+        """
+        iterator = self.service.stream(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    yield self._call(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            # Si el consumidor corta antes, cerrar el generador en el event loop
+            self._call(iterator.aclose())
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Ver EstimationService.cache_info.
+        """
+        return self.service.cache_info()
+
+    def close(self) -> None:
+        """
+        Cierra el servicio y detiene el event loop.
+        """
+        self._call(self.service.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -1,6 +1,8 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple, Union
+from statistics import NormalDist
 import numpy as np
 from MonteCarlo import MonteCarlo
+from Bootstrap import Bootstrap
 from constants import INTEGRAL_VAL_D1
 from rngs.RNG import RNG
 from time import time
@@ -11,76 +13,305 @@ class Utils:
     """
     
     @staticmethod
-    def gaussian_func_multivar(Xs: np.ndarray) -> float:
+    def gaussian_func_multivar(Xs: np.ndarray, log: bool = False) -> float:
         """
         Función multivariable que se usa para estimar el valor de la integral 
         con metódo de Monte Carlo.
 
         Args:
-            Xs(np.adarray): valor con el que se inicializa la función gaussiana 
+            Xs(np.adarray): valor con el que se inicializa la función gaussiana.
+            Si tiene más de un eje, cada fila del último eje es un punto.
+            log (bool): si es True devuelve el logaritmo de la función, que no
+            underflowea en dimensiones altas (ver MonteCarlo.log_method_blocks).
         
         Returns: 
             float: retorna el valor de la función gaussiana valuada en las variables
         """
-        return np.exp(-np.sum(Xs**2))
+        if log:
+            return -np.sum(Xs**2, axis=-1)
+        return np.exp(-np.sum(Xs**2, axis=-1))
+
+    @staticmethod
+    def gaussian_integral(d: int, log: bool = False) -> float:
+        """
+        Valor exacto de la integral de la función gaussiana en el hipercubo
+        [0, 1]^d: como el integrando se factoriza, es ((√π / 2) · erf(1))^d.
+
+        Args:
+            d (int): dimensión del hipercubo
+            log (bool): si es True devuelve el logaritmo del valor, que se
+            puede representar para cualquier d.
+
+        Returns:
+            float: valor exacto de la integral (o su logaritmo)
+        """
+        if log:
+            return d * np.log(INTEGRAL_VAL_D1)
+        return INTEGRAL_VAL_D1 ** d
     
     @staticmethod
-    def rng_estimation_gaussian_in_hipercube(Nsamples: int, rng: RNG, d: int = 1) -> float:
+    def _integrand(integrand):
+        """
+        Busca un integrando del registro (ver Integrands.get).
+        """
+        # Import diferido: Integrands importa Utils
+        from Integrands import Integrands
+        return Integrands.get(integrand)
+
+    @staticmethod
+    def rng_estimation_gaussian_in_hipercube(Nsamples: Union[int, List[int]], rng: RNG,
+                                             d: int = 1,
+                                             integrand: str = "gaussian_hipercube") -> Union[float, Dict[int, float]]:
         """
         Metódo para calcular la estimación con Monte Carlo de la integral de una
         función gaussiana en un hipercubo de dimensión d, para algun rng
         
         Args:
-            Nsamples (int): numero de muestras uniformes por iteracion
+            Nsamples (int | List[int]): numero de muestras uniformes por iteracion.
+            Si es una lista, se estiman todos los tamaños en una sola corrida.
             rng (RNG): objeto de la clase RNG para obtener uniformes
             d (int): dimension del hipercubo para calcular la integral
+            integrand (str): nombre del integrando en Integrands (o un
+            Integrand). Por defecto la función gaussiana.
 
         Returns:
             float: estimación con metódo de Monte Carlo de la integral de
-            una función gaussiana en un hipercubo de dimensión d.
+            una función gaussiana en un hipercubo de dimensión d. Si Nsamples
+            es una lista, un diccionario con clave el tamaño de muestra y valor
+            su estimación.
         """
         if d < 1:
             raise Exception("Error: la dimensión debe ser mayor a 1")
+        kernel = Utils._integrand(integrand).kernel
+
+        if isinstance(Nsamples, list):
+            prefix_stats = MonteCarlo.get_muestral_stats_prefixes(
+                                Nsamples=Nsamples,
+                                Nvars=d,
+                                rng=rng,
+                                g=kernel)
+            return {size: mean for size, (_, mean) in prefix_stats.items()}
         
         estimation = MonteCarlo.method(
                             Nsamples=Nsamples, 
-                            g=Utils.gaussian_func_multivar,
+                            g=kernel,
                             rng=rng,
                             Nvars=d)
         return estimation
 
 
     @staticmethod
-    def rng_muestral_stats_estimation_hipercube(Nsamples: int, rng: RNG, d: int = 1) -> float:
+    def rng_log_estimation_gaussian_in_hipercube(Nsamples: int, rng: RNG, d: int = 1,
+                                                 precision: str = "float64") -> float:
+        """
+        Metódo para calcular el logaritmo de la estimación con Monte Carlo de
+        la integral de una función gaussiana en un hipercubo de dimensión d.
+        Se evalúa en espacio logarítmico y por bloques, así sirve para d de
+        cientos a miles, donde la función y la integral underflowean.
+
+        Args:
+            Nsamples (int): numero de muestras uniformes
+            rng (RNG): objeto de la clase RNG para obtener uniformes
+            d (int): dimension del hipercubo para calcular la integral
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            float: logaritmo de la estimación con metódo de Monte Carlo.
+        """
+        if d < 1:
+            raise Exception("Error: la dimensión debe ser mayor a 1")
+
+        return MonteCarlo.log_method_blocks(
+                    Nsamples=Nsamples,
+                    log_g=lambda Xs: Utils.gaussian_func_multivar(Xs, log=True),
+                    rng=rng,
+                    Nvars=d,
+                    precision=precision)
+
+    @staticmethod
+    def rng_muestral_stats_estimation_hipercube(Nsamples: Union[int, List[int]], rng: RNG,
+                                                d: int = 1, precision: str = "float64",
+                                                integrand: str = "gaussian_hipercube") -> Dict:
         """
         Método para obtener la varianza, media y ECM de las estimaciones por método
         de Monte Carlo.
 
         Args:
-            Nsamples (int): Número de Muestras
+            Nsamples (int | List[int]): Número de Muestras. Si es una lista, se
+            calculan todos los tamaños en una sola corrida tomando los momentos
+            de cada prefijo.
             rng (RNG): Generador
             d (int, optional): Dimensión. Por defecto en 1.
+            precision (str, optional): precisión de las uniformes (ver
+            RNG.uniform_block). Por defecto en "float64". El método escalar
+            solo genera en float64, así que con otra precisión un Nsamples
+            entero también se calcula por bloques.
+            integrand (str, optional): nombre del integrando en Integrands (o
+            un Integrand). Por defecto la función gaussiana. Si no se conoce
+            su valor exacto, el ECM es None.
 
         Raises:
             Exception: Si la dimensión es menor a 1, se levanta una excepción.
 
         Returns:
-            float: Un diccionario con la varianza, media y ECM
+            dict: Un diccionario con la varianza, media y ECM. Si Nsamples es
+            una lista, un diccionario con clave el tamaño de muestra y valor
+            el diccionario de resultados de ese tamaño.
         """
         if d < 1:
             raise Exception("Error: la dimensión debe ser mayor a 1")
+
+        integrand = Utils._integrand(integrand)
+        exact = integrand.exact_value(d)
+
+        def stats_results(var: float, mean: float, size: int) -> Dict[str, float]:
+            var /= size
+            ecm = var + (mean - exact) ** 2 if exact is not None else None
+            return {
+                "variance": var,
+                "mean": mean,
+                "ECM": ecm
+            }
+
+        if isinstance(Nsamples, list) or precision != "float64":
+            sizes = Nsamples if isinstance(Nsamples, list) else [Nsamples]
+            prefix_stats = MonteCarlo.get_muestral_stats_prefixes(
+                                Nsamples=sizes,
+                                Nvars=d,
+                                rng=rng,
+                                g=integrand.kernel,
+                                precision=precision)
+            results = {size: stats_results(var, mean, size)
+                       for size, (var, mean) in prefix_stats.items()}
+            return results if isinstance(Nsamples, list) else results[Nsamples]
         
         var, mean = MonteCarlo.get_muestral_stats(
                                 Nsamples=Nsamples,
                                 Nvars=d,
                                 rng=rng,
-                                g=Utils.gaussian_func_multivar)
-        var /= Nsamples
-        ecm = var + (mean - INTEGRAL_VAL_D1 ** d) ** 2
+                                g=integrand.kernel)
+        return stats_results(var, mean, Nsamples)
+
+    @staticmethod
+    def rng_bootstrap_stats_estimation_hipercube(Nsamples: int, rng: RNG, d: int = 1,
+                                                 Nbatches: int = Bootstrap.DEFAULT_BATCHES,
+                                                 Nresamples: int = Bootstrap.DEFAULT_RESAMPLES,
+                                                 alpha: float = 0.05, seed: int = 0,
+                                                 Nworkers: int = 1,
+                                                 precision: str = "float64") -> Dict:
+        """
+        Método para obtener la varianza, media y ECM de las estimaciones por método
+        de Monte Carlo con sus intervalos de confianza, a partir de los momentos
+        de Nbatches lotes consecutivos de evaluaciones (ver Bootstrap).
+
+        Args:
+            Nsamples (int): Número de Muestras
+            rng (RNG): Generador
+            d (int, optional): Dimensión. Por defecto en 1.
+            Nbatches (int, optional): Número de lotes (con Nbatches = Nsamples,
+            bootstrap clásico). Por defecto en Bootstrap.DEFAULT_BATCHES.
+            Nresamples (int, optional): Número de remuestras bootstrap.
+            alpha (float, optional): Nivel de los intervalos de confianza
+            (1 - alpha). Por defecto en 0.05.
+            seed (int, optional): seed del remuestreo. Por defecto en 0.
+            Nworkers (int, optional): procesos para el remuestreo. Por defecto en 1.
+            precision (str, optional): precisión de las uniformes (ver
+            RNG.uniform_block). Por defecto en "float64".
+
+        Raises:
+            Exception: Si la dimensión es menor a 1, o hay menos de 2 muestras
+            o de 2 lotes, se levanta una excepción.
+
+        Returns:
+            dict: Un diccionario con la varianza, media y ECM, sus intervalos
+            bootstrap ("variance_CI", "mean_CI", "ECM_CI") y los intervalos de
+            batch means ("batch_means").
+        """
+        if d < 1:
+            raise Exception("Error: la dimensión debe ser mayor a 1")
+        if Nsamples < 2 or Nbatches < 2:
+            raise Exception("Error: se necesitan al menos 2 muestras y 2 lotes")
+
+        summaries = MonteCarlo.get_batch_moments(
+                                Nsamples=Nsamples,
+                                g=Utils.gaussian_func_multivar,
+                                rng=rng,
+                                Nvars=d,
+                                Nbatches=min(Nbatches, Nsamples),
+                                precision=precision)
+        results = Bootstrap.confidence_intervals(summaries, alpha=alpha,
+                                                 Nresamples=Nresamples, seed=seed,
+                                                 exact=Utils.gaussian_integral(d),
+                                                 Nworkers=Nworkers)
+        results["batch_means"] = Bootstrap.batch_means(summaries, alpha=alpha)
+        return results
+
+    @staticmethod
+    def rng_replicated_stats_estimation_hipercube(Nsamples: int, rng: RNG, d: int = 1,
+                                                  Nreplicas: int = 1000,
+                                                  alpha: float = 0.05,
+                                                  precision: str = "float64",
+                                                  pipelined: bool = False) -> Dict[str, float]:
+        """
+        Método para obtener el ECM, sesgo y varianza empíricos del estimador de
+        Monte Carlo, a partir de Nreplicas estimaciones independientes hechas
+        sobre subsecuencias disjuntas de rng. Los intervalos de confianza
+        usan la aproximación normal sobre las réplicas.
+
+        Args:
+            Nsamples (int): Número de muestras por estimación
+            rng (RNG): Generador
+            d (int, optional): Dimensión. Por defecto en 1.
+            Nreplicas (int, optional): Número de estimaciones. Por defecto en 1000.
+            alpha (float, optional): Nivel de los intervalos de confianza
+            (1 - alpha). Por defecto en 0.05.
+            precision (str, optional): precisión de las uniformes (ver
+            RNG.uniform_block). Por defecto en "float64".
+            pipelined (bool, optional): si la generación se superpone con la
+            evaluación (ver BlockPipeline). Por defecto en False.
+
+        Raises:
+            Exception: Si la dimensión es menor a 1, hay menos de 2 réplicas o
+            las uniformes necesarias superan el período de rng, se levanta
+            una excepción.
+
+        Returns:
+            Dict[str, float]: Un diccionario con la media, sesgo, varianza y ECM
+            de las estimaciones, y los intervalos de confianza del sesgo,
+            varianza y ECM.
+        """
+        if d < 1:
+            raise Exception("Error: la dimensión debe ser mayor a 1")
+        if Nreplicas < 2:
+            raise Exception("Error: se necesitan al menos 2 réplicas")
+
+        estimations = MonteCarlo.get_replicated_estimations(
+                                Nsamples=Nsamples,
+                                g=Utils.gaussian_func_multivar,
+                                rng=rng,
+                                Nvars=d,
+                                Nreplicas=Nreplicas,
+                                precision=precision,
+                                pipelined=pipelined)
+        z = NormalDist().inv_cdf(1 - alpha / 2)
+        real_value = Utils.gaussian_integral(d)
+
+        def confidence_interval(values: np.ndarray) -> Tuple[float, float]:
+            center = np.mean(values)
+            radius = z * np.std(values, ddof=1) / np.sqrt(len(values))
+            return (center - radius, center + radius)
+
+        errors = estimations - real_value
+        mean = np.mean(estimations)
+        deviations = (estimations - mean) ** 2 * Nreplicas / (Nreplicas - 1)
         results = {
-            "variance": var,
             "mean": mean,
-            "ECM": ecm
+            "bias": mean - real_value,
+            "variance": np.mean(deviations),
+            "ECM": np.mean(errors ** 2),
+            "bias_CI": confidence_interval(errors),
+            "variance_CI": confidence_interval(deviations),
+            "ECM_CI": confidence_interval(errors ** 2)
         }
         return results
 
@@ -112,7 +343,8 @@ class Utils:
         
     @staticmethod
     def rng_gaussian_estimation_per_iter(Nsamples: int, rng: RNG,
-                                        d: int = 1) -> List[float]:
+                                        d: int = 1,
+                                        integrand: str = "gaussian_hipercube") -> List[float]:
         """ 
         Metódo para obtener el tiempo entre muestras de estimaciones con Monte Carlo 
         de la integral de una función gaussiana en un hipercubo de dimensiones d, 
@@ -122,6 +354,8 @@ class Utils:
             Nsamples (int): numero de muestras uniformes
             rng (RNG): objeto de la clase RNG para obtener uniformes
             d (int): dimension del hipercubo para calcular la integral 
+            integrand (str): nombre del integrando en Integrands (o un
+            Integrand). Por defecto la función gaussiana.
 
         Returns:
             List[float]: estimaciones con Monte Carlo de la integral de una
@@ -130,7 +364,7 @@ class Utils:
         try:
             estimation_per_iter = MonteCarlo.get_estimation_per_iter(
                 Nsamples=Nsamples,
-                g=Utils.gaussian_func_multivar,
+                g=Utils._integrand(integrand).kernel,
                 rng=rng,
                 Nvars=d
             )
@@ -138,4 +372,33 @@ class Utils:
             return estimation_per_iter.tolist()
         
         except Exception as e:
-            raise e
\ No newline at end of file
+            raise e
+
+    @staticmethod
+    def rng_gaussian_estimation_per_iter_chunks(Nsamples: int, rng: RNG,
+                                                d: int = 1,
+                                                integrand: str = "gaussian_hipercube") -> Iterator[np.ndarray]:
+        """
+        Versión por bloques de rng_gaussian_estimation_per_iter, para consumir
+        las estimaciones por iteración sin guardarlas todas en memoria.
+
+        Args:
+            Nsamples (int): numero de muestras uniformes
+            rng (RNG): objeto de la clase RNG para obtener uniformes
+            d (int): dimension del hipercubo para calcular la integral
+            integrand (str): nombre del integrando en Integrands (o un
+            Integrand). Por defecto la función gaussiana.
+
+        Returns:
+            Iterator[np.ndarray]: bloques consecutivos de estimaciones con Monte
+            Carlo de la integral de una función gaussiana por iteración.
+        """
+        if d < 1:
+            raise Exception("Error: la dimensión debe ser mayor a 1")
+
+        return MonteCarlo.get_estimation_per_iter_chunks(
+            Nsamples=Nsamples,
+            g=Utils._integrand(integrand).kernel,
+            rng=rng,
+            Nvars=d
+        )
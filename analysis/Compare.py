@@ -1,8 +1,14 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional, Union
 from Utils import Utils 
-from rngs.Xorshift32 import Xorshift
-from rngs.MersenneTwister import MersenneTwister
-from rngs.LCG import LCG
+from Parallel import Parallel
+from Integrands import Integrands
+from Distributed import Distributed, Coordinator
+from Bootstrap import Bootstrap
+from rngs.RNG import RNG
+from rngs.Registry import Registry
+from rngs.Variates import Variates
+from time import perf_counter
+import numpy as np
 
 class Compare:
     """
@@ -10,29 +16,48 @@ class Compare:
     de Monte Carlo de una función gaussiana en un hipercubo de dimensión d.
     """
 
+    # Generadores que se comparan: nombre -> clase (ver rngs/Registry.py)
+    RNGS = Registry.RNGS
+
+    @staticmethod
+    def init_rngs(seed: int) -> Dict[str, RNG]:
+        """
+        Inicializa todos los generadores registrados en Compare.RNGS con la
+        misma seed (ver Registry.init_rngs).
+
+        Args:
+            seed (int): valor fijo para comparar generadores
+
+        Returns:
+            Dict[str, RNG]: generadores inicializados, por nombre
+        """
+        return Registry.init_rngs(seed)
+
     @staticmethod
-    def muestral_stats(Nsamples: int, seed: int, d: int = 1) -> Dict[str, Dict[str, float]]:
+    def muestral_stats(Nsamples: Union[int, List[int]], seed: int,
+                       d: int = 1, precision: str = "float64") -> Dict[str, Dict[str, float]]:
         """
         Metódo para comparar varianza entre muestras de estimaciones con Monte Carlo
         de la integral de una función gaussiana en un hipercubo de dimensiones d,
-        para todos los rngs: LCG, Xorshift, MersenneTwister
+        para todos los rngs registrados en Compare.RNGS
 
         Args:
-            Nsamples (int): numero de muestras uniformes por iteracion
+            Nsamples (int | List[int]): numero de muestras uniformes por iteracion.
+            Si es una lista, todos los tamaños se calculan en una sola corrida
+            por generador.
             seed (int): valor fijo para comparar generadores
             d (int): dimension del hipercubo para calcular la integral 
+            precision (str): precisión de las uniformes cuando Nsamples es una
+            lista (ver RNG.uniform_block)
         
         Returns:
             (dict): entradas donde las claves se corresponden a los nombres de 
-            las clases de rngs (str): LCG, Xorshift y MersenneTwister y el valor las
-            la media y varianza muestral de las estimaciones (Tuple[float,float]) 
-        """
-        # inicialización de los rngs
-        rngs = {
-            "LCG": LCG(seed),
-            "Xorshift": Xorshift(seed),
-            "MersenneTwister": MersenneTwister(seed),
-        }
+            las clases de rngs (str) registradas en Compare.RNGS y el valor las
+            la media y varianza muestral de las estimaciones (Tuple[float,float]).
+            Si Nsamples es una lista, el valor es un diccionario con clave el
+            tamaño de muestra.
+        """
+        rngs = Compare.init_rngs(seed)
         muestral_stats = {}
         
         try:
@@ -40,19 +65,243 @@ class Compare:
                 muestral_result = Utils.rng_muestral_stats_estimation_hipercube(
                                         Nsamples=Nsamples,
                                         rng=rng,
-                                        d=d) 
+                                        d=d,
+                                        precision=precision)
                 muestral_stats[name] = muestral_result
             return muestral_stats
         
         except Exception as e:
             raise e
         
+    @staticmethod
+    def bootstrap_stats(Nsamples: int, seed: int, d: int = 1,
+                        Nbatches: int = Bootstrap.DEFAULT_BATCHES,
+                        Nresamples: int = Bootstrap.DEFAULT_RESAMPLES,
+                        alpha: float = 0.05, Nworkers: int = 1,
+                        precision: str = "float64") -> Dict[str, Dict[str, object]]:
+        """
+        Metódo para comparar varianza, media y ECM de estimaciones con Monte
+        Carlo de la integral de una función gaussiana en un hipercubo de
+        dimensión d, con intervalos de confianza bootstrap y de batch means,
+        para todos los rngs registrados en Compare.RNGS
+
+        Args:
+            Nsamples (int): numero de muestras uniformes por estimación
+            seed (int): valor fijo para comparar generadores (también es la
+            seed del remuestreo)
+            d (int): dimension del hipercubo para calcular la integral
+            Nbatches (int): numero de lotes que se remuestrean
+            Nresamples (int): numero de remuestras bootstrap
+            alpha (float): nivel de los intervalos de confianza (1 - alpha)
+            Nworkers (int): procesos para el remuestreo
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            (dict): entradas donde las claves se corresponden a los nombres de
+            las clases de rngs (str) registradas en Compare.RNGS y el valor el
+            diccionario de estadísticas con sus intervalos de confianza
+        """
+        rngs = Compare.init_rngs(seed)
+        bootstrap_stats = {}
+
+        try:
+            for name, rng in rngs.items():
+                bootstrap_stats[name] = Utils.rng_bootstrap_stats_estimation_hipercube(
+                                            Nsamples=Nsamples,
+                                            rng=rng,
+                                            d=d,
+                                            Nbatches=Nbatches,
+                                            Nresamples=Nresamples,
+                                            alpha=alpha,
+                                            seed=seed,
+                                            Nworkers=Nworkers,
+                                            precision=precision)
+            return bootstrap_stats
+
+        except Exception as e:
+            raise e
+
+    @staticmethod
+    def replicated_stats(Nsamples: int, seed: int, d: int = 1,
+                         Nreplicas: int = 1000,
+                         precision: str = "float64",
+                         pipelined: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Metódo para comparar ECM, sesgo y varianza empíricos entre Nreplicas
+        estimaciones independientes con Monte Carlo de la integral de una función
+        gaussiana en un hipercubo de dimensión d, para todos los rngs registrados
+        en Compare.RNGS
+
+        Args:
+            Nsamples (int): numero de muestras uniformes por estimación
+            seed (int): valor fijo para comparar generadores
+            d (int): dimension del hipercubo para calcular la integral
+            Nreplicas (int): numero de estimaciones independientes
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+            pipelined (bool): si la generación se superpone con la evaluación
+
+        Returns:
+            (dict): entradas donde las claves se corresponden a los nombres de
+            las clases de rngs (str) registradas en Compare.RNGS y el valor
+            el diccionario de estadísticas con sus intervalos de confianza
+        """
+        rngs = Compare.init_rngs(seed)
+        replicated_stats = {}
+
+        try:
+            for name, rng in rngs.items():
+                replicated_stats[name] = Utils.rng_replicated_stats_estimation_hipercube(
+                                            Nsamples=Nsamples,
+                                            rng=rng,
+                                            d=d,
+                                            Nreplicas=Nreplicas,
+                                            precision=precision,
+                                            pipelined=pipelined)
+            return replicated_stats
+
+        except Exception as e:
+            raise e
+
+    @staticmethod
+    def dimension_scaling(Nsamples: int, seed: int, dims: List[int],
+                          precision: str = "float64") -> Dict[str, Dict[int, Dict[str, float]]]:
+        """
+        Metódo para comparar cómo escala el error de las estimaciones con Monte
+        Carlo de la integral de una función gaussiana en un hipercubo al crecer
+        la dimensión, para todos los rngs registrados en Compare.RNGS. Las
+        estimaciones se hacen en espacio logarítmico, así valen para d de
+        cientos a miles.
+
+        Args:
+            Nsamples (int): numero de muestras uniformes por estimación
+            seed (int): valor fijo para comparar generadores
+            dims (List[int]): dimensiones del hipercubo a recorrer. Cada una
+            empieza con los generadores recién inicializados con seed.
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            (dict): entradas donde las claves se corresponden a los nombres de
+            las clases de rngs (str) registradas en Compare.RNGS y el valor un
+            diccionario con clave la dimensión y valor el logaritmo de la
+            estimación, el logaritmo del valor exacto y el error relativo.
+        """
+        scaling = {name: {} for name in Compare.RNGS}
+
+        try:
+            for d in dims:
+                log_real = float(Utils.gaussian_integral(d, log=True))
+                for name, rng in Compare.init_rngs(seed).items():
+                    log_estimation = Utils.rng_log_estimation_gaussian_in_hipercube(
+                                            Nsamples=Nsamples,
+                                            rng=rng,
+                                            d=d,
+                                            precision=precision)
+                    scaling[name][d] = {
+                        "log_estimation": log_estimation,
+                        "log_real": log_real,
+                        "relative_error": float(abs(np.expm1(log_estimation - log_real)))
+                    }
+            return scaling
+
+        except Exception as e:
+            raise e
+
+    @staticmethod
+    def integrand_sweep(Nsamples: int, seed: int, d: int = 1,
+                        integrands: Optional[List[str]] = None,
+                        precision: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Metódo para comparar estimaciones con Monte Carlo de la integral de
+        varios integrandos de prueba (ver Integrands) en un hipercubo de
+        dimensión d, para todos los rngs registrados en Compare.RNGS
+
+        Args:
+            Nsamples (int): numero de evaluaciones por estimación
+            seed (int): valor fijo para comparar generadores
+            d (int): dimension del hipercubo para calcular la integral
+            integrands (Optional[List[str]]): nombres de los integrandos a
+            recorrer. Por defecto, todos los registrados. Cada uno empieza con
+            los generadores recién inicializados con seed.
+            precision (Optional[str]): precisión de las uniformes (ver
+            RNG.uniform_block). Por defecto la elige cada integrando (ver
+            Integrands.estimate).
+
+        Returns:
+            (dict): entradas donde las claves se corresponden a los nombres de
+            las clases de rngs (str) registradas en Compare.RNGS y el valor un
+            diccionario con clave el integrando y valor la estimación, el valor
+            exacto y el error relativo (None si no se conoce el valor exacto).
+        """
+        if integrands is None:
+            integrands = Integrands.names()
+        sweep = {name: {} for name in Compare.RNGS}
+
+        try:
+            for integrand_name in integrands:
+                exact = Integrands.get(integrand_name).exact_value(d)
+                for name, rng in Compare.init_rngs(seed).items():
+                    estimation = Integrands.estimate(integrand_name, Nsamples=Nsamples,
+                                                     rng=rng, d=d, precision=precision)
+                    sweep[name][integrand_name] = {
+                        "estimation": estimation,
+                        "exact": exact,
+                        "relative_error": abs(estimation - exact) / abs(exact)
+                                          if exact is not None else None
+                    }
+            return sweep
+
+        except Exception as e:
+            raise e
+
+    @staticmethod
+    def distributed_stats(Nsamples: int, seed: int, d: int = 1,
+                          addresses: Optional[List[str]] = None,
+                          integrand: str = "gaussian_hipercube",
+                          chunk: int = Distributed.DEFAULT_CHUNK,
+                          precision: str = "float64") -> Dict[str, Dict[str, float]]:
+        """
+        Metódo para comparar varianza, media y ECM de estimaciones con Monte
+        Carlo de un integrando (ver Integrands) en un hipercubo de dimensión d,
+        repartiendo las muestras en tareas entre workers remotos (ver
+        Distributed), para todos los rngs registrados en Compare.RNGS
+
+        Args:
+            Nsamples (int): numero de evaluaciones por generador
+            seed (int): valor fijo para comparar generadores
+            d (int): dimension del hipercubo para calcular la integral
+            addresses (Optional[List[str]]): direcciones de los workers
+            ("tcp://host:puerto" o "unix:///ruta"). Si es None, las tareas
+            corren en este proceso, con el mismo resultado.
+            integrand (str): nombre del integrando en Integrands
+            chunk (int): muestras por tarea
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+
+        Returns:
+            (dict): entradas donde las claves se corresponden a los nombres de
+            las clases de rngs (str) registradas en Compare.RNGS y el valor la
+            varianza, la media y el ECM (si se conoce el valor exacto)
+        """
+        exact = Integrands.get(integrand).exact_value(d)
+        coordinator = Coordinator(addresses) if addresses else None
+        stats = {}
+
+        try:
+            for name in Compare.RNGS:
+                tasks = Distributed.make_tasks(name, seed, Nsamples, d, integrand=integrand,
+                                               chunk=chunk, precision=precision)
+                results = coordinator.run(tasks) if coordinator else Distributed.run_local(tasks)
+                stats[name] = Distributed.stats(Distributed.merge(results), exact)
+            return stats
+
+        except Exception as e:
+            raise e
+
     @staticmethod
     def time(Nsamples: int, seed: int, d: int = 1) -> Dict[str, float]: 
         """
         Metódo para comparar tiempo entre muestras de estimaciones con Monte Carlo
         de la integral de una función gaussiana en un hipercubo de dimensión d,
-        para todos los rngs: LCG, Xorshift, MersenneTwister
+        para todos los rngs registrados en Compare.RNGS
 
         Args:
             Nsamples (int): numero de muestras uniformes por iteracion
@@ -61,15 +310,10 @@ class Compare:
         
         Returns:
             (dict): entradas donde las claves se corresponden a los nombres de 
-            las clases de rngs (str): LCG, Xorshift y MersenneTwister y el valor los
+            las clases de rngs (str) registradas en Compare.RNGS y el valor los
             tiempos de demora entre rngs (float)
         """
-        # inicialización de los rngs
-        rngs = {
-            "LCG": LCG(seed),
-            "Xorshift": Xorshift(seed),
-            "MersenneTwister": MersenneTwister(seed),
-        }
+        rngs = Compare.init_rngs(seed)
         times = {}
 
         try:
@@ -83,35 +327,86 @@ class Compare:
         
     @staticmethod
     def gaussian_estimation_per_iter(Nsamples: int, seed: int, 
-                                    d: int = 1) -> Dict[str, List[float]]:
+                                    d: int = 1, stream: bool = False,
+                                    parallel: bool = False) -> Dict[str, List[float]]:
         """
         Metódo para comparar estimaciones con Monte Carlo de la integral de una 
         función gaussiana en un hipercubo de dimensión d, por iteración y para todos 
-        los rngs: LCG, Xorshift, MersenneTwister
+        los rngs registrados en Compare.RNGS
 
         Args:
             Nsamples (int): numero de muestras uniformes
             seed (int): valor fijo para comparar generadores
             d (int): dimension del hipercubo para calcular la integral
+            stream (bool): si es True, las estimaciones se devuelven como
+            iteradores de bloques (np.ndarray) que se calculan al consumirlos.
+            parallel (bool): si es True, cada generador corre en un proceso y
+            las estimaciones se devuelven como filas (np.ndarray) de un
+            arreglo en memoria compartida (ver Parallel.estimation_per_iter).
         
         Returns:
             (dict): entradas donde las claves se corresponden a los nombres de 
-            las clases de rngs (str): LCG, Xorshift y MersenneTwister y el valor las
+            las clases de rngs (str) registradas en Compare.RNGS y el valor las
             estimaciones por iteración (List[float]) 
         """
-        rngs = {
-            "LCG": LCG(seed),
-            "Xorshift": Xorshift(seed),
-            "MersenneTwister": MersenneTwister(seed),
-        }
+        rngs = Compare.init_rngs(seed)
         estimation_per_iter = {}
 
         try:
+            if parallel:
+                traces = Parallel.estimation_per_iter(Nsamples=Nsamples,
+                                                      g=Utils.gaussian_func_multivar,
+                                                      rngs=list(rngs.values()),
+                                                      Nvars=d)
+                return dict(zip(rngs.keys(), traces))
             for name, rng in rngs.items():
+                if stream:
+                    estimation_per_iter[name] = Utils.rng_gaussian_estimation_per_iter_chunks(
+                                                    Nsamples=Nsamples, rng=rng, d=d)
+                    continue
                 estimations = Utils.rng_gaussian_estimation_per_iter(Nsamples=Nsamples,
                                                                     rng=rng, d=d)
                 estimation_per_iter[name] = estimations 
             return estimation_per_iter   
         
         except Exception as e:
-            raise e
\ No newline at end of file
+            raise e
+
+    @staticmethod
+    def variates_throughput(Nsamples: int, seed: int) -> Dict[str, Dict[str, float]]:
+        """
+        Metódo para comparar la velocidad de los métodos de generación de
+        variables no uniformes de Variates (ziggurat, Box-Muller, polar,
+        transformada inversa) sobre todos los rngs registrados en Compare.RNGS
+
+        Args:
+            Nsamples (int): numero de muestras a generar por método
+            seed (int): valor fijo para comparar generadores
+
+        Returns:
+            (dict): entradas donde las claves se corresponden a los nombres de
+            las clases de rngs (str) registradas en Compare.RNGS y el valor
+            un diccionario con clave el método y valor las muestras por segundo
+        """
+        samplers = {
+            "uniform": lambda rng: rng.rand01_block(Nsamples),
+            "normal_ziggurat": lambda rng: Variates.normal_ziggurat(rng, Nsamples),
+            "normal_box_muller": lambda rng: Variates.normal_box_muller(rng, Nsamples),
+            "normal_polar": lambda rng: Variates.normal_polar(rng, Nsamples),
+            "exponential_ziggurat": lambda rng: Variates.exponential_ziggurat(rng, Nsamples),
+            "truncated_normal": lambda rng: Variates.truncated_normal(rng, -1.0, 2.0, Nsamples),
+        }
+        rngs = Compare.init_rngs(seed)
+        throughput = {}
+
+        try:
+            for name, rng in rngs.items():
+                throughput[name] = {}
+                for sampler_name, sampler in samplers.items():
+                    start = perf_counter()
+                    sampler(rng)
+                    throughput[name][sampler_name] = Nsamples / (perf_counter() - start)
+            return throughput
+
+        except Exception as e:
+            raise e
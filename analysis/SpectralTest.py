@@ -0,0 +1,238 @@
+from math import ceil, floor, gamma, pi, sqrt
+from typing import Dict, Iterable, List
+from constants import LCG_A, LCG_M
+
+Vector = List[int]
+
+
+class SpectralTest:
+    """
+    Test espectral para generadores congruenciales lineales. Las t-uplas
+    (x_n, ..., x_(n+t-1)) / m de un LCG están sobre familias de hiperplanos
+    paralelos; el test calcula, sin generar muestras, la distancia 1/ν_t entre
+    hiperplanos a partir de la red dual
+
+        { s ∈ Z^t : s_1 + a s_2 + ... + a^(t-1) s_t ≡ 0 (mod m) }
+
+    donde ν_t es la norma del vector no nulo más corto. Se reduce la base con
+    LLL y luego se enumeran los vectores cortos (Fincke-Pohst).
+    """
+
+    # γ_t^t: constantes de Hermite conocidas para t = 2, ..., 8
+    HERMITE_POWERS = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+    @staticmethod
+    def dual_basis(a: int, m: int, t: int) -> List[Vector]:
+        """
+        Base de la red dual del LCG de multiplicador a y módulo m en dimensión t.
+
+        Args:
+            a (int): multiplicador
+            m (int): módulo
+            t (int): dimensión
+
+        Returns:
+            List[Vector]: t vectores enteros que generan la red dual
+        """
+        basis = [[m] + [0] * (t - 1)]
+        power = 1
+        for i in range(1, t):
+            power = (power * a) % m
+            row = [0] * t
+            row[0] = -power
+            row[i] = 1
+            basis.append(row)
+        return basis
+
+    @staticmethod
+    def _dot(u: Vector, v: Vector) -> int:
+        return sum(x * y for x, y in zip(u, v))
+
+    @staticmethod
+    def _gram_schmidt(basis: List[Vector]):
+        """
+        Ortogonalización de Gram-Schmidt (en punto flotante) de la base.
+
+        Returns:
+            Tuple[List[float], List[List[float]]]: normas al cuadrado de los
+            vectores ortogonalizados y coeficientes mu[i][j].
+        """
+        n = len(basis)
+        ortho = []
+        norms = []
+        mu = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            v = [float(x) for x in basis[i]]
+            for j in range(i):
+                mu[i][j] = SpectralTest._dot(basis[i], ortho[j]) / norms[j]
+                v = [x - mu[i][j] * y for x, y in zip(v, ortho[j])]
+            ortho.append(v)
+            norms.append(SpectralTest._dot(v, v))
+        return norms, mu
+
+    @staticmethod
+    def lll_reduce(basis: List[Vector], delta: float = 0.99) -> List[Vector]:
+        """
+        Reducción LLL de una base entera.
+
+        Args:
+            basis (List[Vector]): base a reducir
+            delta (float): parámetro de Lovász, en (1/4, 1)
+
+        Returns:
+            List[Vector]: base reducida de la misma red
+        """
+        basis = [list(b) for b in basis]
+        n = len(basis)
+        norms, mu = SpectralTest._gram_schmidt(basis)
+        k = 1
+        while k < n:
+            for j in range(k - 1, -1, -1):
+                q = round(mu[k][j])
+                if q:
+                    basis[k] = [x - q * y for x, y in zip(basis[k], basis[j])]
+                    norms, mu = SpectralTest._gram_schmidt(basis)
+            if norms[k] >= (delta - mu[k][k - 1] ** 2) * norms[k - 1]:
+                k += 1
+            else:
+                basis[k], basis[k - 1] = basis[k - 1], basis[k]
+                norms, mu = SpectralTest._gram_schmidt(basis)
+                k = max(k - 1, 1)
+        return basis
+
+    @staticmethod
+    def short_vectors(basis: List[Vector], radius2: int) -> Iterable[Vector]:
+        """
+        Enumera (Fincke-Pohst) los vectores no nulos de la red con norma al
+        cuadrado a lo sumo radius2. Conviene que la base esté reducida con LLL.
+
+        Args:
+            basis (List[Vector]): base de la red
+            radius2 (int): cota de la norma al cuadrado
+
+        Returns:
+            Iterable[Vector]: vectores de la red dentro de la bola
+        """
+        n = len(basis)
+        norms, mu = SpectralTest._gram_schmidt(basis)
+        coeffs = [0] * n
+        # Tolerancia por el redondeo de Gram-Schmidt; se verifica en enteros
+        slack = 1e-9 * radius2 + 1e-6
+
+        def search(k: int, partial: float):
+            center = -sum(coeffs[j] * mu[j][k] for j in range(k + 1, n))
+            width = sqrt(max(0.0, (radius2 + slack - partial) / norms[k]))
+            for x in range(ceil(center - width), floor(center + width) + 1):
+                coeffs[k] = x
+                length = partial + (x - center) ** 2 * norms[k]
+                if length > radius2 + slack:
+                    continue
+                if k > 0:
+                    yield from search(k - 1, length)
+                    continue
+                vector = [sum(c * b[i] for c, b in zip(coeffs, basis)) for i in range(n)]
+                if any(vector) and SpectralTest._dot(vector, vector) <= radius2:
+                    yield vector
+            coeffs[k] = 0
+
+        yield from search(n - 1, 0.0)
+
+    @staticmethod
+    def nu(a: int = LCG_A, m: int = LCG_M, t: int = 2) -> float:
+        """
+        Calcula ν_t: la norma del vector no nulo más corto de la red dual.
+        Los puntos del generador en [0,1)^t están en hiperplanos separados
+        por 1/ν_t.
+
+        Args:
+            a (int): multiplicador
+            m (int): módulo
+            t (int): dimensión
+
+        Returns:
+            float: ν_t
+        """
+        basis = SpectralTest.lll_reduce(SpectralTest.dual_basis(a, m, t))
+        best = min(SpectralTest._dot(b, b) for b in basis)
+        for vector in SpectralTest.short_vectors(basis, best):
+            best = min(best, SpectralTest._dot(vector, vector))
+        return sqrt(best)
+
+    @staticmethod
+    def planes(a: int = LCG_A, m: int = LCG_M, t: int = 2) -> int:
+        """
+        Cota de la cantidad mínima de hiperplanos paralelos que cubren todas
+        las t-uplas del generador en [0,1)^t: para un vector dual s, los puntos
+        están en los hiperplanos s·x = k con k entero, y a lo sumo
+        |s_1| + ... + |s_t| de ellos cortan el cubo. Se minimiza sobre la red.
+
+        Args:
+            a (int): multiplicador
+            m (int): módulo
+            t (int): dimensión
+
+        Returns:
+            int: mínimo de |s_1| + ... + |s_t| sobre los vectores duales no nulos
+        """
+        basis = SpectralTest.lll_reduce(SpectralTest.dual_basis(a, m, t))
+        best = min(sum(abs(x) for x in b) for b in basis)
+        # Si ||s||_1 <= best entonces ||s||_2 <= best
+        for vector in SpectralTest.short_vectors(basis, best ** 2):
+            best = min(best, sum(abs(x) for x in vector))
+        return best
+
+    @staticmethod
+    def figures_of_merit(a: int = LCG_A, m: int = LCG_M,
+                         dims: Iterable[int] = range(2, 9)) -> Dict[int, Dict[str, float]]:
+        """
+        Calcula para cada dimensión ν_t, la figura de mérito normalizada
+        S_t = ν_t / (γ_t^(1/2) m^(1/t)) (entre 0 y 1, mejor cuanto más cerca
+        de 1), la figura de mérito μ_t de Knuth y la cota de hiperplanos.
+
+        Args:
+            a (int): multiplicador
+            m (int): módulo
+            dims (Iterable[int]): dimensiones a evaluar, entre 2 y 8
+
+        Raises:
+            ValueError: Si alguna dimensión está fuera de [2, 8]
+
+        Returns:
+            Dict[int, Dict[str, float]]: diccionario con clave la dimensión y
+            valor un diccionario con "nu", "merit", "mu" y "planes".
+        """
+        results = {}
+        for t in dims:
+            if t not in SpectralTest.HERMITE_POWERS:
+                raise ValueError("La dimensión debe estar entre 2 y 8.")
+            nu = SpectralTest.nu(a, m, t)
+            results[t] = {
+                "nu": nu,
+                "merit": nu / (SpectralTest.HERMITE_POWERS[t] ** (1 / (2 * t)) * m ** (1 / t)),
+                "mu": pi ** (t / 2) * nu ** t / (gamma(t / 2 + 1) * m),
+                "planes": SpectralTest.planes(a, m, t),
+            }
+        return results
+
+    @staticmethod
+    def screen_multipliers(multipliers: Iterable[int], m: int = LCG_M,
+                           dims: Iterable[int] = range(2, 9)) -> Dict[int, float]:
+        """
+        Evalúa muchos multiplicadores candidatos y los ordena por la peor
+        figura de mérito normalizada entre las dimensiones dadas.
+
+        Args:
+            multipliers (Iterable[int]): multiplicadores candidatos
+            m (int): módulo
+            dims (Iterable[int]): dimensiones a evaluar, entre 2 y 8
+
+        Returns:
+            Dict[int, float]: diccionario con clave el multiplicador y valor
+            min_t S_t, ordenado de mejor a peor.
+        """
+        dims = list(dims)
+        scores = {}
+        for a in multipliers:
+            merits = SpectralTest.figures_of_merit(a, m, dims)
+            scores[a] = min(result["merit"] for result in merits.values())
+        return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
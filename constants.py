@@ -1,3 +1,5 @@
+from math import erf, pi, sqrt
+
 """
     Generador Congruencial Lineal
 """
@@ -21,9 +23,21 @@ SAMPLE_SIZE_MEDIUM = 100_000
 SAMPLE_SIZE_BIG    = 1_000_000
 
 """
-    Calculo exacto de la integral
+    Máximo de uniformes por bloque en los métodos vectorizados (acota la memoria)
+"""
+MAX_BLOCK_SIZE = 2 ** 20
+
+"""
+    Tiempo máximo (s) para importar los módulos de cómputo en un proceso nuevo
+"""
+IMPORT_TIME_BUDGET = 0.5
+
+"""
+    Calculo exacto de la integral: en [0, 1] vale (√π / 2) · erf(1), y en
+    [0, 1]^d el integrando se factoriza, así que vale INTEGRAL_VAL_D1 ** d
+    (ver Utils.gaussian_integral para cualquier d)
 """
-INTEGRAL_VAL_D1  = 0.74682
-INTEGRAL_VAL_D2  = 0.74682 ** TWO_DIMENSIONS
-INTEGRAL_VAL_D5  = 0.74682 ** FIVE_DIMENSIONS
-INTEGRAL_VAL_D10 = 0.74682 ** TEN_DIMENSIONS
\ No newline at end of file
+INTEGRAL_VAL_D1  = sqrt(pi) / 2 * erf(1)
+INTEGRAL_VAL_D2  = INTEGRAL_VAL_D1 ** TWO_DIMENSIONS
+INTEGRAL_VAL_D5  = INTEGRAL_VAL_D1 ** FIVE_DIMENSIONS
+INTEGRAL_VAL_D10 = INTEGRAL_VAL_D1 ** TEN_DIMENSIONS
\ No newline at end of file
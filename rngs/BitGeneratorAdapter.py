@@ -0,0 +1,122 @@
+import ctypes
+from threading import Lock
+import numpy as np
+from .RNG import RNG
+
+_next_uint64_t = ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)
+_next_uint32_t = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)
+_next_double_t = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)
+
+
+class _BitGen(ctypes.Structure):
+    """
+    Estructura bitgen_t de numpy (numpy/random/bitgen.h)
+    """
+    _fields_ = [
+        ("state", ctypes.c_void_p),
+        ("next_uint64", _next_uint64_t),
+        ("next_uint32", _next_uint32_t),
+        ("next_double", _next_double_t),
+        ("next_raw", _next_uint64_t),
+    ]
+
+
+_PyCapsule_New = ctypes.pythonapi.PyCapsule_New
+_PyCapsule_New.restype = ctypes.py_object
+_PyCapsule_New.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+
+
+class RNGBitGenerator:
+    """
+    Adapta un RNG del proyecto a la interfaz de numpy.random.BitGenerator, para
+    usar los muestreadores de numpy.random.Generator (normales, exponenciales,
+    permutaciones, etc.) sobre nuestras propias secuencias:
+
+        generator = np.random.Generator(RNGBitGenerator(LCG(seed)))
+
+    numpy lee las funciones de la estructura bitgen_t que expone `capsule`.
+    Las salidas del RNG se generan en bloque con next_block en un buffer, y
+    cada función solo toma de él las salidas que necesita. Las palabras de 32
+    y 64 bits se arman concatenando los OUTPUT_BITS bits de salidas
+    consecutivas (ej: el LCG da 31 bits, así que una palabra de 32 bits usa 2
+    salidas), y los dobles usan los 53 bits altos de una palabra de 64 bits.
+    """
+
+    # Salidas del RNG generadas por cada recarga del buffer
+    BUFFER_SIZE = 2 ** 16
+
+    def __init__(self, rng: RNG, buffer_size: int = BUFFER_SIZE):
+        self._rng = rng
+        self._bits = rng.OUTPUT_BITS
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._position = 0
+        self.lock = Lock()
+
+        # Referencias a los callbacks: deben vivir tanto como la capsula
+        self._callbacks = (
+            _next_uint64_t(lambda _: self._next_word(64)),
+            _next_uint32_t(lambda _: self._next_word(32)),
+            _next_double_t(lambda _: (self._next_word(64) >> 11) * (1.0 / 9007199254740992.0)),
+            _next_uint64_t(lambda _: self._next_outputs(1)[0]),
+        )
+        self._bitgen = _BitGen(None, *self._callbacks)
+        self._capsule_name = b"BitGenerator"
+        self.capsule = _PyCapsule_New(ctypes.addressof(self._bitgen),
+                                      self._capsule_name, None)
+
+    @property
+    def rng(self) -> RNG:
+        return self._rng
+
+    def _next_outputs(self, count: int) -> list:
+        """
+        Toma las próximas count salidas del buffer, recargándolo en bloque
+        cuando se agota.
+        """
+        if self._position + count > len(self._buffer):
+            rest = self._buffer[self._position:]
+            self._buffer = rest + self._rng.next_block(self._buffer_size).tolist()
+            self._position = 0
+        outputs = self._buffer[self._position:self._position + count]
+        self._position += count
+        return outputs
+
+    def _next_word(self, width: int) -> int:
+        """
+        Arma una palabra de width bits con los bits altos de salidas consecutivas.
+        """
+        count = -(-width // self._bits)
+        word = 0
+        for output in self._next_outputs(count):
+            word = (word << self._bits) | output
+        return word >> (count * self._bits - width)
+
+    def random_raw(self, size: int = None, output: bool = True):
+        """
+        Devuelve salidas crudas del RNG (como BitGenerator.random_raw), en bloque.
+
+        Args:
+            size (int, optional): cantidad de salidas. Por defecto una.
+            output (bool): si es False no devuelve nada (solo avanza el estado)
+
+        Returns:
+            np.ndarray | int: salidas crudas del RNG
+        """
+        count = 1 if size is None else size
+        buffered = self._buffer[self._position:self._position + count]
+        self._position += len(buffered)
+        values = np.concatenate((np.array(buffered, dtype=np.uint64),
+                                 self._rng.next_block(count - len(buffered))))
+        if not output:
+            return None
+        return int(values[0]) if size is None else values
+
+    def generator(self) -> np.random.Generator:
+        """
+        Devuelve un numpy.random.Generator que usa este adaptador.
+        """
+        return np.random.Generator(self)
+
+    def __repr__(self) -> str:
+        return f"RNGBitGenerator({self._rng.name()})"
@@ -0,0 +1,120 @@
+from contextvars import copy_context
+from queue import Queue
+from threading import Event, Thread
+from typing import Iterable, Iterator, List
+import numpy as np
+from .RNG import RNG
+
+
+class BlockPipeline:
+    """
+    Productor/consumidor de bloques de uniformes: un hilo en segundo plano
+    genera los bloques en un anillo de `depth` buffers preasignados mientras
+    el consumidor evalúa g sobre el bloque anterior. NumPy libera el GIL en
+    las operaciones grandes, así la generación se superpone con la evaluación.
+
+    - Orden determinista: hay un solo productor y los bloques se entregan en
+      el orden de `sizes`, idénticos a llamar uniform_block con esos tamaños.
+    - Contrapresión: el productor espera a que se libere un buffer, así nunca
+      hay más de `depth` bloques en memoria. Con depth = 1 no hay
+      superposición (el productor espera a que se pida el siguiente bloque).
+
+    El productor escribe directo en los buffers (uniform_block con out) y el
+    bloque entregado es el buffer (o una vista, si es más corto) y vale
+    hasta pedir el siguiente. Mientras el pipeline está abierto el rng solo lo usa el
+    productor.
+
+        with BlockPipeline(rng, sizes) as blocks:
+            for uniforms in blocks:
+                ...
+    """
+
+    # Cantidad de buffers del anillo
+    DEFAULT_DEPTH = 2
+    # Valor que despierta al productor para que termine sin tomar un buffer
+    _STOP = None
+
+    def __init__(self, rng: RNG, sizes: Iterable[int], precision: str = "float64",
+                 depth: int = DEFAULT_DEPTH):
+        if depth < 1:
+            raise ValueError("El anillo necesita al menos un buffer.")
+        self._rng = rng
+        self._sizes = list(sizes)
+        self._precision = precision
+        dtype = np.float32 if precision == "float32" else np.float64
+        largest = max(self._sizes, default=0)
+        self._ring = [np.empty(largest, dtype=dtype) for _ in range(depth)]
+        self._free = Queue()
+        for slot in range(depth):
+            self._free.put(slot)
+        self._filled = Queue()
+        self._stop = Event()
+        # El productor corre en una copia del contexto de quien crea el
+        # pipeline, así sus salidas cuentan en la instrumentación activa
+        self._thread = Thread(target=copy_context().run, args=(self._produce,), daemon=True)
+        self._started = False
+
+    def _produce(self) -> None:
+        """
+        Hilo productor: llena los buffers libres en el orden de los tamaños.
+        """
+        try:
+            for size in self._sizes:
+                slot = self._free.get()
+                if slot is self._STOP or self._stop.is_set():
+                    return
+                # Se escribe directo en el buffer, sin arreglos intermedios de uniformes
+                self._rng.uniform_block(size, self._precision, out=self._ring[slot][:size])
+                self._filled.put((slot, size))
+        except BaseException as error:
+            self._filled.put(error)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if not self._started:
+            self._started = True
+            self._thread.start()
+        previous = None
+        try:
+            for _ in self._sizes:
+                # Pedir el siguiente bloque libera el anterior; se devuelve
+                # antes de esperar, si no con depth = 1 el productor nunca
+                # tendría un buffer libre
+                if previous is not None:
+                    self._free.put(previous)
+                    previous = None
+                item = self._filled.get()
+                if isinstance(item, BaseException):
+                    raise item
+                slot, size = item
+                previous = slot
+                buffer = self._ring[slot]
+                # Los bloques completos son el buffer mismo: el mismo objeto cada depth bloques
+                yield buffer if size == len(buffer) else buffer[:size]
+        finally:
+            if previous is not None:
+                self._free.put(previous)
+
+    def close(self) -> None:
+        """
+        Detiene el productor (si quedan bloques sin consumir) y espera al hilo.
+        """
+        self._stop.set()
+        # Desbloquea al productor si está esperando un buffer libre, sin
+        # darle un buffer que el consumidor podría estar leyendo
+        self._free.put(self._STOP)
+        if self._started:
+            self._thread.join()
+
+    def __enter__(self) -> "BlockPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def block_sizes(Nsamples: int, chunk: int, width: int) -> List[int]:
+        """
+        Tamaños (en uniformes) de los bloques para recorrer Nsamples muestras
+        de a chunk muestras de width uniformes cada una.
+        """
+        return [min(chunk, Nsamples - done) * width for done in range(0, Nsamples, chunk)]
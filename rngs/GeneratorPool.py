@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Tuple, Type
+from .RNG import RNG
+
+
+class GeneratorPool:
+    """
+    Fábrica de generadores con un caché LRU de estados ya inicializados,
+    con clave (clase, seed). La primera vez que se pide un par se construye
+    el generador y se guarda como prototipo; las siguientes se entrega una
+    copia (RNG.clone), sin volver a pagar la inicialización (por ejemplo, el
+    lazo de 624 pasos de MersenneTwister.set_seed).
+
+    Cada llamada a get devuelve un generador independiente, que arranca en
+    el comienzo de la secuencia de esa seed; el prototipo nunca se entrega.
+
+        mt = GeneratorPool.get(MersenneTwister, 42)
+    """
+
+    # Cantidad máxima de prototipos guardados
+    MAX_SIZE = 1024
+
+    _cache: "OrderedDict[Tuple[Hashable, ...], RNG]" = OrderedDict()
+    _lock = Lock()
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def get(rng_class: Type[RNG], seed: int, *args) -> RNG:
+        """
+        Generador de la clase rng_class inicializado con seed.
+
+        Args:
+            rng_class (Type[RNG]): clase del generador
+            seed (int): seed del generador
+            *args: argumentos extra del constructor (ej: stream de PCG32),
+            que también forman parte de la clave
+
+        Returns:
+            RNG: generador nuevo, en el comienzo de la secuencia
+        """
+        key = (rng_class, seed) + args
+        with GeneratorPool._lock:
+            prototype = GeneratorPool._cache.get(key)
+            if prototype is not None:
+                GeneratorPool._cache.move_to_end(key)
+                GeneratorPool._hits += 1
+                return prototype.clone()
+            GeneratorPool._misses += 1
+
+        # La construcción va fuera del lock: otro hilo puede construir la
+        # misma clave a la vez, y gana cualquiera de los dos prototipos
+        prototype = rng_class(seed, *args)
+        with GeneratorPool._lock:
+            GeneratorPool._cache[key] = prototype
+            GeneratorPool._cache.move_to_end(key)
+            while len(GeneratorPool._cache) > GeneratorPool.MAX_SIZE:
+                GeneratorPool._cache.popitem(last=False)
+        return prototype.clone()
+
+    @staticmethod
+    def warm(rng_class: Type[RNG], seeds, *args) -> None:
+        """
+        Precarga en el caché los prototipos de varias seeds (por ejemplo, al
+        arrancar un worker antes de un barrido).
+
+        Args:
+            rng_class (Type[RNG]): clase del generador
+            seeds (Iterable[int]): seeds a precargar
+            *args: argumentos extra del constructor
+        """
+        for seed in seeds:
+            GeneratorPool.get(rng_class, seed, *args)
+
+    @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """
+        Aciertos, fallos y tamaño actual del caché.
+        """
+        with GeneratorPool._lock:
+            return {"hits": GeneratorPool._hits, "misses": GeneratorPool._misses,
+                    "size": len(GeneratorPool._cache), "max_size": GeneratorPool.MAX_SIZE}
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Vacía el caché y reinicia los contadores.
+        """
+        with GeneratorPool._lock:
+            GeneratorPool._cache.clear()
+            GeneratorPool._hits = 0
+            GeneratorPool._misses = 0
@@ -1,4 +1,6 @@
+from typing import Optional
 import sys
+import numpy as np
 from time import time
 from .RNG import RNG
 from constants import LCG_A, LCG_C, LCG_M
@@ -6,6 +8,10 @@ from constants import LCG_A, LCG_C, LCG_M
 sys.path.append("../")
 
 class LCG(RNG):
+    SEED_BOUND = LCG_M
+    OUTPUT_BITS = 31
+    PERIOD = LCG_M - 1
+
     def __init__(self, seed: int = int(time())):
         super().__init__(seed)
         self._a = LCG_A
@@ -27,6 +33,45 @@ class LCG(RNG):
         self._seed = (self._a * self._seed) % self._m
         return self._seed
 
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next: usa que s_k = (a^k * s_0) % m y calcula
+        las potencias a^1, ..., a^N (mod m) duplicando el bloque en cada paso,
+        por lo que solo hacen falta log2(N) operaciones vectoriales.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        if Nsamples <= 0:
+            return np.empty(0, dtype=np.uint64)
+        seed = self._seed % self._m
+        powers = np.empty(Nsamples, dtype=np.int64)
+        powers[0] = self._a % self._m
+        k = 1
+        while k < Nsamples:
+            t = min(k, Nsamples - k)
+            # powers[k-1] = a^k, entonces a^(j+1) * a^k = a^(j+1+k)
+            powers[k:k + t] = (powers[:t] * powers[k - 1]) % self._m
+            k += t
+        values = (powers * seed) % self._m
+        self._seed = int(values[-1])
+        return values.astype(np.uint64)
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples), 2 ** 31, out=out)
+
+    def advance(self, delta: int) -> None:
+        """
+        Salta delta salidas de la secuencia: s_delta = (a^delta * s_0) % m.
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+        """
+        self._seed = (pow(self._a, delta, self._m) * self._seed) % self._m
+
     def log(self) -> None:
         """
         Metódo que muestra nombre y las variables que se instancian
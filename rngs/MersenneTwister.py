@@ -1,9 +1,17 @@
+from typing import Optional
+import numpy as np
 from .RNG import RNG
 class MersenneTwister(RNG):
-    
+    """
+    Mersenne Twister MT19937. No implementa salto directo (requiere
+    aritmética de polinomios de grado 19937): advance genera y descarta las
+    salidas, así que Parallel.parcials_method_Nvars no escala con él.
+    """
+
     '''
         Constantes propias del método
     '''
+    PERIOD = 2 ** 19937 - 1             # Primo de Mersenne que da nombre al método
     BIT_WIDTH = 32                      # Longitud de palabra en bits (w)
     MT_STATE_SIZE = 624                 # Tamaño del vector de estados (n)
     RECURRENCE_OFFSET = 397             # Offset para la recurrencia (m)
@@ -52,6 +60,71 @@ class MersenneTwister(RNG):
             self._mt[i] = self._mt[(i + self.RECURRENCE_OFFSET) % self.MT_STATE_SIZE] ^ xA
         self.index = 0
 
+    def _twist_array(self, mt: np.ndarray) -> None:
+        """
+        Versión vectorizada de twist sobre un arreglo uint32 (in place). La
+        recurrencia mt[i] = mt[i+m] ^ f(mt[i], mt[i+1]) solo depende de valores
+        ya actualizados a distancia n-m = 227, así que se procesa en tramos de
+        a lo sumo 227 posiciones que no dependen entre sí.
+        """
+        n, m = self.MT_STATE_SIZE, self.RECURRENCE_OFFSET
+        upper, lower = np.uint32(self.UPPER_MASK), np.uint32(self.LOWER_MASK)
+        matrix_a = np.uint32(self.MATRIX_A)
+
+        def mix(i0: int, i1: int, source: np.ndarray) -> None:
+            y = (mt[i0:i1] & upper) | (mt[i0 + 1:i1 + 1] & lower)
+            xA = (y >> np.uint32(1)) ^ ((np.uint32(0) - (y & np.uint32(1))) & matrix_a)
+            mt[i0:i1] = source ^ xA
+
+        step = n - m
+        mix(0, step, mt[m:n])
+        start = step
+        while start < n - 1:
+            end = min(start + step, n - 1)
+            mix(start, end, mt[start - step:end - step])
+            start = end
+        # El último elemento usa mt[0] ya actualizado
+        y = (mt[n - 1] & upper) | (mt[0] & lower)
+        xA = (y >> np.uint32(1)) ^ (matrix_a if y & np.uint32(1) else np.uint32(0))
+        mt[n - 1] = mt[m - 1] ^ xA
+
+    def _temper_array(self, y: np.ndarray) -> np.ndarray:
+        """
+        Temperado vectorizado de un arreglo uint32 de estados
+        """
+        y = y ^ (y >> np.uint32(self.TEMPERING_SHIFT_U))
+        y = y ^ ((y << np.uint32(self.TEMPERING_SHIFT_S)) & np.uint32(self.TEMPERING_MASK_B))
+        y = y ^ ((y << np.uint32(self.TEMPERING_SHIFT_T)) & np.uint32(self.TEMPERING_MASK_C))
+        y = y ^ (y >> np.uint32(self.TEMPERING_SHIFT_L))
+        return y
+
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next: consume lo que queda del vector de
+        estados, y luego aplica twist y temperado vectorizados por bloques de
+        MT_STATE_SIZE valores.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        n = self.MT_STATE_SIZE
+        mt = np.array(self._mt, dtype=np.uint32)
+        values = np.empty(Nsamples, dtype=np.uint32)
+        filled = 0
+        while filled < Nsamples:
+            if self.index >= n:
+                self._twist_array(mt)
+                self.index = 0
+            t = min(n - self.index, Nsamples - filled)
+            values[filled:filled + t] = self._temper_array(mt[self.index:self.index + t])
+            self.index += t
+            filled += t
+        self._mt = mt.tolist()
+        return values.astype(np.uint64)
+
     def extract_number(self):
         """Extrae un número temperado de la secuencia"""
         if self.index >= self.MT_STATE_SIZE:
@@ -82,6 +155,9 @@ class MersenneTwister(RNG):
         """
         return self.extract_number() / 2**self.BIT_WIDTH
 
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples), 2**self.BIT_WIDTH, out=out)
+
     def log(self) -> None:
         """
         Muestra el estado actual del generador (parcial, para depuración)
@@ -0,0 +1,132 @@
+from typing import Optional
+import numpy as np
+from time import time
+from .RNG import RNG
+
+
+class PCG32(RNG):
+    """
+    Generador PCG32 (O'Neill, 2014), variante XSH-RR 64/32: un LCG de 64 bits
+    cuya salida de 32 bits es una permutación (xorshift y rotación) del estado.
+    Como la transición es un LCG, el bloque se vectoriza con la forma cerrada
+    s_k = A_k s_0 + C_k (mod 2^64) y el salto se hace en O(log n).
+    """
+
+    SEED_BOUND = 2 ** 64
+    PERIOD = 2 ** 64
+
+    MULTIPLIER = 6364136223846793005
+    DEFAULT_STREAM = 54                 # Secuencia por defecto (ejemplo de referencia)
+    MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(self, seed: int = int(time()), stream: int = DEFAULT_STREAM):
+        super().__init__(seed)
+        self._stream = stream
+        self.set_seed(seed)
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Inicialización de referencia (pcg32_srandom_r): el incremento impar
+        se deriva de la secuencia y la seed se suma al estado.
+        """
+        self._seed = seed
+        self._inc = ((self._stream << 1) | 1) & self.MASK_64
+        self._state = 0
+        self.next()
+        self._state = (self._state + seed) & self.MASK_64
+        self.next()
+
+    @staticmethod
+    def _output(state: int) -> int:
+        xorshifted = (((state >> 18) ^ state) >> 27) & 0xFFFFFFFF
+        rot = state >> 59
+        return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & 0xFFFFFFFF
+
+    def next(self) -> int:
+        """
+        Metódo que implementa el siguiente número de la secuencia en un
+        generador PCG32
+
+        Returns:
+            int: siguiente número (32 bits) en la secuencia
+        """
+        old = self._state
+        self._state = (old * self.MULTIPLIER + self._inc) & self.MASK_64
+        return self._output(old)
+
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next: calcula los coeficientes (A_k, C_k) de
+        s_k = A_k s_0 + C_k duplicando el bloque en cada paso, con
+        A_(j+k) = A_j A_k y C_(j+k) = A_j C_k + C_j.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        if Nsamples <= 0:
+            return np.empty(0, dtype=np.uint64)
+        mult = np.empty(Nsamples, dtype=np.uint64)
+        plus = np.empty(Nsamples, dtype=np.uint64)
+        mult[0], plus[0] = 1, 0
+        k = 1
+        while k < Nsamples:
+            t = min(k, Nsamples - k)
+            mult_k = (int(mult[k - 1]) * self.MULTIPLIER) & self.MASK_64
+            plus_k = (int(plus[k - 1]) * self.MULTIPLIER + self._inc) & self.MASK_64
+            plus[k:k + t] = mult[:t] * np.uint64(plus_k) + plus[:t]
+            mult[k:k + t] = mult[:t] * np.uint64(mult_k)
+            k += t
+        states = mult * np.uint64(self._state) + plus
+        self._state = (int(states[-1]) * self.MULTIPLIER + self._inc) & self.MASK_64
+
+        xorshifted = (((states >> np.uint64(18)) ^ states) >> np.uint64(27)) & np.uint64(0xFFFFFFFF)
+        rot = states >> np.uint64(59)
+        rotated = (xorshifted >> rot) | (xorshifted << ((np.uint64(32) - rot) & np.uint64(31)))
+        return rotated & np.uint64(0xFFFFFFFF)
+
+    def advance(self, delta: int) -> None:
+        """
+        Salta delta salidas de la secuencia en O(log delta) (Brown, 1994).
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+        """
+        delta &= self.MASK_64
+        cur_mult, cur_plus = self.MULTIPLIER, self._inc
+        acc_mult, acc_plus = 1, 0
+        while delta > 0:
+            if delta & 1:
+                acc_mult = (acc_mult * cur_mult) & self.MASK_64
+                acc_plus = (acc_plus * cur_mult + cur_plus) & self.MASK_64
+            cur_plus = ((cur_mult + 1) * cur_plus) & self.MASK_64
+            cur_mult = (cur_mult * cur_mult) & self.MASK_64
+            delta >>= 1
+        self._state = (acc_mult * self._state + acc_plus) & self.MASK_64
+
+    def rand01(self) -> float:
+        return self.next() / (2 ** 32)
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples), 2 ** 32, out=out)
+
+    def log(self) -> None:
+        """
+        Metódo que muestra nombre y las variables que se instancian
+        en __init__
+        """
+        print("NOMBRE: PCG32 (XSH-RR 64/32)")
+        print(f"estado: {self._state}")
+        print(f"incremento: {self._inc}")
+        print(f"seed: {self._seed}")
+
+    def name(self) -> str:
+        """
+        Devuelve el nombre del generador
+
+        Returns:
+            str: Nombre del generador PCG32
+        """
+        return "PCG32"
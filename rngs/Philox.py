@@ -0,0 +1,196 @@
+from typing import Optional
+import numpy as np
+from time import time
+from numpy.typing import ArrayLike
+from .RNG import RNG
+
+
+class Philox(RNG):
+    """
+    Generador basado en contador Philox-4x32-10 (Salmon et al., 2011). Cada
+    salida es una función pura de (clave, contador): la salida i es la palabra
+    i % 4 del bloque que se obtiene cifrando el contador i // 4 con la clave.
+    Por eso se puede acceder a cualquier posición de la secuencia en O(1) y
+    generar cualquier tramo de forma independiente, con resultados idénticos.
+    """
+
+    SEED_BOUND = 2 ** 64
+    PERIOD = 2 ** 64                    # Posiciones representables (ver next_at)
+
+    PHILOX_M0 = 0xD2511F53              # Multiplicadores de cada ronda
+    PHILOX_M1 = 0xCD9E8D57
+    PHILOX_W0 = 0x9E3779B9              # Constantes de Weyl para la clave
+    PHILOX_W1 = 0xBB67AE85
+    ROUNDS = 10
+    WORDS_PER_COUNTER = 4
+
+    def __init__(self, seed: int = int(time())):
+        super().__init__(seed)
+        self.set_seed(seed)
+
+    def set_seed(self, seed: int) -> None:
+        """
+        La seed (64 bits) es la clave; la posición vuelve al inicio de la secuencia.
+        """
+        self._seed = seed
+        self._key = (seed & 0xFFFFFFFF, (seed >> 32) & 0xFFFFFFFF)
+        self._position = 0
+
+    @staticmethod
+    def philox_block(counters: np.ndarray, key: tuple) -> np.ndarray:
+        """
+        Cifra un arreglo de contadores con Philox-4x32-10, vectorizado.
+
+        Args:
+            counters (np.ndarray): arreglo (n, 4) de palabras de 32 bits del
+            contador, de la menos a la más significativa.
+            key (tuple): clave (k0, k1) de 32 bits cada una.
+
+        Returns:
+            np.ndarray: arreglo (n, 4) uint32 con las salidas de cada contador
+        """
+        mask = np.uint64(0xFFFFFFFF)
+        c = [np.asarray(counters[:, i], dtype=np.uint64) for i in range(4)]
+        k0, k1 = key
+        m0, m1 = np.uint64(Philox.PHILOX_M0), np.uint64(Philox.PHILOX_M1)
+        for _ in range(Philox.ROUNDS):
+            product0 = m0 * c[0]
+            product1 = m1 * c[2]
+            hi0, lo0 = product0 >> np.uint64(32), product0 & mask
+            hi1, lo1 = product1 >> np.uint64(32), product1 & mask
+            c = [hi1 ^ c[1] ^ np.uint64(k0), lo1, hi0 ^ c[3] ^ np.uint64(k1), lo0]
+            k0 = (k0 + Philox.PHILOX_W0) & 0xFFFFFFFF
+            k1 = (k1 + Philox.PHILOX_W1) & 0xFFFFFFFF
+        return np.stack(c, axis=1).astype(np.uint32)
+
+    def next_at(self, indices: ArrayLike) -> np.ndarray:
+        """
+        Salidas en posiciones arbitrarias de la secuencia, sin modificar el estado.
+
+        Las posiciones se representan en 64 bits, así que el contador
+        (posición // 4) usa solo las dos palabras bajas del contador de 128
+        bits de Philox; las dos altas quedan en 0.
+
+        Args:
+            indices (ArrayLike): posiciones (enteros en [0, 2^64))
+
+        Returns:
+            np.ndarray: arreglo (uint64) con la salida en cada posición
+
+        Raises:
+            ValueError: Si alguna posición está fuera de [0, 2^64)
+        """
+        indices = np.asarray(indices)
+        if indices.size and indices.dtype.kind in "iO" and \
+                (indices.min() < 0 or indices.max() >= 2 ** 64):
+            raise ValueError("Las posiciones de Philox deben estar en [0, 2^64).")
+        indices = indices.astype(np.uint64)
+        counter = indices // np.uint64(self.WORDS_PER_COUNTER)
+        counters = np.zeros((indices.size, 4), dtype=np.uint64)
+        counters[:, 0] = counter.ravel() & np.uint64(0xFFFFFFFF)
+        counters[:, 1] = counter.ravel() >> np.uint64(32)
+        words = self.philox_block(counters, self._key)
+        columns = (indices % np.uint64(self.WORDS_PER_COUNTER)).astype(np.int64).ravel()
+        values = words[np.arange(indices.size), columns]
+        return values.astype(np.uint64).reshape(indices.shape)
+
+    def rand01_at(self, indices: ArrayLike) -> np.ndarray:
+        """
+        Uniformes en [0, 1) en posiciones arbitrarias de la secuencia, sin
+        modificar el estado: rand01_at(i) es la i-ésima salida de rand01
+        desde set_seed.
+
+        Args:
+            indices (ArrayLike): posiciones de la secuencia
+
+        Returns:
+            np.ndarray: uniformes en esas posiciones
+        """
+        return self.next_at(indices) / (2 ** 32)
+
+    def _check_end(self, end: int) -> None:
+        """
+        Verifica que la posición end quede en [0, PERIOD]: las posiciones
+        consumidas tienen que estar en [0, 2^64), como en next_at.
+        """
+        if not 0 <= end <= self.PERIOD:
+            raise ValueError("Las posiciones de Philox deben estar en [0, 2^64).")
+
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next: cifra de una vez todos los contadores que
+        cubren las próximas Nsamples posiciones.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Raises:
+            ValueError: Si alguna de esas posiciones no está en [0, 2^64)
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        start = self._position
+        self._check_end(start + Nsamples)
+        first, last = start // 4, (start + Nsamples + 3) // 4
+        counter = np.arange(first, last, dtype=np.uint64)
+        counters = np.zeros((len(counter), 4), dtype=np.uint64)
+        counters[:, 0] = counter & np.uint64(0xFFFFFFFF)
+        counters[:, 1] = counter >> np.uint64(32)
+        words = self.philox_block(counters, self._key).ravel()
+        offset = start - 4 * first
+        self._position += Nsamples
+        return words[offset:offset + Nsamples].astype(np.uint64)
+
+    def next(self) -> int:
+        """
+        Devuelve la salida de la posición actual y avanza una posición.
+        """
+        value = int(self.next_at([self._position])[0])
+        self._position += 1
+        return value
+
+    def rand01(self) -> float:
+        return self.next() / (2 ** 32)
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples), 2 ** 32, out=out)
+
+    def get_position(self) -> int:
+        """
+        Posición actual en la secuencia (cantidad de salidas ya consumidas)
+        """
+        return self._position
+
+    def advance(self, delta: int) -> None:
+        """
+        Avanza (o retrocede) la posición en la secuencia en O(1).
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+
+        Raises:
+            ValueError: Si la nueva posición queda fuera de [0, 2^64]
+            (2^64 es el final de la secuencia)
+        """
+        self._check_end(self._position + delta)
+        self._position += delta
+
+    def log(self) -> None:
+        """
+        Metódo que muestra nombre y las variables que se instancian
+        en __init__
+        """
+        print("NOMBRE: Philox-4x32-10")
+        print(f"key: ({self._key[0]:#010x}, {self._key[1]:#010x})")
+        print(f"posición: {self._position}")
+        print(f"seed: {self._seed}")
+
+    def name(self) -> str:
+        """
+        Devuelve el nombre del generador
+
+        Returns:
+            str: Nombre del generador Philox
+        """
+        return "Philox 4x32"
@@ -1,10 +1,23 @@
 from abc import ABC, abstractmethod
-import matplotlib.pyplot as plt
+from typing import Optional
+import numpy as np
+from Instrumentation import Instrumentation
+from constants import MAX_BLOCK_SIZE
 
 class RNG(ABC):
     """
     Implementa una clase abstracta para todos los RNG's que probaremos
     """
+
+    # Las semillas válidas están en [1, SEED_BOUND)
+    SEED_BOUND = 2 ** 32
+    # Cantidad de bits aleatorios de cada salida de next
+    OUTPUT_BITS = 32
+    # Período de la secuencia de salidas (None si no se conoce)
+    PERIOD: Optional[int] = None
+    # Precisiones de uniform_block
+    PRECISIONS = ("float64", "res53", "float32")
+
     def __init__(self, seed: int):
         if seed == 0:
             raise Exception("ERROR: el estado de seed no puede ser 0")
@@ -39,6 +52,22 @@ class RNG(ABC):
         """
         return self._seed
     
+    def clone(self) -> "RNG":
+        """
+        Copia independiente del generador, en el mismo punto de la secuencia.
+        Copia el estado sin volver a inicializarlo (las listas y arreglos de
+        estado se copian, los enteros se comparten), así es mucho más barata
+        que construir uno nuevo o que copy.deepcopy.
+
+        Returns:
+            RNG: generador con el mismo estado
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__ = {name: value.copy() if isinstance(value, (list, dict, np.ndarray))
+                          else value
+                          for name, value in self.__dict__.items()}
+        return clone
+
     @abstractmethod
     def rand01(self) -> float:
         """
@@ -49,6 +78,127 @@ class RNG(ABC):
         """
         pass
 
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Genera en bloque los próximos Nsamples números de la secuencia. El
+        estado final del generador es el mismo que tras Nsamples llamadas a next.
+        Las subclases lo sobreescriben con una versión vectorizada.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        return np.fromiter((self.next() for _ in range(Nsamples)),
+                           dtype=np.uint64, count=Nsamples)
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Versión en bloque de rand01: devuelve los próximos Nsamples valores
+        uniformes en [0, 1), idénticos a los de Nsamples llamadas a rand01.
+
+        Args:
+            Nsamples (int): Cantidad de uniformes a generar
+            out (Optional[np.ndarray]): arreglo float64 de largo Nsamples
+            donde escribir el resultado, en lugar de asignar uno nuevo
+
+        Returns:
+            np.ndarray: arreglo (float64) de uniformes en [0, 1) (out, si se pasó)
+        """
+        values = np.fromiter((self.rand01() for _ in range(Nsamples)),
+                             dtype=np.float64, count=Nsamples)
+        if out is None:
+            return values
+        out[...] = values
+        return out
+
+    def advance(self, delta: int) -> None:
+        """
+        Saltea las próximas delta salidas de la secuencia. Por defecto las
+        genera en bloques de a lo sumo MAX_BLOCK_SIZE y las descarta (costo
+        O(delta)); los generadores con salto directo lo sobreescriben en
+        O(log delta) o O(1). MersenneTwister usa esta versión.
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+        """
+        while delta > 0:
+            step = min(delta, MAX_BLOCK_SIZE)
+            self.next_block(step)
+            delta -= step
+
+    def draws_per_uniform(self, precision: str = "float64") -> int:
+        """
+        Salidas de next que consume cada uniforme de uniform_block con esa
+        precisión: 2 para "res53" si OUTPUT_BITS < 53, 1 si no.
+        """
+        return 2 if precision == "res53" and self.OUTPUT_BITS < 53 else 1
+
+    def check_period(self, Nuniforms: int, precision: str = "float64") -> None:
+        """
+        Verifica que Nuniforms uniformes de uniform_block con esa precisión
+        no den la vuelta al período: si lo hicieran, se repetirían los mismos
+        números y las estimaciones dejarían de ser independientes.
+
+        Raises:
+            Exception: Si las salidas necesarias superan PERIOD
+        """
+        needed = Nuniforms * self.draws_per_uniform(precision)
+        if self.PERIOD is not None and needed > self.PERIOD:
+            raise Exception(f"Error: se necesitan {needed} salidas de {self.name()}, "
+                            f"más que su período ({self.PERIOD})")
+
+    def uniform_block(self, Nsamples: int, precision: str = "float64",
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Uniformes en [0, 1) en bloque con la precisión elegida:
+
+        - "float64": los valores de rand01_block (a lo sumo OUTPUT_BITS bits).
+        - "res53": dobles con 53 bits aleatorios, combinando los bits altos de
+          dos salidas (27 + 26 bits, como genrand_res53 del Mersenne Twister),
+          o de una sola si el generador da al menos 53 bits.
+        - "float32": 24 bits aleatorios en float32, la mitad de memoria.
+
+        Es el punto de entrada en bloque que usan MonteCarlo y Variates, y
+        cuenta las salidas consumidas si hay instrumentación activa.
+
+        Args:
+            Nsamples (int): Cantidad de uniformes a generar
+            precision (str): "float64", "res53" o "float32"
+            out (Optional[np.ndarray]): arreglo de largo Nsamples (float32 para
+            "float32", float64 si no) donde escribir las uniformes, en lugar
+            de asignar uno nuevo (ver BlockPipeline)
+
+        Raises:
+            ValueError: Si la precisión no es una de RNG.PRECISIONS
+
+        Returns:
+            np.ndarray: arreglo de uniformes en [0, 1)
+        """
+        bits = self.OUTPUT_BITS
+        if precision == "float64":
+            Instrumentation.count_draws(self, Nsamples)
+            return self.rand01_block(Nsamples, out=out)
+        if precision == "float32":
+            Instrumentation.count_draws(self, Nsamples)
+            high = self.next_block(Nsamples) >> np.uint64(bits - 24)
+            if out is None:
+                out = np.empty(Nsamples, dtype=np.float32)
+            # high < 2^24 es exacto en float32
+            out[...] = high
+            return np.multiply(out, np.float32(2 ** -24), out=out)
+        if precision == "res53":
+            if bits >= 53:
+                Instrumentation.count_draws(self, Nsamples)
+                return np.multiply(self.next_block(Nsamples) >> np.uint64(bits - 53), 2 ** -53, out=out)
+            Instrumentation.count_draws(self, 2 * Nsamples)
+            raw = self.next_block(2 * Nsamples).reshape(Nsamples, 2)
+            high = raw[:, 0] >> np.uint64(bits - 27)
+            low = raw[:, 1] >> np.uint64(bits - 26)
+            return np.multiply((high << np.uint64(26)) | low, 2 ** -53, out=out)
+        raise ValueError(f"Precisión desconocida: {precision}. Opciones: {self.PRECISIONS}")
+
     @abstractmethod
     def name(self) -> str:
         """
@@ -75,6 +225,9 @@ class RNG(ABC):
         if Nsamples < 3:
             raise ValueError("Se necesitan al menos 3 muestras.")
 
+        # Import diferido: los generadores no deben depender de matplotlib
+        import matplotlib.pyplot as plt
+
         values = [self.rand01() for _ in range(Nsamples)]
         x_values = values[:-2]
         y_values = values[1:-1]
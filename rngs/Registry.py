@@ -0,0 +1,55 @@
+from typing import Dict, Type
+from .RNG import RNG
+from .LCG import LCG
+from .Xorshift32 import Xorshift
+from .MersenneTwister import MersenneTwister
+from .PCG32 import PCG32
+from .Xoshiro128PlusPlus import Xoshiro128PlusPlus
+from .SplitMix64 import SplitMix64
+from .GeneratorPool import GeneratorPool
+
+
+class Registry:
+    """
+    Generadores que se comparan, por nombre. Es el registro que usan
+    Compare (Compare.RNGS) y los workers de Distributed para resolver el
+    generador de una tarea.
+    """
+
+    # Nombre -> clase (subclase de RNG)
+    RNGS: Dict[str, Type[RNG]] = {
+        "LCG": LCG,
+        "Xorshift": Xorshift,
+        "MersenneTwister": MersenneTwister,
+        "PCG32": PCG32,
+        "Xoshiro128++": Xoshiro128PlusPlus,
+        "SplitMix64": SplitMix64,
+    }
+
+    @staticmethod
+    def get(name: str) -> Type[RNG]:
+        """
+        Clase del generador registrado con ese nombre.
+
+        Raises:
+            ValueError: Si no hay un generador con ese nombre
+        """
+        if name not in Registry.RNGS:
+            raise ValueError(f"Generador desconocido: {name}. Opciones: {list(Registry.RNGS)}")
+        return Registry.RNGS[name]
+
+    @staticmethod
+    def init_rngs(seed: int) -> Dict[str, RNG]:
+        """
+        Inicializa todos los generadores registrados con la misma seed, para
+        comparaciones justas. Los estados inicializados se reutilizan entre
+        llamadas (ver GeneratorPool).
+
+        Args:
+            seed (int): valor fijo para comparar generadores
+
+        Returns:
+            Dict[str, RNG]: generadores inicializados, por nombre
+        """
+        return {name: GeneratorPool.get(rng_class, seed)
+                for name, rng_class in Registry.RNGS.items()}
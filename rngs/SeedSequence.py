@@ -0,0 +1,125 @@
+import hashlib
+import secrets
+from typing import List, Optional, Tuple, Type
+from .RNG import RNG
+
+
+class SeedSequence:
+    """
+    Deriva semillas independientes y reproducibles a partir de una entropía
+    raíz, al estilo de numpy.random.SeedSequence. Cada nodo se identifica por
+    (entropía, spawn_key) y sus hijos agregan su índice al spawn_key, así se
+    pueden crear árboles de semillas para pools de hilos o procesos sin
+    compartir estado mutable: un nodo es inmutable y se puede enviar a otro
+    proceso.
+
+    Los estados se obtienen hasheando (BLAKE2b) la entropía, el spawn_key y un
+    contador, por lo que semillas cercanas (ej: 1 y 2) dan estados sin relación.
+    """
+
+    def __init__(self, entropy: Optional[int] = None, spawn_key: Tuple[int, ...] = ()):
+        if entropy is None:
+            entropy = secrets.randbits(128)
+        if entropy < 0:
+            raise ValueError("La entropía debe ser un entero no negativo.")
+        self._entropy = entropy
+        self._spawn_key = tuple(spawn_key)
+        self._n_children_spawned = 0
+
+    @property
+    def entropy(self) -> int:
+        return self._entropy
+
+    @property
+    def spawn_key(self) -> Tuple[int, ...]:
+        return self._spawn_key
+
+    def spawn(self, n_children: int) -> List["SeedSequence"]:
+        """
+        Crea n_children nodos hijos. Llamadas sucesivas continúan la
+        numeración, así nunca se repite un hijo.
+
+        Args:
+            n_children (int): Cantidad de hijos a crear
+
+        Returns:
+            List[SeedSequence]: nodos hijos
+        """
+        start = self._n_children_spawned
+        self._n_children_spawned += n_children
+        return [SeedSequence(self._entropy, self._spawn_key + (i,))
+                for i in range(start, start + n_children)]
+
+    def child(self, index: int) -> "SeedSequence":
+        """
+        Devuelve el hijo de índice dado, sin depender de cuántos se crearon
+        antes (útil para que cada worker derive el suyo).
+
+        Args:
+            index (int): índice del hijo
+
+        Returns:
+            SeedSequence: nodo hijo
+        """
+        return SeedSequence(self._entropy, self._spawn_key + (index,))
+
+    def generate_state(self, n_words: int) -> List[int]:
+        """
+        Genera n_words palabras de 32 bits bien mezcladas para este nodo.
+
+        Args:
+            n_words (int): cantidad de palabras
+
+        Returns:
+            List[int]: palabras de 32 bits
+        """
+        prefix = f"{self._entropy}:{','.join(map(str, self._spawn_key))}:".encode()
+        words = []
+        counter = 0
+        while len(words) < n_words:
+            digest = hashlib.blake2b(prefix + str(counter).encode(), digest_size=64).digest()
+            words.extend(int.from_bytes(digest[i:i + 4], "little") for i in range(0, 64, 4))
+            counter += 1
+        return words[:n_words]
+
+    def generate_seed(self, rng_class: Type[RNG]) -> int:
+        """
+        Genera una semilla válida para rng_class: un entero en
+        [1, rng_class.SEED_BOUND), nunca el estado prohibido 0.
+
+        Args:
+            rng_class (Type[RNG]): subclase de RNG a sembrar
+
+        Returns:
+            int: semilla
+        """
+        high, low = self.generate_state(2)
+        return 1 + ((high << 32) | low) % (rng_class.SEED_BOUND - 1)
+
+    def make_rng(self, rng_class: Type[RNG]) -> RNG:
+        """
+        Crea un generador de la clase dada sembrado con este nodo.
+
+        Args:
+            rng_class (Type[RNG]): subclase de RNG a instanciar
+
+        Returns:
+            RNG: generador sembrado
+        """
+        return rng_class(self.generate_seed(rng_class))
+
+    def spawn_rngs(self, rng_class: Type[RNG], n_children: int) -> List[RNG]:
+        """
+        Crea n_children generadores independientes, uno por hijo.
+
+        Args:
+            rng_class (Type[RNG]): subclase de RNG a instanciar
+            n_children (int): cantidad de generadores
+
+        Returns:
+            List[RNG]: generadores sembrados
+        """
+        return [child.make_rng(rng_class) for child in self.spawn(n_children)]
+
+    def __repr__(self) -> str:
+        return f"SeedSequence(entropy={self._entropy}, spawn_key={self._spawn_key})"
@@ -0,0 +1,103 @@
+from typing import Optional
+import numpy as np
+from time import time
+from .RNG import RNG
+
+
+class SplitMix64(RNG):
+    """
+    Generador SplitMix64 (Steele, Lea y Flood, 2014). El estado avanza sumando
+    una constante (secuencia de Weyl) y cada salida es una mezcla del estado,
+    así que la salida i depende solo de seed + (i+1)*GAMMA: el bloque se
+    vectoriza directamente y el salto es una suma.
+    """
+
+    SEED_BOUND = 2 ** 64
+    OUTPUT_BITS = 64
+    PERIOD = 2 ** 64
+
+    GAMMA = 0x9E3779B97F4A7C15          # Incremento de la secuencia de Weyl
+    MIX_MULTIPLIER_1 = 0xBF58476D1CE4E5B9
+    MIX_MULTIPLIER_2 = 0x94D049BB133111EB
+    MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(self, seed: int = int(time())):
+        super().__init__(seed)
+        self.set_seed(seed)
+
+    def set_seed(self, seed: int) -> None:
+        self._seed = seed
+        self._state = seed & self.MASK_64
+
+    @staticmethod
+    def mix(z: int) -> int:
+        """
+        Función de mezcla de SplitMix64 sobre un entero de 64 bits
+        """
+        z = ((z ^ (z >> 30)) * SplitMix64.MIX_MULTIPLIER_1) & SplitMix64.MASK_64
+        z = ((z ^ (z >> 27)) * SplitMix64.MIX_MULTIPLIER_2) & SplitMix64.MASK_64
+        return z ^ (z >> 31)
+
+    def next(self) -> int:
+        """
+        Metódo que implementa el siguiente número de la secuencia en un
+        generador SplitMix64
+
+        Returns:
+            int: siguiente número (64 bits) en la secuencia
+        """
+        self._state = (self._state + self.GAMMA) & self.MASK_64
+        return self.mix(self._state)
+
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next: los estados son state + k*GAMMA (mod 2^64).
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        steps = np.arange(1, Nsamples + 1, dtype=np.uint64)
+        z = np.uint64(self._state) + steps * np.uint64(self.GAMMA)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(self.MIX_MULTIPLIER_1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(self.MIX_MULTIPLIER_2)
+        self.advance(Nsamples)
+        return z ^ (z >> np.uint64(31))
+
+    def advance(self, delta: int) -> None:
+        """
+        Salta delta salidas de la secuencia en O(1).
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+        """
+        self._state = (self._state + delta * self.GAMMA) & self.MASK_64
+
+    def rand01(self) -> float:
+        """
+        Uniforme en [0, 1) con los 53 bits altos de la salida
+        """
+        return (self.next() >> 11) / 2 ** 53
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples) >> np.uint64(11), 2 ** 53, out=out)
+
+    def log(self) -> None:
+        """
+        Metódo que muestra nombre y las variables que se instancian
+        en __init__
+        """
+        print("NOMBRE: SplitMix64")
+        print(f"estado: {self._state}")
+        print(f"seed: {self._seed}")
+
+    def name(self) -> str:
+        """
+        Devuelve el nombre del generador
+
+        Returns:
+            str: Nombre del generador SplitMix64
+        """
+        return "SplitMix64"
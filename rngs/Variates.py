@@ -0,0 +1,323 @@
+from math import erfc, exp, log, sqrt
+from typing import Callable
+import numpy as np
+from .RNG import RNG
+
+
+def _ziggurat_tables(f: Callable[[float], float], f_inv: Callable[[float], float],
+                     layers: int, r: float, v: float) -> np.ndarray:
+    """
+    Bordes x_0 > x_1 = r > ... > x_N = 0 de las capas del ziggurat: todas las
+    capas (y la base, de ancho x_0 = v / f(r)) tienen área v.
+    """
+    x = np.empty(layers + 1)
+    x[0] = v / f(r)
+    x[1] = r
+    for i in range(2, layers):
+        x[i] = f_inv(v / x[i - 1] + f(x[i - 1]))
+    x[layers] = 0.0
+    return x
+
+
+class Variates:
+    """
+    Generación vectorizada de variables no uniformes a partir de los bloques
+    de uniformes de cualquier RNG (uniform_block). Las uniformes se consumen en
+    orden, así los resultados son reproducibles para una misma seed.
+    """
+
+    # Ziggurat de Marsaglia y Tsang (2000) para la normal (128 capas)
+    NORMAL_LAYERS = 128
+    NORMAL_R = 3.442619855899
+    NORMAL_X = _ziggurat_tables(lambda x: exp(-0.5 * x * x),
+                                lambda y: sqrt(-2.0 * log(y)),
+                                NORMAL_LAYERS, NORMAL_R, 9.91256303526217e-3)
+
+    # Ziggurat para la exponencial (256 capas)
+    EXPONENTIAL_LAYERS = 256
+    EXPONENTIAL_R = 7.69711747013104972
+    EXPONENTIAL_X = _ziggurat_tables(lambda x: exp(-x),
+                                     lambda y: -log(y),
+                                     EXPONENTIAL_LAYERS, EXPONENTIAL_R, 3.949659822581572e-3)
+
+    @staticmethod
+    def _open_uniforms(rng: RNG, Nsamples: int) -> np.ndarray:
+        """
+        Uniformes en (0, 1], para poder tomar logaritmos.
+        """
+        return 1.0 - rng.uniform_block(Nsamples)
+
+    @staticmethod
+    def _ziggurat(rng: RNG, Nsamples: int, x: np.ndarray,
+                  f: Callable[[np.ndarray], np.ndarray],
+                  tail: Callable[[RNG, int], np.ndarray],
+                  symmetric: bool) -> np.ndarray:
+        """
+        Ziggurat vectorizado: genera candidatos por bloques y repite solo con
+        los rechazados. Cada candidato usa una uniforme para la capa y otra
+        para la abscisa; las cuñas y la cola consumen uniformes extra.
+        """
+        layers = len(x) - 1
+        result = np.empty(Nsamples)
+        filled = 0
+        while filled < Nsamples:
+            pending = Nsamples - filled
+            uniforms = rng.uniform_block(2 * pending).reshape(2, pending)
+            layer = (uniforms[0] * layers).astype(np.int64)
+            u = 2.0 * uniforms[1] - 1.0 if symmetric else uniforms[1]
+            candidates = u * x[layer]
+
+            # Rectángulo interior de cada capa: se acepta sin evaluar f
+            accepted = np.abs(u) < x[layer + 1] / x[layer]
+
+            # Cuñas: y uniforme entre f(x_i) y f(x_(i+1)), se acepta si y < f(x)
+            wedge = ~accepted & (layer > 0)
+            if wedge.any():
+                layer_w = layer[wedge]
+                heights = rng.uniform_block(int(wedge.sum()))
+                f_low, f_high = f(x[layer_w]), f(x[layer_w + 1])
+                accepted[wedge] = f_low + heights * (f_high - f_low) < f(candidates[wedge])
+
+            # Base: la cola más allá de r
+            base = ~accepted & (layer == 0)
+            if base.any():
+                tail_values = tail(rng, int(base.sum()))
+                if symmetric:
+                    tail_values = np.where(u[base] < 0, -tail_values, tail_values)
+                candidates[base] = tail_values
+                accepted[base] = True
+
+            values = candidates[accepted]
+            result[filled:filled + len(values)] = values
+            filled += len(values)
+        return result
+
+    @staticmethod
+    def _normal_tail(rng: RNG, Nsamples: int) -> np.ndarray:
+        """
+        Cola de la normal más allá de NORMAL_R (método de Marsaglia).
+        """
+        r = Variates.NORMAL_R
+        result = np.empty(Nsamples)
+        filled = 0
+        while filled < Nsamples:
+            pending = Nsamples - filled
+            uniforms = Variates._open_uniforms(rng, 2 * pending).reshape(2, pending)
+            x = -np.log(uniforms[0]) / r
+            y = -np.log(uniforms[1])
+            values = (r + x)[2 * y > x * x]
+            result[filled:filled + len(values)] = values
+            filled += len(values)
+        return result
+
+    @staticmethod
+    def normal_ziggurat(rng: RNG, Nsamples: int) -> np.ndarray:
+        """
+        Normales estándar por el método del ziggurat.
+
+        Args:
+            rng (RNG): Generador de uniformes
+            Nsamples (int): Cantidad de muestras
+
+        Returns:
+            np.ndarray: muestras N(0, 1)
+        """
+        return Variates._ziggurat(rng, Nsamples, Variates.NORMAL_X,
+                                  lambda x: np.exp(-0.5 * x * x),
+                                  Variates._normal_tail, symmetric=True)
+
+    @staticmethod
+    def exponential_ziggurat(rng: RNG, Nsamples: int, rate: float = 1.0) -> np.ndarray:
+        """
+        Exponenciales por el método del ziggurat.
+
+        Args:
+            rng (RNG): Generador de uniformes
+            Nsamples (int): Cantidad de muestras
+            rate (float): Parámetro λ de la exponencial
+
+        Returns:
+            np.ndarray: muestras Exp(λ)
+        """
+        r = Variates.EXPONENTIAL_R
+        # Por falta de memoria, la cola más allá de r es r + Exp(1)
+        tail = lambda rng, n: r - np.log(Variates._open_uniforms(rng, n))
+        values = Variates._ziggurat(rng, Nsamples, Variates.EXPONENTIAL_X,
+                                    lambda x: np.exp(-x), tail, symmetric=False)
+        return values / rate
+
+    @staticmethod
+    def normal_box_muller(rng: RNG, Nsamples: int) -> np.ndarray:
+        """
+        Normales estándar por el método de Box-Muller (referencia).
+
+        Args:
+            rng (RNG): Generador de uniformes
+            Nsamples (int): Cantidad de muestras
+
+        Returns:
+            np.ndarray: muestras N(0, 1)
+        """
+        pairs = (Nsamples + 1) // 2
+        uniforms = rng.uniform_block(2 * pairs).reshape(2, pairs)
+        radius = np.sqrt(-2.0 * np.log(1.0 - uniforms[0]))
+        angle = 2.0 * np.pi * uniforms[1]
+        values = np.concatenate((radius * np.cos(angle), radius * np.sin(angle)))
+        return values[:Nsamples]
+
+    @staticmethod
+    def normal_polar(rng: RNG, Nsamples: int) -> np.ndarray:
+        """
+        Normales estándar por el método polar de Marsaglia (referencia).
+
+        Args:
+            rng (RNG): Generador de uniformes
+            Nsamples (int): Cantidad de muestras
+
+        Returns:
+            np.ndarray: muestras N(0, 1)
+        """
+        result = np.empty(Nsamples)
+        filled = 0
+        while filled < Nsamples:
+            # Se aceptan π/4 de los pares, cada par da dos normales
+            pairs = int((Nsamples - filled) / 2 / (np.pi / 4)) + 1
+            v = 2.0 * rng.uniform_block(2 * pairs).reshape(2, pairs) - 1.0
+            s = v[0] ** 2 + v[1] ** 2
+            inside = (s > 0) & (s < 1)
+            factor = np.sqrt(-2.0 * np.log(s[inside]) / s[inside])
+            values = np.concatenate((v[0][inside] * factor, v[1][inside] * factor))
+            values = values[:Nsamples - filled]
+            result[filled:filled + len(values)] = values
+            filled += len(values)
+        return result
+
+    @staticmethod
+    def normal_ppf(p: np.ndarray) -> np.ndarray:
+        """
+        Inversa de la función de distribución normal estándar, vectorizada
+        (aproximación racional de Acklam, error relativo < 1.2e-9).
+
+        Args:
+            p (np.ndarray): probabilidades en (0, 1)
+
+        Returns:
+            np.ndarray: cuantiles Φ^(-1)(p)
+        """
+        a = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+             1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+        b = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+             6.680131188771972e+01, -1.328068155288572e+01]
+        c = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+             -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+        d = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+             3.754408661907416e+00]
+        p = np.asarray(p, dtype=float)
+        result = np.empty_like(p)
+
+        low = p < 0.02425
+        high = p > 1 - 0.02425
+        central = ~(low | high)
+
+        q = p[central] - 0.5
+        r = q * q
+        result[central] = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+                          (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+
+        for mask, sign, tail_p in ((low, 1.0, p[low]), (high, -1.0, 1 - p[high])):
+            q = np.sqrt(-2 * np.log(tail_p))
+            result[mask] = sign * (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+                           ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
+        return result
+
+    @staticmethod
+    def inverse_transform(rng: RNG, ppf: Callable[[np.ndarray], np.ndarray],
+                          Nsamples: int) -> np.ndarray:
+        """
+        Método de la transformada inversa: X = F^(-1)(U).
+
+        Args:
+            rng (RNG): Generador de uniformes
+            ppf (Callable[[np.ndarray], np.ndarray]): inversa vectorizada de F
+            Nsamples (int): Cantidad de muestras
+
+        Returns:
+            np.ndarray: muestras con distribución F
+        """
+        return ppf(rng.uniform_block(Nsamples))
+
+    @staticmethod
+    def truncated(rng: RNG, cdf: Callable[[float], float],
+                  ppf: Callable[[np.ndarray], np.ndarray],
+                  a: float, b: float, Nsamples: int) -> np.ndarray:
+        """
+        Muestras de F truncada a [a, b] por transformada inversa:
+        X = F^(-1)(F(a) + U (F(b) - F(a))), sin rechazos.
+
+        Args:
+            rng (RNG): Generador de uniformes
+            cdf (Callable[[float], float]): función de distribución F
+            ppf (Callable[[np.ndarray], np.ndarray]): inversa vectorizada de F
+            a (float): extremo inferior
+            b (float): extremo superior
+            Nsamples (int): Cantidad de muestras
+
+        Raises:
+            ValueError: Si a >= b
+
+        Returns:
+            np.ndarray: muestras de F condicionada a [a, b]
+        """
+        if a >= b:
+            raise ValueError("El intervalo de truncamiento debe cumplir a < b.")
+        low, high = cdf(a), cdf(b)
+        return ppf(low + rng.uniform_block(Nsamples) * (high - low))
+
+    @staticmethod
+    def truncated_normal(rng: RNG, a: float, b: float, Nsamples: int,
+                         mu: float = 0.0, sigma: float = 1.0) -> np.ndarray:
+        """
+        Normales N(mu, sigma^2) truncadas a [a, b] por transformada inversa.
+        Si el intervalo está en la cola derecha se muestrea la reflejada, para
+        no perder precisión con probabilidades cercanas a 1.
+
+        Args:
+            rng (RNG): Generador de uniformes
+            a (float): extremo inferior
+            b (float): extremo superior
+            Nsamples (int): Cantidad de muestras
+            mu (float): media
+            sigma (float): desvío estándar
+
+        Returns:
+            np.ndarray: muestras de la normal truncada
+        """
+        alpha, beta = (a - mu) / sigma, (b - mu) / sigma
+        if alpha > 0:
+            return mu - sigma * Variates.truncated_normal(rng, -beta, -alpha, Nsamples)
+        cdf = lambda x: 0.5 * erfc(-x / sqrt(2))
+        return mu + sigma * Variates.truncated(rng, cdf, Variates.normal_ppf,
+                                               alpha, beta, Nsamples)
+
+    @staticmethod
+    def truncated_exponential(rng: RNG, a: float, b: float, Nsamples: int,
+                              rate: float = 1.0) -> np.ndarray:
+        """
+        Exponenciales Exp(λ) truncadas a [a, b] por transformada inversa.
+
+        Args:
+            rng (RNG): Generador de uniformes
+            a (float): extremo inferior (>= 0)
+            b (float): extremo superior (puede ser np.inf)
+            Nsamples (int): Cantidad de muestras
+            rate (float): Parámetro λ de la exponencial
+
+        Returns:
+            np.ndarray: muestras de la exponencial truncada
+        """
+        if a >= b:
+            raise ValueError("El intervalo de truncamiento debe cumplir a < b.")
+        # Por falta de memoria alcanza con truncar Exp(λ) a [0, b - a]
+        mass = -np.expm1(-rate * (b - a))
+        uniforms = rng.uniform_block(Nsamples)
+        return a - np.log1p(-uniforms * mass) / rate
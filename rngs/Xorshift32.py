@@ -1,7 +1,17 @@
+from typing import Optional
+import numpy as np
 from .RNG import RNG
 from time import time
 
 class Xorshift(RNG):
+    # Recorre todos los estados de 32 bits salvo el 0
+    PERIOD = 2 ** 32 - 1
+    # Bloques más chicos que esto se generan con el método escalar: cada
+    # duplicación del bloque vectorizado hace 32 pasadas para aplicar T^L y
+    # otras 32 para elevarla al cuadrado, un costo fijo que a este tamaño
+    # recién se empata con el del método escalar
+    MIN_VECTOR_BLOCK = 8192
+
     def __init__(self, seed: int = int(time())):
         super().__init__(seed)
 
@@ -23,6 +33,84 @@ class Xorshift(RNG):
         self._seed = x & 0xFFFFFFFF
         return self._seed
     
+    @staticmethod
+    def _apply_linear(columns: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Aplica una transformación lineal sobre F₂³² a un arreglo de estados.
+
+        Args:
+            columns (np.ndarray): 32 columnas (uint32) de la matriz, donde
+            columns[j] es la imagen del vector con solo el bit j encendido.
+            x (np.ndarray): estados (uint32) a transformar
+
+        Returns:
+            np.ndarray: imagen de cada estado por la transformación
+        """
+        result = np.zeros_like(x)
+        for j in range(32):
+            bit = (x >> np.uint32(j)) & np.uint32(1)
+            result ^= (np.uint32(0) - bit) & columns[j]
+        return result
+
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next. Como xorshift32 es lineal sobre F₂³²,
+        x_(k+L) = T^L x_k: teniendo L valores se obtienen los L siguientes
+        aplicando T^L a todos a la vez, y T^(2L) se obtiene componiendo T^L
+        consigo misma, así el bloque se duplica en cada paso.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        if Nsamples < self.MIN_VECTOR_BLOCK:
+            return np.fromiter((self.next() for _ in range(Nsamples)),
+                               dtype=np.uint64, count=max(Nsamples, 0))
+        # El primer valor se calcula escalar por si la seed excede los 32 bits
+        values = np.array([self.next()], dtype=np.uint32)
+        basis = np.array([1 << j for j in range(32)], dtype=np.uint32)
+        jump = self._step_array(basis)
+        while len(values) < Nsamples:
+            t = min(len(values), Nsamples - len(values))
+            values = np.concatenate((values, self._apply_linear(jump, values[:t])))
+            jump = self._apply_linear(jump, jump)
+        self._seed = int(values[-1])
+        return values.astype(np.uint64)
+
+    def advance(self, delta: int) -> None:
+        """
+        Saltea delta salidas en O(log delta): aplica T^delta al estado, con
+        T^(2^i) obtenida por cuadrados sucesivos como en next_block.
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+        """
+        if delta <= 0:
+            return
+        # El primer paso es escalar por si la seed excede los 32 bits
+        self.next()
+        delta -= 1
+        state = np.array([self._seed], dtype=np.uint32)
+        jump = self._step_array(np.array([1 << j for j in range(32)], dtype=np.uint32))
+        while delta:
+            if delta & 1:
+                state = self._apply_linear(jump, state)
+            jump = self._apply_linear(jump, jump)
+            delta >>= 1
+        self._seed = int(state[0])
+
+    @staticmethod
+    def _step_array(x: np.ndarray) -> np.ndarray:
+        """
+        Un paso de xorshift32 aplicado a un arreglo de estados (uint32)
+        """
+        x = x ^ (x << np.uint32(13))
+        x = x ^ (x >> np.uint32(17))
+        x = x ^ (x << np.uint32(5))
+        return x
+
     def log(self) -> None:
         """
         Metódo que muestra nombre y las variables que se instancian
@@ -33,6 +121,9 @@ class Xorshift(RNG):
 
     def rand01(self):
         return self.next() /(2 ** 32)
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples), 2 ** 32, out=out)
     
     def name(self) -> str:
         """
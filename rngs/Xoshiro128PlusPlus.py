@@ -0,0 +1,234 @@
+from typing import Optional
+import numpy as np
+from time import time
+from .RNG import RNG
+from .SplitMix64 import SplitMix64
+
+
+class Xoshiro128PlusPlus(RNG):
+    """
+    Generador xoshiro128++ (Blackman y Vigna, 2019): estado de 128 bits (cuatro
+    palabras de 32 bits) con transición lineal sobre F₂, y salida
+    rotl(s0 + s3, 7) + s0.
+
+    Para el bloque vectorizado se reparte la secuencia en carriles: el carril i
+    empieza en la posición i*K (usando T^K, la transición elevada a K, que se
+    guarda en caché para K potencia de 2) y todos los carriles avanzan K pasos
+    a la vez.
+    """
+
+    MASK_32 = 0xFFFFFFFF
+    STATE_BITS = 128
+    PERIOD = 2 ** 128 - 1
+
+    # Polinomios de salto de la implementación de referencia
+    JUMP = (0x8764000B, 0xF542D2D3, 0x6FA035C3, 0x77F2DB5B)        # 2^64 pasos
+    LONG_JUMP = (0xB523952E, 0x0B6F099F, 0xCCF5A0EF, 0x1C580662)   # 2^96 pasos
+
+    # Bloques más chicos que esto se generan con el método escalar
+    MIN_VECTOR_BLOCK = 64
+
+    # _POWERS[i]: columnas de T^(2^i), como arreglo (128, 4) uint32
+    _POWERS = []
+
+    def __init__(self, seed: int = int(time())):
+        super().__init__(seed)
+        self.set_seed(seed)
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Inicializa las cuatro palabras del estado con dos salidas de
+        SplitMix64(seed), como recomiendan los autores. El estado nunca es nulo.
+        """
+        self._seed = seed
+        splitmix = SplitMix64(seed)
+        first, second = splitmix.next(), splitmix.next()
+        self._s = [first & self.MASK_32, first >> 32, second & self.MASK_32, second >> 32]
+        if not any(self._s):
+            self._s[0] = 1
+
+    @staticmethod
+    def _rotl(x: int, k: int) -> int:
+        return ((x << k) | (x >> (32 - k))) & Xoshiro128PlusPlus.MASK_32
+
+    def next(self) -> int:
+        """
+        Metódo que implementa el siguiente número de la secuencia en un
+        generador xoshiro128++
+
+        Returns:
+            int: siguiente número (32 bits) en la secuencia
+        """
+        s0, s1, s2, s3 = self._s
+        result = (self._rotl((s0 + s3) & self.MASK_32, 7) + s0) & self.MASK_32
+        t = (s1 << 9) & self.MASK_32
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        s3 = self._rotl(s3, 11)
+        self._s = [s0, s1, s2, s3]
+        return result
+
+    @staticmethod
+    def _rotl_array(x: np.ndarray, k: int) -> np.ndarray:
+        return (x << np.uint32(k)) | (x >> np.uint32(32 - k))
+
+    @staticmethod
+    def _step_array(states: np.ndarray) -> np.ndarray:
+        """
+        Un paso de la transición aplicado a un arreglo (n, 4) uint32 de estados
+        """
+        s0, s1, s2, s3 = (states[:, i].copy() for i in range(4))
+        t = s1 << np.uint32(9)
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        s3 = Xoshiro128PlusPlus._rotl_array(s3, 11)
+        return np.stack((s0, s1, s2, s3), axis=1)
+
+    @staticmethod
+    def _output_array(states: np.ndarray) -> np.ndarray:
+        s0, s3 = states[:, 0], states[:, 3]
+        return Xoshiro128PlusPlus._rotl_array(s0 + s3, 7) + s0
+
+    @staticmethod
+    def _apply_linear(columns: np.ndarray, states: np.ndarray) -> np.ndarray:
+        """
+        Aplica una transformación lineal sobre F₂¹²⁸ (dada por sus 128
+        columnas) a un arreglo (n, 4) de estados.
+        """
+        result = np.zeros_like(states)
+        for j in range(Xoshiro128PlusPlus.STATE_BITS):
+            word, bit = divmod(j, 32)
+            mask = np.uint32(0) - ((states[:, word] >> np.uint32(bit)) & np.uint32(1))
+            result ^= mask[:, None] & columns[j]
+        return result
+
+    @classmethod
+    def _power(cls, exponent: int) -> np.ndarray:
+        """
+        Columnas de T^(2^exponent), calculadas por cuadrados sucesivos y
+        guardadas en caché.
+        """
+        if not cls._POWERS:
+            basis = np.zeros((cls.STATE_BITS, 4), dtype=np.uint32)
+            for j in range(cls.STATE_BITS):
+                basis[j, j // 32] = np.uint32(1 << (j % 32))
+            cls._POWERS.append(cls._step_array(basis))
+        while len(cls._POWERS) <= exponent:
+            last = cls._POWERS[-1]
+            cls._POWERS.append(cls._apply_linear(last, last))
+        return cls._POWERS[exponent]
+
+    def next_block(self, Nsamples: int) -> np.ndarray:
+        """
+        Versión vectorizada de next con carriles: L carriles separados por
+        K = 2^k posiciones avanzan K pasos en paralelo, y la salida se lee
+        carril por carril.
+
+        Args:
+            Nsamples (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: arreglo (uint64) con los siguientes números de la secuencia
+        """
+        if Nsamples < self.MIN_VECTOR_BLOCK:
+            return np.fromiter((self.next() for _ in range(Nsamples)),
+                               dtype=np.uint64, count=Nsamples)
+
+        exponent = max(0, int(np.log2(Nsamples)) // 2)
+        step_count = 2 ** exponent
+        lanes = -(-Nsamples // step_count)
+
+        # Estados iniciales de los carriles: duplicando con T^K, T^2K, ...
+        states = np.array([self._s], dtype=np.uint32)
+        level = exponent
+        while len(states) < lanes:
+            t = min(len(states), lanes - len(states))
+            states = np.concatenate((states, self._apply_linear(self._power(level), states[:t])))
+            level += 1
+
+        final_lane, final_step = divmod(Nsamples, step_count)
+        final_state = None
+        outputs = np.empty((lanes, step_count), dtype=np.uint32)
+        for j in range(step_count):
+            if j == final_step and final_lane < lanes:
+                final_state = states[final_lane]
+            outputs[:, j] = self._output_array(states)
+            states = self._step_array(states)
+        if final_state is None:
+            final_state = states[-1]
+
+        self._s = [int(x) for x in final_state]
+        return outputs.ravel()[:Nsamples].astype(np.uint64)
+
+    def advance(self, delta: int) -> None:
+        """
+        Saltea delta salidas en O(log delta): aplica al estado las potencias
+        T^(2^i) (en caché, ver _power) de los bits encendidos de delta.
+
+        Args:
+            delta (int): cantidad de salidas a saltear
+        """
+        state = np.array([self._s], dtype=np.uint32)
+        exponent = 0
+        while delta > 0:
+            if delta & 1:
+                state = self._apply_linear(self._power(exponent), state)
+            delta >>= 1
+            exponent += 1
+        self._s = [int(x) for x in state[0]]
+
+    def _jump_with(self, polynomial: tuple) -> None:
+        """
+        Salto de referencia: combina los estados según el polinomio de salto.
+        """
+        accumulated = [0, 0, 0, 0]
+        for word in polynomial:
+            for b in range(32):
+                if word & (1 << b):
+                    accumulated = [a ^ s for a, s in zip(accumulated, self._s)]
+                self.next()
+        self._s = accumulated
+
+    def jump(self) -> None:
+        """
+        Avanza 2^64 posiciones: genera 2^64 subsecuencias disjuntas para
+        cálculos en paralelo.
+        """
+        self._jump_with(self.JUMP)
+
+    def long_jump(self) -> None:
+        """
+        Avanza 2^96 posiciones: genera 2^32 puntos de partida, cada uno con
+        2^32 subsecuencias disponibles vía jump.
+        """
+        self._jump_with(self.LONG_JUMP)
+
+    def rand01(self) -> float:
+        return self.next() / (2 ** 32)
+
+    def rand01_block(self, Nsamples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.divide(self.next_block(Nsamples), 2 ** 32, out=out)
+
+    def log(self) -> None:
+        """
+        Metódo que muestra nombre y las variables que se instancian
+        en __init__
+        """
+        print("NOMBRE: xoshiro128++")
+        print(f"estado: {self._s}")
+        print(f"seed: {self._seed}")
+
+    def name(self) -> str:
+        """
+        Devuelve el nombre del generador
+
+        Returns:
+            str: Nombre del generador xoshiro128++
+        """
+        return "Xoshiro128++"
@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+from typing import Dict, List, Optional
+from Distributed import Distributed, Coordinator
+from analysis.Compare import Compare
+
+
+class DistributedCheck:
+    """
+    Verificación local del modo coordinador/workers: levanta workers en
+    procesos de esta máquina (TCP y sockets Unix), algunos de los cuales se
+    caen a propósito, y compara el resultado con la corrida en un solo
+    proceso (que debe ser idéntico gracias a los reintentos).
+
+    Los workers que se caen corren este módulo, que envuelve
+    Distributed.execute para terminar el proceso tras atender una cantidad
+    de tareas:
+
+        python -m tests.DistributedCheck --listen tcp://127.0.0.1:0 --fail-after 2
+    """
+
+    NSAMPLES = 600_000
+    SEED = 7
+    D = 3
+    CHUNK = 2 ** 16
+
+    @staticmethod
+    def failing_execute(fail_after: int):
+        """
+        Distributed.execute que termina el proceso abruptamente (como una
+        máquina que se cae) al recibir la tarea número fail_after + 1.
+        """
+        handled = [0]
+        lock = threading.Lock()
+
+        def execute(task: Dict) -> Dict:
+            with lock:
+                if handled[0] >= fail_after:
+                    os._exit(1)
+                handled[0] += 1
+            return Distributed.execute(task)
+
+        return execute
+
+    @staticmethod
+    def worker_commands(fail_after: List[Optional[int]]) -> List[List[str]]:
+        """
+        Comandos para Distributed.spawn_workers: los workers con fail_after
+        corren este módulo, el resto el worker normal.
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return [[sys.executable, os.path.join(root, "Distributed.py")] if fail is None
+                else [sys.executable, "-m", "tests.DistributedCheck", "--fail-after", str(fail)]
+                for fail in fail_after]
+
+    @staticmethod
+    def check() -> Dict[str, bool]:
+        """
+        Compara Compare.distributed_stats local con workers remotos que se
+        caen, por TCP y por sockets Unix, y verifica que una tarea inválida
+        agote sus reintentos y que sin workers la corrida falle.
+
+        Returns:
+            Dict[str, bool]: resultado de cada verificación
+        """
+        args = (DistributedCheck.NSAMPLES, DistributedCheck.SEED, DistributedCheck.D)
+        local = Compare.distributed_stats(*args, chunk=DistributedCheck.CHUNK)
+        report = {}
+
+        for transport, fail_after in (("tcp", [None, 2]), ("unix", [1, None, None])):
+            workers = Distributed.spawn_workers(len(fail_after), transport,
+                                                DistributedCheck.worker_commands(fail_after))
+            try:
+                remote = Compare.distributed_stats(*args, addresses=[a for a, _ in workers],
+                                                   chunk=DistributedCheck.CHUNK)
+                report[f"{transport}_with_crash"] = remote == local
+            finally:
+                Distributed.stop_workers(workers)
+
+        tasks = Distributed.make_tasks("LCG", 1, 1000, 2)
+        tasks[0]["integrand"] = "desconocido"
+        workers = Distributed.spawn_workers(1)
+        try:
+            Coordinator([a for a, _ in workers]).run(tasks)
+            report["retries_exhausted"] = False
+        except Exception as e:
+            report["retries_exhausted"] = "falló" in str(e)
+        finally:
+            Distributed.stop_workers(workers)
+
+        try:
+            Coordinator(["tcp://127.0.0.1:1"]).run(tasks)
+            report["no_workers"] = False
+        except Exception as e:
+            report["no_workers"] = "no quedan workers" in str(e)
+        return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Worker que se cae tras atender algunas tareas")
+    parser.add_argument("--listen", required=True, help="tcp://host:puerto o unix:///ruta")
+    parser.add_argument("--fail-after", type=int, required=True,
+                        help="termina abruptamente tras atender esta cantidad de tareas")
+    args = parser.parse_args()
+    Distributed.serve(args.listen,
+                      ready=lambda address: print(f"LISTENING {address}", flush=True),
+                      execute=DistributedCheck.failing_execute(args.fail_after))
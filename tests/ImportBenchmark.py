@@ -0,0 +1,87 @@
+import os
+import sys
+import subprocess
+from typing import Dict, List
+from constants import IMPORT_TIME_BUDGET
+
+
+class ImportBenchmark:
+    """
+    Mide el tiempo de importación de los módulos de cómputo en procesos nuevos,
+    como los que levanta un pool de procesos, y verifica que no carguen
+    dependencias de graficado ni scipy.
+    """
+
+    HEADLESS_MODULES = [
+        "rngs.LCG",
+        "rngs.Xorshift32",
+        "rngs.MersenneTwister",
+        "MonteCarlo",
+        "Utils",
+        "analysis.Compare",
+    ]
+    HEAVY_MODULES = ["matplotlib", "scipy", "seaborn"]
+
+    @staticmethod
+    def import_time(module: str, Nsim: int = 5) -> Dict[str, object]:
+        """
+        Importa un módulo en un intérprete nuevo y mide cuánto demora.
+
+        Args:
+            module (str): Nombre del módulo a importar (ej: "rngs.LCG")
+            Nsim (int): Número de repeticiones, se queda con la mínima
+
+        Returns:
+            Dict[str, object]: Diccionario con el tiempo mínimo de importación
+            en segundos y la lista de módulos pesados que quedaron cargados.
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"import {module}\n"
+            "print(time.perf_counter() - start)\n"
+            f"print(','.join(m for m in {ImportBenchmark.HEAVY_MODULES!r} if m in sys.modules))\n"
+        )
+        times = []
+        loaded = []
+        for _ in range(Nsim):
+            output = subprocess.run([sys.executable, "-c", code], cwd=root,
+                                    capture_output=True, text=True, check=True).stdout
+            elapsed, heavy = output.splitlines()
+            times.append(float(elapsed))
+            loaded = heavy.split(",") if heavy else []
+        return {"time": min(times), "heavy_modules": loaded}
+
+    @staticmethod
+    def check_startup_budget(modules: List[str] = None,
+                             budget: float = IMPORT_TIME_BUDGET) -> Dict[str, float]:
+        """
+        Verifica que cada módulo de cómputo se importe dentro del presupuesto
+        de tiempo y sin cargar matplotlib, seaborn ni scipy.
+
+        Args:
+            modules (List[str], optional): Módulos a medir. Por defecto
+            HEADLESS_MODULES.
+            budget (float): Tiempo máximo de importación en segundos
+
+        Raises:
+            Exception: Si algún módulo excede el presupuesto o carga un
+            módulo pesado.
+
+        Returns:
+            Dict[str, float]: Tiempo de importación por módulo.
+        """
+        if modules is None:
+            modules = ImportBenchmark.HEADLESS_MODULES
+
+        times = {}
+        for module in modules:
+            result = ImportBenchmark.import_time(module)
+            if result["heavy_modules"]:
+                raise Exception(f"Error: {module} importa {', '.join(result['heavy_modules'])}")
+            if result["time"] > budget:
+                raise Exception(f"Error: {module} tarda {result['time']:.3f}s en importarse "
+                                f"(presupuesto {budget}s)")
+            times[module] = result["time"]
+        return times
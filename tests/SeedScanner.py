@@ -0,0 +1,108 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+import numpy as np
+from constants import MAX_BLOCK_SIZE
+from rngs.RNG import RNG
+from tests.TestHelpers import TestHelpers
+
+
+class SeedScanner:
+    """
+    Barrido de uniformidad sobre muchas semillas: para un generador y miles
+    de semillas arma la matriz (semillas x n) de a bloques de filas, calcula
+    por fila los estadísticos de Kolmogorov-Smirnov y chi-cuadrado de forma
+    vectorizada, reparte los bloques en un pool de procesos y resume la
+    distribución de los p-valores y las peores semillas.
+
+    Si el generador es bueno, los p-valores de todas las semillas deberían
+    ser uniformes en [0, 1]; eso se mide con un KS de segundo nivel.
+    """
+
+    # Intervalos del test chi-cuadrado
+    DEFAULT_BINS = 100
+    # Intervalos del histograma de p-valores
+    PVALUE_BINS = 10
+
+    @staticmethod
+    def _scan_block(rng_class: Type[RNG], seeds: List[int], Nsamples: int,
+                    Nbins: int, precision: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Estadísticos KS y chi-cuadrado de un bloque de semillas (corre en un worker).
+        """
+        dtype = np.float32 if precision == "float32" else np.float64
+        samples = np.empty((len(seeds), Nsamples), dtype=dtype)
+        # Cada semilla se usa una sola vez: construir el generador directo es
+        # más barato que pasar por GeneratorPool (clonar y desalojar su caché)
+        for row, seed in enumerate(seeds):
+            samples[row] = rng_class(seed).uniform_block(Nsamples, precision)
+        chi_square = TestHelpers.chi_square_rows(samples, Nbins)
+        samples.sort(axis=1)
+        return TestHelpers.KS_statistic_rows(samples), chi_square
+
+    @staticmethod
+    def scan(rng_class: Type[RNG], seeds: Iterable[int], Nsamples: int,
+             Nbins: int = DEFAULT_BINS, Nworkers: Optional[int] = None,
+             max_block: int = MAX_BLOCK_SIZE, precision: str = "float64",
+             Nworst: int = 10) -> Dict[str, object]:
+        """
+        Test de uniformidad de las primeras Nsamples salidas de rng_class
+        para cada semilla.
+
+        Args:
+            rng_class (Type[RNG]): clase del generador
+            seeds (Iterable[int]): semillas a barrer (ej: range(1, 5001))
+            Nsamples (int): uniformes por semilla
+            Nbins (int): intervalos del test chi-cuadrado. Se achica para que
+            cada intervalo espere al menos 5 muestras.
+            Nworkers (Optional[int]): procesos del pool. Con 1 corre en este
+            proceso. Por defecto, los de ProcessPoolExecutor.
+            max_block (int): máximo de uniformes por bloque de semillas
+            precision (str): precisión de las uniformes (ver RNG.uniform_block)
+            Nworst (int): cantidad de peores semillas a reportar
+
+        Returns:
+            Dict[str, object]: diccionario con las semillas, los estadísticos
+            y p-valores de cada una ("ks_statistic", "ks_pvalue",
+            "chi2_statistic", "chi2_pvalue"), el histograma de p-valores de
+            cada test, el p-valor del KS de segundo nivel sobre los p-valores
+            y las Nworst semillas con menor p-valor.
+        """
+        # Import diferido: scipy solo se carga al usarse
+        from scipy.stats import chi2, kstest, kstwo
+
+        seeds = list(seeds)
+        Nbins = max(2, min(Nbins, Nsamples // 5))
+        rows = max(1, max_block // Nsamples)
+        blocks = [seeds[i:i + rows] for i in range(0, len(seeds), rows)]
+        args = (Nsamples, Nbins, precision)
+
+        if Nworkers == 1:
+            results = [SeedScanner._scan_block(rng_class, block, *args) for block in blocks]
+        else:
+            with ProcessPoolExecutor(Nworkers) as pool:
+                results = list(pool.map(SeedScanner._scan_block,
+                                        [rng_class] * len(blocks), blocks,
+                                        *[[arg] * len(blocks) for arg in args]))
+
+        ks_statistic = np.concatenate([ks for ks, _ in results])
+        chi2_statistic = np.concatenate([chi for _, chi in results])
+        ks_pvalue = kstwo.sf(ks_statistic, Nsamples)
+        chi2_pvalue = chi2.sf(chi2_statistic, Nbins - 1)
+
+        worst = np.argsort(np.minimum(ks_pvalue, chi2_pvalue))[:Nworst]
+        return {
+            "seeds": seeds,
+            "ks_statistic": ks_statistic,
+            "ks_pvalue": ks_pvalue,
+            "chi2_statistic": chi2_statistic,
+            "chi2_pvalue": chi2_pvalue,
+            "ks_histogram": np.histogram(ks_pvalue, SeedScanner.PVALUE_BINS, (0, 1))[0].tolist(),
+            "chi2_histogram": np.histogram(chi2_pvalue, SeedScanner.PVALUE_BINS, (0, 1))[0].tolist(),
+            "ks_uniformity_pvalue": float(kstest(ks_pvalue, "uniform").pvalue),
+            "chi2_uniformity_pvalue": float(kstest(chi2_pvalue, "uniform").pvalue),
+            "worst_seeds": [
+                {"seed": seeds[i], "ks_pvalue": float(ks_pvalue[i]),
+                 "chi2_pvalue": float(chi2_pvalue[i])}
+                for i in worst
+            ],
+        }
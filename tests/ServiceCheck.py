@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from typing import Dict
+from Service import EstimationService, ServiceClient
+from analysis.Compare import Compare
+
+
+class ServiceCheck:
+    """
+    Verificación local de EstimationService con el cliente en proceso
+    (ServiceClient): unión de pedidos concurrentes, aciertos del caché con
+    claves normalizadas (y rechazo de valores no enteros), igualdad con Compare.distributed_stats, streaming
+    y que la cancelación de un job no deje pedidos esperando.
+    """
+
+    RNG = "PCG32"
+    SEED = 3
+    D = 2
+    NSAMPLES = 200_000
+    CHUNK = 2 ** 16
+
+    @staticmethod
+    def check(Nthreads: int = 4, Nworkers: int = 2) -> Dict[str, bool]:
+        """
+        Lanza Nthreads pedidos idénticos a la vez desde hilos distintos.
+
+        Returns:
+            Dict[str, bool]: resultado de cada verificación
+        """
+        args = (ServiceCheck.RNG, ServiceCheck.SEED, ServiceCheck.D, ServiceCheck.NSAMPLES)
+        expected = Compare.distributed_stats(ServiceCheck.NSAMPLES, ServiceCheck.SEED,
+                                             ServiceCheck.D, chunk=ServiceCheck.CHUNK)[ServiceCheck.RNG]
+        expected = {"n": ServiceCheck.NSAMPLES, **expected}
+
+        with ServiceClient(Nworkers, chunk=ServiceCheck.CHUNK) as client:
+            barrier = threading.Barrier(Nthreads)
+            results = [None] * Nthreads
+
+            def request(i: int) -> None:
+                barrier.wait()
+                results[i] = client.estimate(*args)
+
+            threads = [threading.Thread(target=request, args=(i,)) for i in range(Nthreads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            concurrent = client.cache_info()
+
+            # Misma clave con números float: debe ser un acierto del caché
+            cached = client.estimate(args[0], float(args[1]), args[2], float(args[3]))
+            partials = list(client.stream(*args))
+            cache = client.cache_info()
+
+            # Cortar un stream antes de tiempo no debe dejar el generador abierto
+            stream = client.stream(args[0], args[1] + 1, args[2], args[3])
+            next(stream)
+            stream.close()
+            after_close = client.estimate(args[0], args[1] + 1, args[2], args[3])
+
+            # Un Nsamples no entero se rechaza en lugar de truncarse a la misma clave
+            try:
+                client.estimate(args[0], args[1], args[2], args[3] + 0.5)
+                rejected = False
+            except Exception as e:
+                rejected = "entero" in str(e)
+
+        return {
+            "coalesced": concurrent["misses"] == 1 and concurrent["coalesced"] == Nthreads - 1,
+            "identical": all(result == expected for result in results),
+            "cache_hit": cached == expected and cache["hits"] == 2 and cache["misses"] == 1,
+            "stream": len(partials) == -(-ServiceCheck.NSAMPLES // ServiceCheck.CHUNK)
+                      and partials[-1] == expected,
+            "early_close": after_close["n"] == ServiceCheck.NSAMPLES,
+            "non_integral": rejected,
+        }
+
+    @staticmethod
+    def check_cancellation(timeout: float = 30.0) -> bool:
+        """
+        Cancela el job de un pedido con otro pedido unido: ambos deben
+        terminar con error en lugar de esperar para siempre.
+        """
+        async def run() -> bool:
+            async with EstimationService(1, chunk=ServiceCheck.CHUNK) as service:
+                args = (ServiceCheck.RNG, ServiceCheck.SEED, ServiceCheck.D, ServiceCheck.NSAMPLES)
+                waiters = [asyncio.ensure_future(service.estimate(*args)) for _ in range(2)]
+                await asyncio.sleep(0)
+                for task in list(service._tasks):
+                    task.cancel()
+                done, pending = await asyncio.wait(waiters, timeout=timeout)
+                return not pending and all(isinstance(task.exception(), Exception) and
+                                           not isinstance(task.exception(), asyncio.CancelledError)
+                                           for task in done)
+
+        return asyncio.run(run())
@@ -0,0 +1,250 @@
+import json
+import os
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Type
+import numpy as np
+from constants import MAX_BLOCK_SIZE
+from rngs.RNG import RNG
+from rngs.LCG import LCG
+from rngs.Xorshift32 import Xorshift
+from rngs.MersenneTwister import MersenneTwister
+from rngs.PCG32 import PCG32
+from rngs.Xoshiro128PlusPlus import Xoshiro128PlusPlus
+from rngs.SplitMix64 import SplitMix64
+from rngs.Philox import Philox
+from rngs.GeneratorPool import GeneratorPool
+from rngs.BitGeneratorAdapter import RNGBitGenerator
+from rngs.BlockPipeline import BlockPipeline
+
+
+class Backend:
+    """
+    Una forma alternativa de obtener la secuencia de un generador. Se arma
+    con cuatro operaciones sobre un "handle" (por defecto, el RNG mismo):
+
+    - make(rng_class, seed): crea el handle
+    - generate(handle, n): próximas n salidas crudas (np.ndarray)
+    - skip(handle, n): saltea n salidas
+    - reseed(handle, seed): vuelve a inicializar con otra seed
+    """
+
+    def __init__(self, name: str,
+                 generate: Callable[[object, int], np.ndarray],
+                 skip: Optional[Callable[[object, int], None]] = None,
+                 make: Optional[Callable[[Type[RNG], int], object]] = None,
+                 reseed: Optional[Callable[[object, int], None]] = None):
+        self.name = name
+        self.generate = generate
+        self.skip = skip or (lambda handle, n: StreamConformance.skip_blocks(generate, handle, n))
+        self.make = make or (lambda rng_class, seed: rng_class(seed))
+        self.reseed = reseed or (lambda handle, seed: handle.set_seed(seed))
+
+
+class StreamConformance:
+    """
+    Suite de conformidad de las secuencias: guarda vectores dorados de la
+    implementación escalar de referencia (next) y verifica que cada backend
+    alternativo (bloques vectorizados, saltos, copias, el adaptador de
+    NumPy) los reproduzca exactamente, reportando su throughput al lado.
+
+    Casos de cada generador:
+
+    - "first": las primeras FIRST salidas desde SEED
+    - "offset_k": WINDOW salidas a partir de la posición k, para k en OFFSETS
+    - "reseed": RESEED_WINDOW salidas tras consumir RESEED_AFTER salidas y
+      llamar a set_seed(RESEED)
+    """
+
+    GENERATORS = {
+        "LCG": LCG,
+        "Xorshift": Xorshift,
+        "MersenneTwister": MersenneTwister,
+        "PCG32": PCG32,
+        "Xoshiro128++": Xoshiro128PlusPlus,
+        "SplitMix64": SplitMix64,
+        "Philox": Philox,
+    }
+
+    SEED = 12345
+    RESEED = 2024
+    FIRST = 1000
+    OFFSETS = (624, 100_000, 1_000_003)
+    WINDOW = 16
+    RESEED_AFTER = 10
+    RESEED_WINDOW = 64
+    # Salidas por medición de throughput
+    THROUGHPUT_SAMPLES = 2 ** 18
+
+    GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_streams.json")
+
+    @staticmethod
+    def skip_blocks(generate: Callable[[object, int], np.ndarray], handle: object,
+                    Nsamples: int, block: int = MAX_BLOCK_SIZE) -> None:
+        """
+        Saltea Nsamples salidas generándolas de a bloques y descartándolas.
+        """
+        while Nsamples > 0:
+            step = min(block, Nsamples)
+            generate(handle, step)
+            Nsamples -= step
+
+    @staticmethod
+    def _odd_chunks(rng: RNG, Nsamples: int) -> np.ndarray:
+        # Bloques de tamaños 1, 2, 3, ... para probar los bordes entre bloques
+        parts, size = [], 1
+        while Nsamples > 0:
+            parts.append(rng.next_block(min(size, Nsamples)))
+            Nsamples -= len(parts[-1])
+            size += 1
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+
+    @staticmethod
+    def _scalar(rng: RNG, Nsamples: int) -> np.ndarray:
+        return np.array([rng.next() for _ in range(Nsamples)], dtype=np.uint64)
+
+    @staticmethod
+    def _skip_scalar(rng: RNG, Nsamples: int) -> None:
+        for _ in range(Nsamples):
+            rng.next()
+
+    @staticmethod
+    def backends() -> Dict[str, Backend]:
+        """
+        Backends registrados, por nombre. "scalar" es la referencia.
+        """
+        backends = [
+            Backend("scalar", StreamConformance._scalar, skip=StreamConformance._skip_scalar),
+            Backend("next_block", lambda rng, n: rng.next_block(n)),
+            Backend("odd_chunks", StreamConformance._odd_chunks,
+                    skip=lambda rng, n: StreamConformance.skip_blocks(
+                        lambda r, m: r.next_block(m), rng, n, block=997)),
+            Backend("advance", lambda rng, n: rng.next_block(n),
+                    skip=lambda rng, n: rng.advance(n)),
+            Backend("pool_clone", lambda rng, n: rng.next_block(n),
+                    make=lambda rng_class, seed: GeneratorPool.get(rng_class, seed)),
+            Backend("bitgenerator", lambda adapter, n: adapter.random_raw(n),
+                    make=lambda rng_class, seed: RNGBitGenerator(rng_class(seed)),
+                    reseed=lambda adapter, seed: adapter.rng.set_seed(seed)),
+        ]
+        return {backend.name: backend for backend in backends}
+
+    @staticmethod
+    def run_cases(rng_class: Type[RNG], backend: Backend) -> Dict[str, List[int]]:
+        """
+        Corre todos los casos de un generador con un backend.
+
+        Returns:
+            Dict[str, List[int]]: salidas de cada caso, por nombre del caso
+        """
+        cases = {}
+        handle = backend.make(rng_class, StreamConformance.SEED)
+        cases["first"] = backend.generate(handle, StreamConformance.FIRST)
+
+        for offset in StreamConformance.OFFSETS:
+            handle = backend.make(rng_class, StreamConformance.SEED)
+            backend.skip(handle, offset)
+            cases[f"offset_{offset}"] = backend.generate(handle, StreamConformance.WINDOW)
+
+        handle = backend.make(rng_class, StreamConformance.SEED)
+        backend.generate(handle, StreamConformance.RESEED_AFTER)
+        backend.reseed(handle, StreamConformance.RESEED)
+        cases["reseed"] = backend.generate(handle, StreamConformance.RESEED_WINDOW)
+        return {name: [int(value) for value in values] for name, values in cases.items()}
+
+    @staticmethod
+    def record(path: str = GOLDEN_PATH) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Genera los vectores dorados con la implementación escalar (next) de
+        cada generador y los guarda en path (JSON). Solo hace falta volver a
+        correrlo si cambia a propósito la secuencia de referencia; tarda unos
+        minutos porque recorre los offsets con next.
+
+        Returns:
+            Dict[str, Dict[str, List[int]]]: vectores dorados por generador y caso
+        """
+        scalar = StreamConformance.backends()["scalar"]
+        golden = {name: StreamConformance.run_cases(rng_class, scalar)
+                  for name, rng_class in StreamConformance.GENERATORS.items()}
+        with open(path, "w") as file:
+            json.dump(golden, file)
+        return golden
+
+    @staticmethod
+    def throughput(rng_class: Type[RNG], backend: Backend,
+                   Nsamples: int = THROUGHPUT_SAMPLES) -> float:
+        """
+        Salidas por segundo de un backend.
+        """
+        handle = backend.make(rng_class, StreamConformance.SEED)
+        start = perf_counter()
+        backend.generate(handle, Nsamples)
+        return Nsamples / (perf_counter() - start)
+
+    @staticmethod
+    def check(path: str = GOLDEN_PATH,
+              backends: Optional[List[str]] = None,
+              generators: Optional[List[str]] = None) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """
+        Verifica los backends contra los vectores dorados guardados en path.
+
+        Args:
+            path (str): archivo con los vectores dorados (ver record)
+            backends (Optional[List[str]]): backends a verificar. Por defecto,
+            todos menos "scalar" (la referencia, que es lenta para los offsets).
+            generators (Optional[List[str]]): generadores a verificar. Por
+            defecto, todos los del archivo.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, object]]]: por generador y backend,
+            si conforma ("ok"), los casos que difieren ("mismatches") y el
+            throughput en salidas por segundo ("throughput").
+        """
+        with open(path) as file:
+            golden = json.load(file)
+        available = StreamConformance.backends()
+        if backends is None:
+            backends = [name for name in available if name != "scalar"]
+        if generators is None:
+            generators = list(golden)
+
+        report = {}
+        for rng_name in generators:
+            rng_class = StreamConformance.GENERATORS[rng_name]
+            report[rng_name] = {}
+            for backend_name in backends:
+                backend = available[backend_name]
+                cases = StreamConformance.run_cases(rng_class, backend)
+                mismatches = [case for case, values in golden[rng_name].items()
+                              if cases.get(case) != values]
+                report[rng_name][backend_name] = {
+                    "ok": not mismatches,
+                    "mismatches": mismatches,
+                    "throughput": StreamConformance.throughput(rng_class, backend),
+                }
+        return report
+
+    @staticmethod
+    def check_pipeline(rng_class: Type[RNG], Nblocks: int = 8, size: int = 4096,
+                       precision: str = "float64",
+                       depth: int = BlockPipeline.DEFAULT_DEPTH) -> Dict[str, bool]:
+        """
+        Verifica que BlockPipeline entregue las mismas uniformes que
+        uniform_block y que reutilice su anillo: los bloques entregados son
+        siempre los mismos depth arreglos, sin asignar uno nuevo por bloque.
+
+        Returns:
+            Dict[str, bool]: si coinciden los valores ("values") y si los
+            bloques son los buffers del anillo ("reuses_ring")
+        """
+        expected = rng_class(StreamConformance.SEED).uniform_block(Nblocks * size, precision)
+        blocks, values = [], []
+        with BlockPipeline(rng_class(StreamConformance.SEED), [size] * Nblocks,
+                           precision=precision, depth=depth) as pipeline:
+            for block in pipeline:
+                blocks.append(block)
+                values.append(block.copy())
+        return {
+            "values": bool(np.array_equal(np.concatenate(values), expected)),
+            "reuses_ring": len({id(block) for block in blocks}) == depth and
+                           all(blocks[i] is blocks[i % depth] for i in range(Nblocks)),
+        }
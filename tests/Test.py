@@ -1,9 +1,7 @@
 import numpy as np
 from numpy.typing import ArrayLike
 from random import random
-from scipy.stats import kstest, uniform
 from tests.TestHelpers import TestHelpers
-from visuals.Printers import Printers
 
 
 class Test:
@@ -21,6 +19,10 @@ class Test:
             rng (RNG): objeto de la clase RNG para obtener muestras
             Nsim (int): numero de simulaciones para estimar el p-valor
         """
+        # Imports diferidos: scipy y los printers solo se cargan al usarse
+        from scipy.stats import uniform
+        from visuals.Printers import Printers
+
         # Ordeno las muestras
         samples = np.sort(samples)
 
@@ -62,6 +64,9 @@ class Test:
             rng_name (str): Nombre del generador
             samples (ArrayLike): Muestras
         """
+        from scipy.stats import kstest
+        from visuals.Printers import Printers
+
         scipy_results = kstest(samples, cdf="uniform")[:2]
         D = scipy_results[0]
         value_p = scipy_results[1]
@@ -34,6 +34,44 @@ class TestHelpers:
         candidate_D2 = G_values - Fe_minus
 
         # D = d
-        candidates_D = np.concatenate((candidate_D1, candidate_D2))
-        d = np.max(candidates_D)
-        return d
\ No newline at end of file
+        d = max(np.max(candidate_D1), np.max(candidate_D2))
+        return d
+
+    @staticmethod
+    def KS_statistic_rows(samples: np.ndarray) -> np.ndarray:
+        """
+        Estadístico de Kolmogorov-Smirnov contra la uniforme en [0, 1] para
+        cada fila de una matriz de muestras ordenadas. Usa que
+        u_(i) - (i-1)/n = 1/n - (i/n - u_(i)), así alcanza con una sola
+        diferencia por fila y sin concatenar los candidatos.
+
+        Args:
+            samples (np.ndarray): matriz (filas x n), cada fila ordenada
+
+        Returns:
+            np.ndarray: estadístico D de cada fila
+        """
+        Nsamples = samples.shape[-1]
+        diff = np.arange(1, Nsamples + 1) / Nsamples - samples
+        return np.maximum(np.max(diff, axis=-1), 1 / Nsamples - np.min(diff, axis=-1))
+
+    @staticmethod
+    def chi_square_rows(samples: np.ndarray, Nbins: int) -> np.ndarray:
+        """
+        Estadístico chi-cuadrado contra la uniforme en [0, 1] con Nbins
+        intervalos iguales, para cada fila de una matriz de muestras.
+
+        Args:
+            samples (np.ndarray): matriz (filas x n) de uniformes
+            Nbins (int): cantidad de intervalos
+
+        Returns:
+            np.ndarray: estadístico chi-cuadrado de cada fila
+        """
+        rows, Nsamples = samples.shape
+        bins = np.minimum((samples * Nbins).astype(np.int64), Nbins - 1)
+        # Desplazo cada fila a sus propios Nbins casilleros para un solo bincount
+        bins += np.arange(rows)[:, None] * Nbins
+        counts = np.bincount(bins.ravel(), minlength=rows * Nbins).reshape(rows, Nbins)
+        expected = Nsamples / Nbins
+        return np.sum((counts - expected) ** 2, axis=1) / expected
\ No newline at end of file
@@ -0,0 +1,157 @@
+import numpy as np
+from typing import Iterable, Tuple
+from numpy.typing import ArrayLike
+
+
+class TraceDecimator:
+    """
+    Reduce una traza (valores por iteración) a unos pocos miles de puntos
+    conservando sus extremos visuales: agrupa las posiciones en bins y de cada
+    bin guarda el mínimo y el máximo en el orden en que aparecen.
+
+    La traza puede recibirse de a bloques (update), sin conocer su largo total:
+    cuando la cantidad de bins supera Nbins, se fusionan de a pares y se duplica
+    su ancho. Con log_x los bins son de ancho constante en log2(posición + 1),
+    para que la traza se vea bien en un eje x logarítmico.
+    """
+
+    # Cantidad de bins de la traza reducida (hasta 2 puntos por bin)
+    DEFAULT_BINS = 2_000
+    # Largo a partir del cual Plotters reduce automáticamente una traza
+    THRESHOLD = 10_000
+    # Ancho inicial de los bins en escala log2 (≈ 1000 bins por octava)
+    LOG_INITIAL_WIDTH = 2.0 ** -10
+
+    def __init__(self, Nbins: int = DEFAULT_BINS, log_x: bool = False):
+        if Nbins < 1:
+            raise ValueError("Se necesita al menos 1 bin.")
+        self._Nbins = Nbins
+        self._log_x = log_x
+        self._width = self.LOG_INITIAL_WIDTH if log_x else 1.0
+        self._offset = 0
+        self._last = None
+        self._min_val = np.empty(0)
+        self._min_pos = np.empty(0, dtype=np.int64)
+        self._max_val = np.empty(0)
+        self._max_pos = np.empty(0, dtype=np.int64)
+
+    def _bin_ids(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Bin de cada posición (0-indexada) de la traza con el ancho actual.
+        """
+        coords = np.log2(positions + 1.0) if self._log_x else positions
+        return np.floor(coords / self._width).astype(np.int64)
+
+    def _grow(self, Nbins: int) -> None:
+        """
+        Agranda los arreglos de estado hasta Nbins bins vacíos.
+        """
+        extra = Nbins - len(self._min_val)
+        if extra <= 0:
+            return
+        self._min_val = np.concatenate((self._min_val, np.full(extra, np.inf)))
+        self._min_pos = np.concatenate((self._min_pos, np.full(extra, -1, dtype=np.int64)))
+        self._max_val = np.concatenate((self._max_val, np.full(extra, -np.inf)))
+        self._max_pos = np.concatenate((self._max_pos, np.full(extra, -1, dtype=np.int64)))
+
+    def _merge_pairs(self) -> None:
+        """
+        Fusiona los bins de a pares, duplicando el ancho de cada bin.
+        """
+        self._grow(len(self._min_val) + len(self._min_val) % 2)
+        min_val = self._min_val.reshape(-1, 2)
+        min_pos = self._min_pos.reshape(-1, 2)
+        max_val = self._max_val.reshape(-1, 2)
+        max_pos = self._max_pos.reshape(-1, 2)
+        rows = np.arange(len(min_val))
+        # En caso de empate se conserva el de la izquierda
+        pick_min = (min_val[:, 1] < min_val[:, 0]).astype(np.int64)
+        pick_max = (max_val[:, 1] > max_val[:, 0]).astype(np.int64)
+        self._min_val = min_val[rows, pick_min]
+        self._min_pos = min_pos[rows, pick_min]
+        self._max_val = max_val[rows, pick_max]
+        self._max_pos = max_pos[rows, pick_max]
+        self._width *= 2
+
+    def update(self, values: ArrayLike) -> None:
+        """
+        Agrega a la traza el siguiente bloque de valores.
+
+        Args:
+            values (ArrayLike): valores consecutivos de la traza
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values) == 0:
+            return
+        positions = self._offset + np.arange(len(values))
+        self._offset += len(values)
+        self._last = values[-1]
+
+        ids = self._bin_ids(positions)
+        while ids[-1] >= self._Nbins:
+            self._merge_pairs()
+            ids //= 2
+        self._grow(ids[-1] + 1)
+
+        # Las posiciones son crecientes: cada bin es un tramo contiguo del bloque
+        starts = np.flatnonzero(np.diff(ids)) + 1
+        starts = np.concatenate(([0], starts))
+        bins = ids[starts]
+        lengths = np.diff(np.append(starts, len(values)))
+
+        seg_min = np.minimum.reduceat(values, starts)
+        seg_max = np.maximum.reduceat(values, starts)
+        # Primera posición de cada tramo donde se alcanza el extremo
+        big = np.iinfo(np.int64).max
+        seg_min_pos = np.minimum.reduceat(
+            np.where(values == np.repeat(seg_min, lengths), positions, big), starts)
+        seg_max_pos = np.minimum.reduceat(
+            np.where(values == np.repeat(seg_max, lengths), positions, big), starts)
+
+        better_min = seg_min < self._min_val[bins]
+        self._min_val[bins[better_min]] = seg_min[better_min]
+        self._min_pos[bins[better_min]] = seg_min_pos[better_min]
+        better_max = seg_max > self._max_val[bins]
+        self._max_val[bins[better_max]] = seg_max[better_max]
+        self._max_pos[bins[better_max]] = seg_max_pos[better_max]
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Devuelve la traza reducida. Incluye siempre el último valor, que es la
+        estimación final.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: posiciones (0-indexadas) y valores
+            de los puntos conservados, ordenados por posición.
+        """
+        used = self._min_pos >= 0
+        positions = np.concatenate((self._min_pos[used], self._max_pos[used]))
+        values = np.concatenate((self._min_val[used], self._max_val[used]))
+        if self._last is not None:
+            positions = np.append(positions, self._offset - 1)
+            values = np.append(values, self._last)
+        positions, index = np.unique(positions, return_index=True)
+        return positions, values[index]
+
+    @staticmethod
+    def decimate(trace: Iterable, Nbins: int = DEFAULT_BINS,
+                 log_x: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce una traza completa o recibida por bloques.
+
+        Args:
+            trace (Iterable): lista/arreglo de valores, o iterable de bloques
+            (arreglos) de valores consecutivos.
+            Nbins (int): cantidad máxima de bins
+            log_x (bool): si los bins son equiespaciados en escala logarítmica
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: posiciones y valores de la traza reducida
+        """
+        decimator = TraceDecimator(Nbins=Nbins, log_x=log_x)
+        if isinstance(trace, (list, tuple, np.ndarray)):
+            decimator.update(trace)
+        else:
+            for chunk in trace:
+                decimator.update(chunk)
+        return decimator.result()
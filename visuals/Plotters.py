@@ -2,11 +2,11 @@ from random import choice
 from MonteCarlo import MonteCarlo
 import numpy as np
 from Utils import Utils
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from rngs.RNG import RNG
+from visuals.Downsampling import TraceDecimator
 import matplotlib.pyplot as plt
 import seaborn as sns
-from constants import INTEGRAL_VAL_D1
 from matplotlib.ticker import FuncFormatter
 
 class Plotters:
@@ -14,12 +14,18 @@ class Plotters:
     Clase con funciones para graficar resultados
     """
 
+    # Máximo de muestras que gaussian_estimation_3D dibuja como barras individuales
+    BAR3D_MAX_SAMPLES = 2_000
+    # Celdas por eje de la grilla agregada de gaussian_estimation_3D
+    BAR3D_DEFAULT_BINS = 30
+
     @staticmethod
     def _barplot_common(dim_res: Dict[int, Dict[str, float]],
                         ylabel: str,
                         title_prefix: str,
                         bar_label_formatter: Optional[Callable[[float], str]] = None,
-                        yaxis_formatter: Optional[Callable[[float, int], str]] = None) -> None:
+                        yaxis_formatter: Optional[Callable[[float, int], str]] = None,
+                        dim_ci: Optional[Dict[int, Dict[str, Tuple[float, float]]]] = None) -> None:
         """
         Función general para hacer graficas de barras de resultados asociados a RNGs
         agrupados por dimensión.
@@ -33,6 +39,9 @@ class Plotters:
             bar_label_formatter (Callable[[float], str]): agrega formato los datos de
             cada barra.
             yaxis_formatter (Callable[[float, int], str]): agrega formato al eje 'y'
+            dim_ci (dict): Diccionario con las mismas claves que dim_res y
+            valor el intervalo de confianza (low, high) de cada generador, que
+            se dibuja como barra de error. Opcional.
         """
         sns.set_theme()
         palette = sns.color_palette("rocket")
@@ -43,14 +52,20 @@ class Plotters:
 
         for ax, (label, result) in zip(axes, dim_res.items()):
             labels = list(result.keys())
-            values = list(result.values())
+            values = np.array(list(result.values()))
             color = choice(palette)
 
             bars = sns.barplot(x=labels, y=values, ax=ax, color=color)
             ax.set_title(f"DIMENSIONES {label}")
             ax.set_xlabel("Generador")
             ax.set_ylabel(ylabel)
-            ax.set_ylim(0, max(values) * 1.2)
+            top = max(values)
+            if dim_ci is not None:
+                intervals = np.array([dim_ci[label][name] for name in labels])
+                # Un intervalo de percentiles puede no contener al valor puntual
+                yerr = np.clip([values - intervals[:, 0], intervals[:, 1] - values], 0, None)
+                top = max(top, intervals[:, 1].max())
+            ax.set_ylim(0, top * 1.2)
 
             # Formateo del eje Y
             if yaxis_formatter:
@@ -65,6 +80,11 @@ class Plotters:
                 for container in bars.containers:
                     bars.bar_label(container, fmt='%.6f', label_type='edge', padding=3)
 
+            # Intervalos de confianza como barras de error
+            if dim_ci is not None:
+                ax.errorbar(range(len(values)), values, yerr=yerr,
+                            fmt="none", ecolor="black", capsize=4)
+
         fig.suptitle(f"{title_prefix}", fontsize=16)
         plt.tight_layout()
         plt.show()
@@ -86,7 +106,8 @@ class Plotters:
                     title_prefix="Comparación de tiempos")
 
     @staticmethod
-    def variance_bars(dim_res: Dict[int, Dict[str, float]]) -> None:
+    def variance_bars(dim_res: Dict[int, Dict[str, float]],
+                      dim_ci: Optional[Dict[int, Dict[str, Tuple[float, float]]]] = None) -> None:
         """ 
         Grafica barras de la varianza de estimaciones de integral con 
         Monte Carlo con varios RNGs agrupados por dimensión.
@@ -95,14 +116,18 @@ class Plotters:
             dim_res (dict): Diccionario con clave dimensión (int), 
             de valor un dict con clave generador (str) y con valor varianza
             entre estimaciones de Monte Carlo (float). 
+            dim_ci (dict): intervalos de confianza con la misma forma (ej:
+            "variance_CI" de Compare.bootstrap_stats), como barras de error.
         """
         Plotters._barplot_common(dim_res,
                     ylabel="Varianza",
                     title_prefix=r"Comparación de varianzas($\mathcal{{S}}^2$)",
                     yaxis_formatter=lambda x, _: f'{x:.1e}',
-                    bar_label_formatter=lambda x: f'{x:.1e}')
+                    bar_label_formatter=lambda x: f'{x:.1e}',
+                    dim_ci=dim_ci)
 
-    def ecm_bars(dim_res: Dict[int, Dict[str, float]]) -> None:
+    def ecm_bars(dim_res: Dict[int, Dict[str, float]],
+                 dim_ci: Optional[Dict[int, Dict[str, Tuple[float, float]]]] = None) -> None:
         """ 
         Grafica barras del ECM de estimaciones de integral con Monte Carlo con 
         varios RNGs agrupados por dimensión.
@@ -111,12 +136,15 @@ class Plotters:
             dim_res (dict): Diccionario con clave dimensión (int), 
             de valor un dict con clave generador (str) y con valor ECM entre
             estimaciones de Monte Carlo (float).
+            dim_ci (dict): intervalos de confianza con la misma forma (ej:
+            "ECM_CI" de Compare.bootstrap_stats), como barras de error.
         """
         Plotters._barplot_common(dim_res, 
                     ylabel=r"$\mathit{{ECM}}$", 
                     title_prefix=r"Comparación de error cuadratico medio ($\mathit{{ECM}}$)",
                     yaxis_formatter=lambda x, _: f'{x:.1e}',
-                    bar_label_formatter=lambda x: f'{x:.1e}')
+                    bar_label_formatter=lambda x: f'{x:.1e}',
+                    dim_ci=dim_ci)
 
     @staticmethod    
     def generators_3D(generators: List[RNG], Nsamples: int) -> None:
@@ -145,27 +173,25 @@ class Plotters:
         plt.tight_layout()
         plt.show()
 
-    def gaussian_estimation_3D(Nsamples: int, rng: RNG) -> None:
+    def gaussian_estimation_3D(Nsamples: int, rng: RNG, bins: Optional[int] = None) -> None:
         """
         Ploteo 3D de la estimación con Monte Carlo de la integral
         de una función gaussiana de de dos variables en un 
         cubo [0,1)x[0,1).
 
+        Con muchas muestras se agregan en una grilla de bins x bins celdas,
+        con altura el promedio de g en cada celda, y se dibujan como una sola
+        malla de barras, así el costo de graficar no depende de Nsamples.
+
         Args:
             Nsamples (int): numero de muestras uniformes por iteracion
             rng (RNG): objeto de la clase RNG para obtener uniformes
+            bins (int, optional): celdas por eje de la grilla. Por defecto se
+            dibuja una barra por muestra hasta Plotters.BAR3D_MAX_SAMPLES
+            muestras, y una grilla de Plotters.BAR3D_DEFAULT_BINS por encima.
         """
-        samples = MonteCarlo.get_parcials_method_Nvars(Nsamples=Nsamples, 
-                                g=Utils.gaussian_func_multivar, 
-                                rng=rng, 
-                                Nvars=2)
-        samples_array = np.array(samples, dtype=object)
-        coords = np.stack(samples_array[:, 0])
-        z_samples = np.array(samples_array[:, 1], dtype=float)
-        x_samples = coords[:, 0]
-        y_samples = coords[:, 1]
-
-        integral_aprox = np.mean(z_samples)
+        if bins is None and Nsamples > Plotters.BAR3D_MAX_SAMPLES:
+            bins = Plotters.BAR3D_DEFAULT_BINS
 
         X, Y = np.meshgrid(np.linspace(0, 1, 100), np.linspace(0, 1, 100))
         Z = np.exp(-X**2-Y**2) 
@@ -174,26 +200,70 @@ class Plotters:
         ax = fig.add_subplot(111, projection='3d')
         ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.4)
 
-        dx = dy = 1 / len(samples) ** 0.7
-        for x, y, z in zip(x_samples, y_samples, z_samples):
-            ax.bar3d(x, y, 0, dx, dy, z, color='green', alpha=0.3)
+        if bins is None:
+            samples = MonteCarlo.get_parcials_method_Nvars(Nsamples=Nsamples, 
+                                    g=Utils.gaussian_func_multivar, 
+                                    rng=rng, 
+                                    Nvars=2)
+            samples_array = np.array(samples, dtype=object)
+            coords = np.stack(samples_array[:, 0])
+            z_samples = np.array(samples_array[:, 1], dtype=float)
+            x_samples = coords[:, 0]
+            y_samples = coords[:, 1]
+
+            integral_aprox = np.mean(z_samples)
+
+            dx = dy = 1 / len(samples) ** 0.7
+            for x, y, z in zip(x_samples, y_samples, z_samples):
+                ax.bar3d(x, y, 0, dx, dy, z, color='green', alpha=0.3)
+        else:
+            edges = np.linspace(0, 1, bins + 1)
+            sums = np.zeros((bins, bins))
+            counts = np.zeros((bins, bins))
+            for uniforms, g_values in MonteCarlo.get_parcials_method_Nvars_chunks(
+                                        Nsamples=Nsamples,
+                                        g=Utils.gaussian_func_multivar,
+                                        rng=rng,
+                                        Nvars=2):
+                sums += np.histogram2d(uniforms[:, 0], uniforms[:, 1],
+                                       bins=[edges, edges], weights=g_values)[0]
+                counts += np.histogram2d(uniforms[:, 0], uniforms[:, 1],
+                                         bins=[edges, edges])[0]
+
+            integral_aprox = sums.sum() / Nsamples
+
+            # Una sola colección de barras con las celdas que tienen muestras
+            filled = counts > 0
+            x_cells, y_cells = np.meshgrid(edges[:-1], edges[:-1], indexing="ij")
+            width = 1 / bins
+            ax.bar3d(x_cells[filled], y_cells[filled], 0, width, width,
+                     sums[filled] / counts[filled], color='green', alpha=0.3)
 
         ax.view_init(elev=30, azim=60)
         ax.set_title(rf"Estimación de Monte Carlo para $\mathcal{{I}}_{{2}}$ ≈ {integral_aprox:.4f}"
                     f"\nRNG: {rng.name()}")
         plt.show()
 
-    def gaussian_estimations_Ndim(dim_res: Dict[int, Dict[str, List[float]]]) -> None:
+    def gaussian_estimations_Ndim(dim_res: Dict[int, Dict[str, List[float]]],
+                                  log_x: bool = False,
+                                  max_bins: int = TraceDecimator.DEFAULT_BINS) -> None:
         """
         Grafica para mostrar como la estimación de Monte Carlo de la
         función gaussiana en un hipercubo de dimensión d estima de mejor
         manera con mayor num de muestras.
 
+        Las trazas con más de TraceDecimator.THRESHOLD puntos, o que llegan
+        como iteradores de bloques, se reducen a lo sumo a 2 * max_bins puntos
+        conservando sus mínimos y máximos.
+
         Args:
             dim_res (dict): Diccionario con clave dimensión (int), 
             de valor un dict con clave generador (str) y con valor la lista 
             de integrales por iteración del método de Monte Carlo para la función
-            gaussiana en un hipercubo de dim d (list[float]).
+            gaussiana en un hipercubo de dim d (list[float]), o un iterador de
+            bloques (np.ndarray) de esas integrales.
+            log_x (bool): si es True, usa escala logarítmica en el eje x.
+            max_bins (int): cantidad de bins de las trazas reducidas.
         """
 
         rng_names = list(next(iter(dim_res.values())).keys())
@@ -208,14 +278,26 @@ class Plotters:
         for ax, rng_name in zip(axes, rng_names):
             for d in dims:
                 estimations = dim_res[d][rng_name]
-                exact_value = INTEGRAL_VAL_D1 ** d
+                exact_value = Utils.gaussian_integral(d)
                 color = color_map[d]
 
-                ax.plot(estimations, label=rf"$d={d}$", color=color)
+                # La estimación en la posición i usa i + 1 muestras (así el
+                # primer punto no se pierde con log_x)
+                if isinstance(estimations, (list, np.ndarray)) and \
+                        len(estimations) <= TraceDecimator.THRESHOLD:
+                    x_values = np.arange(1, len(estimations) + 1)
+                else:
+                    positions, estimations = TraceDecimator.decimate(
+                        estimations, Nbins=max_bins, log_x=log_x)
+                    x_values = positions + 1
+
+                ax.plot(x_values, estimations, label=rf"$d={d}$", color=color)
                 ax.axhline(exact_value, linestyle="--", color=color, alpha=0.8, linewidth=1.2)
 
             ax.set_title(f"RNG: {rng_name}")
             ax.set_xlabel("Número de muestras")
+            if log_x:
+                ax.set_xscale("log")
             ax.grid(True)
             ax.legend(title="Dimensión")
 
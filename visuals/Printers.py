@@ -1,5 +1,7 @@
-from constants import INTEGRAL_VAL_D2, INTEGRAL_VAL_D5, INTEGRAL_VAL_D10
-from typing import Tuple, Dict
+from math import log
+import numpy as np
+from constants import INTEGRAL_VAL_D1
+from typing import Tuple, Dict, Optional
 
 class Printers:
     """
@@ -7,7 +9,8 @@ class Printers:
     """
 
     @staticmethod
-    def print_estimations_table(rng_estimations, real_value: float) -> None:
+    def print_estimations_table(rng_estimations, real_value: float,
+                                d: Optional[int] = None) -> None:
         """
         Imprime en una tabla las estimaciones hechas por los RNGs, 
         incluyendo el error absoluto y el error relativo.
@@ -15,14 +18,20 @@ class Printers:
         Args:
             rng_estimations (dict): Estimaciones hechas por los RNGs.
             real_value (float): Valor real de la integral.
+            d (Optional[int]): Dimensión, para la etiqueta. Si no se da, se
+            deduce de real_value = INTEGRAL_VAL_D1 ** d, lo que solo es
+            posible mientras real_value no se redondee a 0 (d < ~2500).
+
+        Raises:
+            ValueError: Si no se da d y real_value no es positivo
         """
         # Determinar etiqueta por dimensión
-        if real_value == INTEGRAL_VAL_D2:
-            label = "2 DIMENSIONES"
-        elif real_value == INTEGRAL_VAL_D5:
-            label = "5 DIMENSIONES"
-        else:
-            label = "10 DIMENSIONES"
+        if d is None:
+            if not real_value > 0:
+                raise ValueError("No se puede deducir la dimensión de real_value = "
+                                 f"{real_value}; pasar d explícitamente")
+            d = round(log(real_value) / log(INTEGRAL_VAL_D1))
+        label = f"{d} DIMENSIONES"
 
         total_width = 96
         padding = (total_width - len(label)) // 2
@@ -141,6 +150,95 @@ class Printers:
                 ))
             print("-" * total_width)
 
+    @staticmethod
+    def print_spectral_table(spectral_results: Dict[int, Dict[str, float]], a: int, m: int) -> None:
+        """
+        Imprime la tabla del test espectral de un LCG por dimensión.
+
+        Args:
+            spectral_results (Dict[int, Dict[str, float]]): resultados de
+            SpectralTest.figures_of_merit, con clave la dimensión.
+            a (int): multiplicador del LCG
+            m (int): módulo del LCG
+        """
+        total_width = 76
+        title = f"TEST ESPECTRAL - a = {a}, m = {m}"
+        padding = (total_width - len(title)) // 2
+        print("-" * padding + title + "-" * (total_width - padding - len(title)))
+
+        print("| {:^10} | {:^14} | {:^12} | {:^12} | {:^12} |".format(
+            "Dimensión", "ν_t", "S_t", "μ_t", "Hiperplanos"
+        ))
+        print("|" + "-" * 12 + "|" + "-" * 16 + "|" + "-" * 14 + "|" + "-" * 14 + "|" + "-" * 14 + "|")
+
+        for t, result in spectral_results.items():
+            print("| {:^10} | {:^14.4f} | {:^12.4f} | {:^12.4f} | {:^12} |".format(
+                t, result["nu"], result["merit"], result["mu"], result["planes"]
+            ))
+
+        print("-" * total_width + "\n")
+
+    @staticmethod
+    def print_seed_scan(rng: str, scan_results: Dict[str, object], alpha: float = 0.05) -> None:
+        """
+        Imprime el resumen de un barrido de semillas (ver SeedScanner.scan):
+        rechazos por test, histograma de p-valores y peores semillas.
+
+        Args:
+            rng (str): Nombre del RNG
+            scan_results (Dict[str, object]): resultados de SeedScanner.scan
+            alpha (float): Nivel de rechazo de cada test
+        """
+        total_width = 70
+        title = f"BARRIDO DE SEMILLAS - {rng}"
+        padding = (total_width - len(title)) // 2
+        print("-" * padding + title + "-" * (total_width - padding - len(title)))
+
+        Nseeds = len(scan_results["seeds"])
+        for test, label in (("ks", "Kolmogorov-Smirnov"), ("chi2", "Chi-cuadrado")):
+            rejected = int(np.sum(scan_results[f"{test}_pvalue"] <= alpha))
+            print(f"{label}: {rejected}/{Nseeds} semillas rechazadas con alpha = {alpha} "
+                  f"(se esperan ~{alpha * Nseeds:.0f})")
+            print(f"\t histograma de p-valores: {scan_results[f'{test}_histogram']}")
+            print(f"\t p-valor de uniformidad de los p-valores: "
+                  f"{round(scan_results[f'{test}_uniformity_pvalue'], 4)}")
+
+        print("Peores semillas:")
+        print("| {:^20} | {:^15} | {:^15} |".format("Semilla", "p-valor KS", "p-valor Chi2"))
+        for worst in scan_results["worst_seeds"]:
+            print("| {:^20} | {:^15.6f} | {:^15.6f} |".format(
+                worst["seed"], worst["ks_pvalue"], worst["chi2_pvalue"]))
+        print("-" * total_width + "\n")
+
+    @staticmethod
+    def print_conformance_table(report: Dict[str, Dict[str, Dict[str, object]]]) -> None:
+        """
+        Imprime la tabla de conformidad de los backends contra los vectores
+        dorados, con su throughput (ver StreamConformance.check).
+
+        Args:
+            report (Dict[str, Dict[str, Dict[str, object]]]): resultados de
+            StreamConformance.check, por generador y backend.
+        """
+        total_width = 84
+        title = "CONFORMIDAD DE SECUENCIAS"
+        padding = (total_width - len(title)) // 2
+        print("-" * padding + title + "-" * (total_width - padding - len(title)))
+
+        print("| {:^18} | {:^14} | {:^8} | {:^16} | {:^12} |".format(
+            "Generador", "Backend", "Conforma", "Salidas/s", "Difieren"
+        ))
+        print("|" + "-" * 20 + "|" + "-" * 16 + "|" + "-" * 10 + "|" + "-" * 18 + "|" + "-" * 14 + "|")
+
+        for rng_name, backends in report.items():
+            for i, (backend, result) in enumerate(backends.items()):
+                print("| {:^18} | {:^14} | {:^8} | {:^16.3e} | {:^12} |".format(
+                    rng_name if i == 0 else "", backend, "sí" if result["ok"] else "NO",
+                    result["throughput"], ", ".join(result["mismatches"]) or "-"
+                ))
+
+        print("-" * total_width + "\n")
+
     @staticmethod
     def print_testKS_results(rng: str, test_results: Tuple[float, float], alpha: float) -> None:
         """